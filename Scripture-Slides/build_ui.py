@@ -0,0 +1,58 @@
+"""Compile the Qt Designer .ui files into Python modules.
+
+Run after editing any .ui file:
+
+    python Scripture-Slides/build_ui.py
+
+The generated ui_*.py modules let the app skip parsing XML at startup; see
+ui_loader.py for how they are picked up. Each records the SHA1 of the .ui
+file it was compiled from, and loads its icons through the "assets:" search
+path, so it works from any working directory.
+"""
+import hashlib
+import io
+import os
+import re
+
+UI_DIR = os.path.dirname(os.path.abspath(__file__))
+UI_FILES = ("ScriptureSlides.ui", "SlideShowWindow.ui", "AddVerse.ui")
+ASSETS_PREFIX = "assets"  # Qt search path for the files in ./assets
+
+
+def compiled_module_name(ui_file):
+    """Return the module name generated for `ui_file`, e.g. "ui_addverse"."""
+    return "ui_" + os.path.splitext(ui_file)[0].lower()
+
+
+def ui_digest(ui_path):
+    """Return the SHA1 of a .ui file, as recorded in the module compiled from it.
+
+    Line endings are normalized first, so a checkout that converts them
+    still matches.
+    """
+    with open(ui_path, "rb") as ui_file:
+        return hashlib.sha1(ui_file.read().replace(b"\r\n", b"\n")).hexdigest()
+
+
+def build(ui_files=UI_FILES):
+    from PyQt5.uic import compileUi
+
+    for ui_file in ui_files:
+        ui_path = os.path.join(UI_DIR, ui_file)
+        target = os.path.join(UI_DIR, compiled_module_name(ui_file) + ".py")
+        code = io.StringIO()
+        # Compiled from a copy, so icon paths are kept as the .ui file has them:
+        # relative to this folder
+        with open(ui_path, encoding="utf-8") as ui_source:
+            compileUi(io.StringIO(ui_source.read()), code)
+        source = re.sub(r"reading ui file '.*?'", f"reading ui file '{ui_file}'",
+                        code.getvalue(), count=1)
+        source = source.replace('QPixmap("assets/', f'QPixmap("{ASSETS_PREFIX}:')
+        source += f"\n\nUI_SHA1 = \"{ui_digest(ui_path)}\"\n"
+        with open(target, "w", encoding="utf-8") as py_file:
+            py_file.write(source)
+        print(f"Compiled {ui_file} -> {os.path.basename(target)}")
+
+
+if __name__ == "__main__":
+    build()
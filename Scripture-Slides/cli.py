@@ -0,0 +1,160 @@
+"""Build Scripture Slides decks from service-order files without the GUI.
+
+A service order is a JSON or YAML file such as:
+
+    output: sunday.pptx
+    translation: KJV
+    theme: Night
+    background: backgrounds/blue.jpg
+    font: {name: Arial, size: 40, bold: true, color: FFFFFF}
+    split: true
+    slides:
+      - text: Welcome
+      - verses: John 3:16-18; Rom 8:28
+      - text: Benediction
+        background: backgrounds/gold.jpg
+
+`theme` names a built-in theme (Plain, Night, Parchment) or a theme preset
+file; the order's `background` and `font` adjust it. The theme is written once
+into the deck's slide layout, so only slides with a `background` or `font` of
+their own carry one.
+
+Relative paths are resolved against the order file's folder. Pass a folder to
+build every order in it in parallel.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+ORDER_EXTENSIONS = (".json", ".yaml", ".yml")
+
+
+def load_order(path):
+    """Read a service order from a JSON or YAML file."""
+    with open(path, encoding="utf-8") as order_file:
+        if path.lower().endswith(".json"):
+            return json.load(order_file)
+        try:
+            import yaml
+        except ImportError:
+            raise SystemExit(f"{path}: reading YAML orders needs PyYAML (pip install pyyaml)")
+        return yaml.safe_load(order_file)
+
+
+def _style_from(font, base=None):
+    from deck import TextStyle
+
+    base = base or TextStyle()
+    font = font or {}
+    color = font.get("color", base.color)
+    if isinstance(color, str):
+        color = tuple(bytes.fromhex(color.lstrip("#")))
+    return TextStyle(font.get("name", base.name), font.get("size", base.size),
+                     font.get("bold", base.bold), color)
+
+
+def _theme_from(order, resolve):
+    from theme import BUILTIN_THEMES, DEFAULT_THEME, Theme, load_theme
+
+    theme = DEFAULT_THEME
+    name = order.get("theme")
+    if name:
+        builtin = {known.name.lower(): known for known in BUILTIN_THEMES}
+        theme = builtin.get(str(name).lower()) or load_theme(resolve(name))
+    if order.get("background") or order.get("font"):
+        theme = Theme(theme.name, resolve(order.get("background")) or theme.background,
+                      theme.color, _style_from(order.get("font"), theme.style), theme.box)
+    return theme
+
+
+def build_order(order_path, output=None, db_path=None, pdf_path=None, png_folder=None):
+    """Build the deck described by `order_path` and return the path written.
+
+    With `pdf_path` or `png_folder`, the slides are also exported there.
+    """
+    from deck import Deck
+    from verse_store import DEFAULT_DB_PATH, VerseStore
+
+    order = load_order(order_path)
+    base_dir = os.path.dirname(os.path.abspath(order_path))
+
+    def resolve(path):
+        return path if not path or os.path.isabs(path) else os.path.join(base_dir, path)
+
+    output = output or resolve(order.get("output")) or os.path.splitext(order_path)[0] + ".pptx"
+    translation = order.get("translation", "KJV")
+    split = order.get("split", True)
+    theme = _theme_from(order, resolve)
+
+    deck = Deck(theme=theme)
+    verse_store = None
+    for entry in order.get("slides", []):
+        background = resolve(entry.get("background"))
+        slide_style = _style_from(entry["font"], theme.style) if entry.get("font") else None
+        if "verses" in entry:
+            if verse_store is None:
+                verse_store = VerseStore(db_path or order.get("verse_db") or DEFAULT_DB_PATH)
+            deck.add_passages(verse_store, entry["verses"], entry.get("translation", translation),
+                              slide_style, split=entry.get("split", split), background=background)
+        else:
+            slide = deck.add_slide()
+            if background:
+                deck.set_background(slide, background)
+            if entry.get("text"):
+                deck.add_text(slide, entry["text"], slide_style)
+    if verse_store is not None:
+        verse_store.close()
+
+    deck.save(output)
+    if pdf_path or png_folder:
+        from exporter import export_pages, pages_from
+
+        export_pages(pages_from(deck.document), png_folder, pdf_path)
+    return output
+
+
+def find_orders(folder):
+    """Return the service-order files directly inside `folder`."""
+    return sorted(os.path.join(folder, name) for name in os.listdir(folder)
+                  if name.lower().endswith(ORDER_EXTENSIONS))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build .pptx decks from service-order files.")
+    parser.add_argument("order", help="service-order file (.json/.yaml) or a folder of them")
+    parser.add_argument("-o", "--output", help="output .pptx (single order only)")
+    parser.add_argument("--pdf", help="also export the slides to this PDF (single order only)")
+    parser.add_argument("--png", help="also export the slides as PNGs into this folder "
+                                      "(single order only)")
+    parser.add_argument("--db", help="verse store path")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="parallel processes when building a folder")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    if not os.path.isdir(args.order):
+        output = build_order(args.order, args.output, args.db, args.pdf, args.png)
+        print(f"Presentation saved at {output}")
+        return 0
+
+    orders = find_orders(args.order)
+    failures = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {executor.submit(build_order, path, None, args.db): path for path in orders}
+        for future in as_completed(futures):
+            try:
+                print(f"Presentation saved at {future.result()}")
+            except Exception as error:
+                failures += 1
+                print(f"{futures[future]}: {error}", file=sys.stderr)
+    print(f"Built {len(orders) - failures} of {len(orders)} decks in {time.perf_counter() - start:.2f}s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()  # builds and exports run on process pools
+    sys.exit(main())
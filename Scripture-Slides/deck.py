@@ -0,0 +1,415 @@
+import hashlib
+import os
+
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.enum.dml import MSO_COLOR_TYPE
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.enum.text import MSO_AUTO_SIZE
+from pptx.util import Inches, Pt
+
+from document import Document, ImageRef, TextRun
+from image_cache import add_picture, default_cache, image_part_for
+from instrumentation import span
+from lazy_package import open_presentation
+from references import format_verses, paginate, parse_references, verse_text
+from slide_manager import SlideManager
+from text_layout import SLIDE_TEXT_BOX, TextStyle, layout_text, text_fits
+from theme import THEME_BODY_IDX, is_theme_layout, read_theme_layout, write_theme_layout
+
+SLIDE_WIDTH = 20  # inches
+SLIDE_HEIGHT = 11.25  # inches
+BLANK_LAYOUT = 6
+
+# Pictures of opened decks are copied here, named by SHA1, when a slide is read
+PICTURE_FOLDER = "./slide_previews/pictures/"
+
+
+class Deck:
+    """GUI-free presentation builder shared by the desktop app and the command line.
+
+    Wraps a python-pptx `Presentation` with the slide size, blank layout,
+    shared background pictures and verse text boxes the app uses.
+
+    Changes made through a Deck are tracked: `revision` counts them and
+    `dirty_parts` collects the package parts they touched, so an incremental
+    save only re-serializes those. Code that edits slide XML directly should
+    call `mark_dirty` itself.
+
+    `document` mirrors the slides as a `document.Document`, whose change
+    events tell the GUI which slides to refresh.
+
+    `load` opens an existing .pptx lazily: the slide list is available at
+    once, and a slide is parsed only when `load_slide` or an edit needs it.
+
+    With a `theme` (see theme.py), text added without a style of its own goes
+    into the theme's text box and slides without a background show the
+    theme's; `apply_theme` switches themes by rewriting one layout.
+    """
+
+    def __init__(self, width=SLIDE_WIDTH, height=SLIDE_HEIGHT, theme=None):
+        self.prs = Presentation()
+        self.prs.slide_width = Inches(width)
+        self.prs.slide_height = Inches(height)
+        self.source = None
+        self.picture_folder = PICTURE_FOLDER
+        self.revision = 0
+        self.dirty_parts = set()
+        self.document = Document()
+        self.slides = SlideManager(self.prs, changed=self.mark_dirty, document=self.document)
+        self.theme = None
+        self._text_keys = {}  # slide ID -> theme text key its theme text was laid out for
+        self._file_text_key = None  # the same, for slides of an opened deck
+        if theme is not None:
+            self.apply_theme(theme)
+
+    @classmethod
+    def open(cls, path):
+        """Return a deck for the .pptx at `path`; see `load`."""
+        deck = cls()
+        deck.load(path)
+        return deck
+
+    def load(self, path):
+        """Replace the slides with those of the .pptx at `path`.
+
+        Only the package structure and slide list are read here. Slide XML
+        is parsed and pictures are read on first use (see lazy_package.py),
+        so even a very large deck opens at once.
+        """
+        prs, source = open_presentation(path)
+        self.close()
+        self.prs, self.source = prs, source
+        self.slides = SlideManager(prs, changed=self.mark_dirty, document=self.document)
+        self.dirty_parts.clear()
+        self.revision += 1
+        self.theme = read_theme_layout(self.blank_layout(),
+                                       lambda image_part: self._picture_ref(image_part).path)
+        self._text_keys.clear()
+        self._file_text_key = self.theme.text_key() if self.theme is not None else None
+        self.document.reset(self.slides.slide_ids())
+        self.document.set_theme(self.theme, self._theme_background())
+
+    def close(self):
+        """Release the file an opened deck reads from."""
+        if self.source is not None:
+            self.source.close()
+
+    def record(self, slide_id):
+        """Return the document record of `slide_id`, reading the slide first if needed."""
+        self.load_slide(slide_id)
+        return self.document.get(slide_id)
+
+    def load_slide(self, slide_id):
+        """Read the background picture and text of a not yet loaded slide."""
+        record = self.document.get(slide_id)
+        if record is None or record.loaded:
+            return
+        slide = self.slides.slide(slide_id)
+        themed = self._uses_theme(slide)
+        background = None
+        rIds = slide._element.cSld.xpath("./p:bg/p:bgPr/a:blipFill/a:blip/@r:embed")
+        texts = []
+        for shape in slide.shapes:
+            if shape.shape_type == MSO_SHAPE_TYPE.PICTURE and not rIds:
+                rIds = [shape._element.blip_rId]
+            elif shape.has_text_frame and shape.text_frame.text.strip():
+                texts.append(_text_run(shape.text_frame,
+                                       themed and _is_theme_placeholder(shape)))
+        if rIds and rIds[0]:  # a linked picture has no embedded part
+            background = self._picture_ref(slide.part.related_part(rIds[0]))
+        self.document.load_slide(slide_id, background, texts, themed)
+
+    def load_all(self):
+        """Read every slide not loaded yet, e.g. before exporting."""
+        for record in list(self.document):
+            if not record.loaded:
+                self.load_slide(record.slide_id)
+
+    def _picture_ref(self, image_part):
+        blob = image_part.blob
+        digest = hashlib.sha1(blob).hexdigest()
+        path = os.path.join(self.picture_folder, f"{digest}.{image_part.ext}")
+        if not os.path.exists(path):
+            os.makedirs(self.picture_folder, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as picture_file:
+                picture_file.write(blob)
+            os.replace(tmp_path, path)
+        return ImageRef(digest, path)
+
+    def blank_layout(self):
+        """The layout new slides use and the theme is written into.
+
+        Opened decks may not have the default one.
+        """
+        layouts = self.prs.slide_layouts
+        for layout in layouts:
+            if is_theme_layout(layout):
+                return layout
+        for layout in layouts:
+            if layout.name == "Blank":
+                return layout
+        return layouts[min(BLANK_LAYOUT, len(layouts) - 1)]
+
+    def apply_theme(self, theme):
+        """Give every slide on the blank layout the look of `theme`; None removes it.
+
+        The theme is written into the layout once, so only that part changes
+        however many slides there are. Slide text in the theme's text box is
+        broken into lines again for a new font or box when the deck is saved
+        (see `reflow_text`), not here.
+        """
+        layout = self.blank_layout()
+        image_part = None
+        if theme is not None and theme.background:
+            image_part = image_part_for(layout.part.package, theme.background)
+        write_theme_layout(layout, theme, image_part)
+        self.theme = theme
+        self.mark_dirty(layout)
+        self.document.set_theme(theme, self._theme_background())
+
+    def text_style(self):
+        """The style of text added without one: the theme's, or the default."""
+        return self.theme.style if self.theme is not None else TextStyle()
+
+    def _theme_background(self):
+        path = self.theme.preview_background() if self.theme is not None else None
+        return ImageRef(default_cache().digest(path), path) if path else None
+
+    def _uses_theme(self, slide):
+        return self.theme is not None and slide.slide_layout.part is self.blank_layout().part
+
+    def mark_dirty(self, *slides_or_parts):
+        """Record that the given slides (or package parts) have changed."""
+        for item in slides_or_parts:
+            self.dirty_parts.add(getattr(item, "part", item))
+        self.revision += 1
+
+    def add_slide(self):
+        """Append a blank slide and return it."""
+        slide = self.slides.add_slide(self.blank_layout())
+        self.mark_dirty(slide, self.prs.part)
+        self.document.insert_slide(slide.slide_id)
+        return slide
+
+    def set_background(self, slide, image_path):
+        """Cover `slide` with the picture at `image_path`, behind its other shapes."""
+        self.load_slide(slide.slide_id)
+        self.mark_dirty(slide)
+        picture = add_picture(slide, image_path, 0, 0, self.prs.slide_width, self.prs.slide_height)
+        # New slides already hold the theme's text box, which must stay on top
+        spTree = slide.shapes._spTree
+        spTree.remove(picture._element)
+        spTree.insert(2, picture._element)  # after nvGrpSpPr and grpSpPr
+        self.document.set_background(slide.slide_id,
+                                     ImageRef(default_cache().digest(image_path), image_path))
+        return picture
+
+    def add_text(self, slide, text, style=None, box=SLIDE_TEXT_BOX):
+        """Add a text box to `slide` and return its shape.
+
+        The text is laid out with `text_layout`: the font shrinks from the
+        style's size until the text fits, and the computed line breaks are
+        written as soft breaks so PowerPoint wraps exactly like the preview.
+
+        Without a `style`, on a themed slide, the text goes into the theme's
+        text box and takes its font from the layout, so it follows later
+        theme changes. Further text on that slide gets the theme's font
+        written out.
+        """
+        self.load_slide(slide.slide_id)
+        self.mark_dirty(slide)
+        if style is None and self._uses_theme(slide):
+            shape = self._theme_text_box(slide)
+            if shape is not None:
+                self._write_theme_text(slide.slide_id, shape, text)
+                self.document.add_text(slide.slide_id, TextRun(text))
+                return shape
+
+        style = style or self.text_style()
+        layout = layout_text(text, style, box)
+        left, top, width, height = (Inches(value) for value in box)
+        shape = slide.shapes.add_textbox(left, top, width, height)
+        text_frame = shape.text_frame
+        text_frame.word_wrap = True
+        text_frame.auto_size = MSO_AUTO_SIZE.NONE
+        # A vertical tab becomes a line break inside the paragraph
+        text_frame.text = layout.text(line_break="\v")
+        for paragraph in text_frame.paragraphs:
+            for run in paragraph.runs:
+                run.font.name = style.name
+                run.font.size = Pt(layout.size)
+                run.font.bold = style.bold
+                run.font.color.rgb = RGBColor(*style.color)
+        self.document.add_text(slide.slide_id, TextRun(text, style))
+        return shape
+
+    def _theme_text_box(self, slide):
+        """The empty theme text box of `slide`, added if missing; None if it holds text."""
+        shape = _theme_placeholder(slide)
+        if shape is None:
+            # New slides get it from the layout; slides made before the theme did not
+            for layout_placeholder in slide.slide_layout.placeholders:
+                if layout_placeholder.placeholder_format.idx == THEME_BODY_IDX:
+                    slide.shapes.clone_placeholder(layout_placeholder)
+            shape = _theme_placeholder(slide)
+        return shape if shape is not None and not shape.text_frame.text else None
+
+    def _write_theme_text(self, slide_id, shape, text):
+        theme = self.theme
+        layout = layout_text(text, theme.style, theme.box)
+        shape.text_frame.text = layout.text(line_break="\v")
+        if layout.size != theme.style.size:
+            # Only a font shrunk to fit is written out; the rest comes from the layout
+            for paragraph in shape.text_frame.paragraphs:
+                for run in paragraph.runs:
+                    run.font.size = Pt(layout.size)
+        self._text_keys[slide_id] = theme.text_key()
+
+    def reflow_text(self):
+        """Break theme text into lines again where it was laid out for another theme.
+
+        Called before saving, so a theme change costs nothing per slide until
+        the deck is written. Slides of an opened deck are read for this only
+        if the font or box differs from the one the file was saved with.
+        """
+        if self.theme is None:
+            return 0
+        key = self.theme.text_key()
+        reflowed = 0
+        for record in list(self.document):
+            if not record.loaded:
+                if key == self._file_text_key:
+                    continue
+                self.load_slide(record.slide_id)
+                record = self.document.get(record.slide_id)
+            if not record.themed or not record.texts or record.texts[0].style is not None:
+                continue
+            if self._text_keys.get(record.slide_id, self._file_text_key) == key:
+                continue
+            slide = self.slides.slide(record.slide_id)
+            shape = _theme_placeholder(slide)
+            if shape is None:
+                continue
+            self._write_theme_text(record.slide_id, shape, record.texts[0].text)
+            self.mark_dirty(slide)
+            reflowed += 1
+        return reflowed
+
+    def clear_slide(self, slide):
+        """Remove every shape, background picture included, from `slide`.
+
+        Returns the removed shapes as `[(position, element), ...]` for
+        `restore_shapes`.
+        """
+        self.load_slide(slide.slide_id)
+        removed = [self.take_shape(slide, shape.shape_id) for shape in list(slide.shapes)]
+        self.document.clear_slide(slide.slide_id)
+        return removed[::-1]
+
+    def take_shape(self, slide, shape_id):
+        """Remove the shape with `shape_id` from `slide`; return `(position, element)`."""
+        for shape in slide.shapes:
+            if shape.shape_id == shape_id:
+                element = shape._element
+                parent = element.getparent()
+                position = parent.index(element)
+                parent.remove(element)
+                self.mark_dirty(slide)
+                return position, element
+        raise KeyError(shape_id)
+
+    def restore_shapes(self, slide, shapes):
+        """Put back shapes removed by `take_shape` or `clear_slide`, in the order given."""
+        spTree = slide.shapes._spTree
+        for position, element in shapes:
+            spTree.insert(position, element)
+        self.mark_dirty(slide)
+
+    def paginate_passages(self, verse_store, references, translation, style=None,
+                          split=True, fits=None):
+        """Return the slide texts for a reference list such as "John 3:16-18; Rom 8:28".
+
+        All ranges are fetched with one query. When `split` is set, long
+        passages are spread over several slides using `fits(text)`, which
+        defaults to `text_layout.text_fits`.
+        """
+        box = SLIDE_TEXT_BOX
+        if style is None and self.theme is not None:
+            box = self.theme.box
+        style = style or self.text_style()
+        fits = fits or (lambda text: text_fits(text, style, box))
+        pages = []
+        for passage in verse_store.passages(translation, parse_references(references)):
+            if passage:
+                pages.extend(paginate(passage, fits, _page_text) if split else [passage])
+        return [_page_text(page) for page in pages]
+
+    def add_passages(self, verse_store, references, translation, style=None,
+                     split=True, fits=None, background=None):
+        """Add slides for a reference list; see `paginate_passages`.
+
+        Returns `[(slide, text), ...]` for the new slides.
+        """
+        added = []
+        pages = self.paginate_passages(verse_store, references, translation, style, split, fits)
+        with self.document.batch():
+            for text in pages:
+                slide = self.add_slide()
+                if background:
+                    self.set_background(slide, background)
+                self.add_text(slide, text, style)
+                added.append((slide, text))
+        return added
+
+    def save(self, path):
+        self.reflow_text()
+        with span("pptx.save"):
+            if self.source is None:
+                self.prs.save(path)
+                return
+            # Parts of an opened deck are read from its file while writing, and
+            # `path` may be that very file
+            tmp_path = f"{path}.{os.getpid()}.saving"
+            self.prs.save(tmp_path)
+            self.source.close()
+            os.replace(tmp_path, path)
+
+
+def _page_text(verses):
+    """The slide text for a page of verses: the verses, then their reference."""
+    return f"{verse_text(verses)}\n{format_verses(verses)}"
+
+
+def _theme_placeholder(slide):
+    """The shape holding `slide`'s text in the theme's text box, or None."""
+    for shape in slide.placeholders:
+        if shape.placeholder_format.idx == THEME_BODY_IDX:
+            return shape
+    return None
+
+
+def _is_theme_placeholder(shape):
+    return shape.is_placeholder and shape.placeholder_format.idx == THEME_BODY_IDX
+
+
+def _text_run(text_frame, themed=False):
+    """Return a `TextRun` for the text and first-run font of `text_frame`.
+
+    With `themed`, text without a font name of its own follows the theme.
+    """
+    # Line breaks written by `add_text` (or typed) become the spaces they replaced
+    text = "\n".join(paragraph.text.replace("\v", " ") for paragraph in text_frame.paragraphs)
+    style = TextStyle()
+    runs = [run for paragraph in text_frame.paragraphs for run in paragraph.runs]
+    if themed and not (runs and runs[0].font.name):
+        return TextRun(text.strip())
+    if runs:
+        font = runs[0].font
+        color = style.color
+        if font.color.type == MSO_COLOR_TYPE.RGB:
+            color = tuple(font.color.rgb)
+        style = TextStyle(font.name or style.name, round(font.size.pt) if font.size else style.size,
+                          bool(font.bold), color)
+    return TextRun(text.strip(), style)
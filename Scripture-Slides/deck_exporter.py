@@ -0,0 +1,60 @@
+"""Background deck export for the GUI, reporting progress through Qt signals."""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from exporter import ExportCancelled, export_pages, pages_from
+
+
+class DeckExporter(QObject):
+    """Runs `export_pages` in the background with progress and cancellation."""
+
+    progress = pyqtSignal(int, int)  # pages exported, total pages
+    exported = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super(DeckExporter, self).__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        self._cancel_event = None
+        self._future = None
+
+    def is_exporting(self):
+        return self._future is not None and not self._future.done()
+
+    def export(self, document, png_folder=None, pdf_path=None):
+        """Start exporting `document`; returns False if an export is already running.
+
+        The slide list is read here, on the GUI thread, so later edits do not
+        affect the running export.
+        """
+        if self.is_exporting():
+            return False
+        pages = pages_from(document)
+        target = pdf_path or png_folder
+        self._cancel_event = threading.Event()
+        self._future = self._executor.submit(export_pages, pages, png_folder, pdf_path,
+                                             progress=self.progress.emit,
+                                             cancel_event=self._cancel_event)
+        self._future.add_done_callback(lambda future: self._on_done(future, target))
+        return True
+
+    def cancel(self):
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def shutdown(self):
+        self.cancel()
+        self._executor.shutdown(wait=True)
+
+    def _on_done(self, future, target):
+        # Runs on the worker; the signals are delivered on the GUI thread
+        error = future.exception()
+        if isinstance(error, ExportCancelled):
+            self.cancelled.emit()
+        elif error is not None:
+            self.failed.emit(str(error))
+        else:
+            self.exported.emit(target)
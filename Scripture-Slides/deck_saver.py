@@ -0,0 +1,181 @@
+import os
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.package import XmlPart
+from pptx.opc.serialized import _ContentTypesItem
+
+from instrumentation import gauge, span
+from lazy_package import is_lazy_blob
+
+# Media that is already compressed is stored as-is instead of deflated again
+_STORED_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "tif", "tiff", "mp3", "mp4", "m4a", "wmv", "mov"}
+
+
+class SaveCancelled(Exception):
+    """Raised inside the save worker when the save is cancelled."""
+
+
+class PackageSnapshot:
+    """Serializes a presentation package, reusing XML of unchanged parts.
+
+    XML parts and their relationship items are re-serialized only when they
+    are new, were replaced, or are listed as dirty; everything else reuses the
+    bytes produced by the previous save. Binary parts such as pictures are
+    passed by reference; those of an opened deck that were never loaded are
+    passed as a function that reads them from the source file while writing.
+    The snapshot must be taken on the thread that owns the presentation.
+    """
+
+    def __init__(self):
+        self._xml_cache = {}  # partname -> (part, blob, rels blob)
+        self._content_types = (None, None)  # (partnames, blob)
+        self.reused = 0
+        self.serialized = 0
+
+    def take(self, prs, dirty_parts=()):
+        """Return `[(member name, bytes, compress), ...]` for the whole package."""
+        with span("pptx.snapshot"):
+            return self._take(prs, dirty_parts)
+
+    def _take(self, prs, dirty_parts):
+        package = prs.part.package
+        dirty = set(dirty_parts)
+        dirty.add(prs.part)  # the slide list lives here; small and cheap to redo
+        parts = list(package.iter_parts())
+
+        partnames = tuple((part.partname, part.content_type) for part in parts)
+        if self._content_types[0] != partnames:
+            self._content_types = (partnames, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        entries = [
+            (CONTENT_TYPES_URI.membername, self._content_types[1], True),
+            (PACKAGE_URI.rels_uri.membername, package._rels.xml, True),
+        ]
+        xml_cache = {}
+        self.reused = self.serialized = 0
+        for part in parts:
+            partname = part.partname
+            if isinstance(part, XmlPart):
+                cached = self._xml_cache.get(partname)
+                if cached is not None and cached[0] is part and part not in dirty:
+                    _, blob, rels_blob = cached
+                    self.reused += 1
+                else:
+                    blob = part.blob
+                    rels_blob = part.rels.xml if part._rels else None
+                    self.serialized += 1
+                xml_cache[partname] = (part, blob, rels_blob)
+                compress = True
+            else:
+                blob = part.read_blob if is_lazy_blob(part) else part.blob
+                rels_blob = part.rels.xml if part._rels else None
+                compress = partname.ext.lower() not in _STORED_EXTENSIONS
+            entries.append((partname.membername, blob, compress))
+            if rels_blob is not None:
+                entries.append((partname.rels_uri.membername, rels_blob, True))
+        # Parts no longer in the package (e.g. deleted slides) drop out here
+        self._xml_cache = xml_cache
+        return entries
+
+
+def write_package(entries, path, cancel_event=None, progress=None, before_replace=None):
+    """Write snapshot `entries` to `path` atomically.
+
+    The package is written to a temporary file next to `path`, flushed to disk
+    and then renamed over `path`, so an interrupted save never leaves a
+    truncated deck behind. A blob given as a function is called for its
+    bytes. `before_replace` is called just before the rename, e.g. to close
+    the file an opened deck reads from, which may be `path`.
+    """
+    tmp_path = f"{path}.{os.getpid()}.saving"
+    try:
+        with span("pptx.save", {"entries": len(entries)}), open(tmp_path, "wb") as pkg_file:
+            with zipfile.ZipFile(pkg_file, "w") as zip_file:
+                for done, (name, blob, compress) in enumerate(entries, start=1):
+                    if cancel_event is not None and cancel_event.is_set():
+                        raise SaveCancelled()
+                    if callable(blob):
+                        blob = blob()
+                    zip_file.writestr(name, blob,
+                                      zipfile.ZIP_DEFLATED if compress else zipfile.ZIP_STORED)
+                    if progress is not None:
+                        progress(done, len(entries))
+            pkg_file.flush()
+            os.fsync(pkg_file.fileno())
+        if before_replace is not None:
+            before_replace()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+class DeckSaver(QObject):
+    """Saves decks on a background thread with progress and cancellation.
+
+    `save` snapshots the deck on the calling (GUI) thread, which only
+    serializes slides changed since the previous save, and hands the writing
+    to a worker thread.
+    """
+
+    progress = pyqtSignal(int, int)  # entries written, total entries
+    saved = pyqtSignal(str)
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super(DeckSaver, self).__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="save")
+        self._snapshot = PackageSnapshot()
+        self._cancel_event = None
+        self._future = None
+
+    def is_saving(self):
+        return self._future is not None and not self._future.done()
+
+    def save(self, deck, path):
+        """Start saving `deck` to `path`; returns False if a save is already running."""
+        if self.is_saving():
+            return False
+        deck.reflow_text()
+        entries = self._snapshot.take(deck.prs, deck.dirty_parts)
+        deck.dirty_parts.clear()
+        gauge("save.parts_serialized", self._snapshot.serialized)
+        gauge("save.parts_reused", self._snapshot.reused)
+
+        self._cancel_event = threading.Event()
+        release = deck.source.close if deck.source is not None else None
+        self._future = self._executor.submit(write_package, entries, path, self._cancel_event,
+                                             self.progress.emit, release)
+        self._future.add_done_callback(self._on_done)
+        return True
+
+    def cancel(self):
+        """Stop the running save; the previous file on disk is left untouched."""
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+
+    def wait(self):
+        """Block until the running save, if any, has finished."""
+        if self._future is not None:
+            self._future.exception()
+
+    def shutdown(self):
+        self.wait()
+        self._executor.shutdown(wait=True)
+
+    def _on_done(self, future):
+        # Runs on the worker; the signals are delivered on the GUI thread
+        error = future.exception()
+        if isinstance(error, SaveCancelled):
+            self.cancelled.emit()
+        elif error is not None:
+            self.failed.emit(str(error))
+        else:
+            self.saved.emit(future.result())
@@ -0,0 +1,117 @@
+"""Diagnostics window: live span timings and counters, and trace export.
+
+Opened from Help > Diagnostics. Recording starts only when "Record timings"
+is ticked (or SCRIPTURE_SLIDES_TRACE was set at startup), so the panel costs
+nothing until it is used.
+"""
+from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtWidgets import (QCheckBox, QDialog, QFileDialog, QHBoxLayout, QHeaderView, QLabel,
+                             QPushButton, QTableWidget, QTableWidgetItem, QVBoxLayout)
+
+import instrumentation
+
+REFRESH_MS = 500
+_SPAN_COLUMNS = ("Span", "Calls", "Total ms", "Mean ms", "Worst ms")
+
+
+def _table(columns):
+    table = QTableWidget(0, len(columns))
+    table.setHorizontalHeaderLabels(columns)
+    table.setEditTriggers(QTableWidget.NoEditTriggers)
+    table.verticalHeader().setVisible(False)
+    table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+    return table
+
+
+def _fill(table, rows):
+    table.setRowCount(len(rows))
+    for row, values in enumerate(rows):
+        for column, value in enumerate(values):
+            item = QTableWidgetItem(value)
+            if column:
+                item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+            table.setItem(row, column, item)
+
+
+class DiagnosticsPanel(QDialog):
+    """Shows what the active `instrumentation.Recorder` has collected."""
+
+    def __init__(self, parent=None):
+        super(DiagnosticsPanel, self).__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.resize(560, 520)
+
+        self.recordCheckBox = QCheckBox("Record timings")
+        self.recordCheckBox.setChecked(instrumentation.enabled())
+        self.recordCheckBox.toggled.connect(self.set_recording)
+        self.spanTable = _table(_SPAN_COLUMNS)
+        self.counterTable = _table(("Counter", "Value"))
+        self.statusLabel = QLabel()
+        resetButton = QPushButton("Reset")
+        resetButton.clicked.connect(self.reset)
+        exportButton = QPushButton("Export Trace...")
+        exportButton.clicked.connect(self.export_trace)
+        closeButton = QPushButton("Close")
+        closeButton.clicked.connect(self.close)
+
+        buttons = QHBoxLayout()
+        buttons.addWidget(self.statusLabel, 1)
+        for button in (resetButton, exportButton, closeButton):
+            buttons.addWidget(button)
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.recordCheckBox)
+        layout.addWidget(self.spanTable, 3)
+        layout.addWidget(self.counterTable, 2)
+        layout.addLayout(buttons)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.refresh()
+
+    def showEvent(self, event):
+        self.refresh_timer.start()
+        super(DiagnosticsPanel, self).showEvent(event)
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super(DiagnosticsPanel, self).hideEvent(event)
+
+    def set_recording(self, on):
+        if on:
+            instrumentation.enable()
+        else:
+            instrumentation.disable()
+        self.refresh()
+
+    def reset(self):
+        """Start a fresh recording, if recording."""
+        if instrumentation.disable() is not None:
+            instrumentation.enable()
+        self.refresh()
+
+    def refresh(self):
+        recorder = instrumentation.recorder()
+        if recorder is None:
+            _fill(self.spanTable, [])
+            _fill(self.counterTable, [])
+            self.statusLabel.setText("Not recording")
+            return
+        _fill(self.spanTable, [
+            (name, str(stats.calls), f"{stats.total * 1000:.1f}", f"{stats.mean * 1000:.2f}",
+             f"{stats.worst * 1000:.1f}")
+            for name, stats in recorder.span_stats()])
+        _fill(self.counterTable, [(name, f"{value:g}") for name, value in recorder.counter_values()])
+        self.statusLabel.setText(f"{len(recorder.events)} events recorded")
+
+    def export_trace(self):
+        recorder = instrumentation.recorder()
+        if recorder is None:
+            self.statusLabel.setText("Nothing recorded; tick Record timings first")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Trace", "trace.json",
+                                              "Chrome trace (*.json)")
+        if path:
+            recorder.write_chrome_trace(path)
+            self.statusLabel.setText(f"Trace written to {path}")
+            print(f"Trace written to {path}")
@@ -0,0 +1,313 @@
+"""Compact in-memory model of a deck's slides.
+
+The python-pptx objects remain the source of truth for the saved file; the
+document mirrors what the app needs to know about each slide (background,
+text, preview) in small slotted records, so thousands of slides can be held
+at once. Every change is published as a `ChangeEvent` and flags the slide
+dirty, letting the list, the preview renderer and other consumers redo only
+the slides that changed.
+
+Slides of an opened deck start out unloaded: their records hold only the
+slide ID until `Deck.load_slide` reads the slide and calls `load_slide`.
+
+A slide without a background or text style of its own shows the deck's
+theme (see theme.py). Changing the theme is one event, not one per slide:
+the slides that show it are only flagged `DIRTY_THEME`, and `appearance`
+resolves what each slide looks like when it is drawn.
+
+Inside `batch`, slides added one after another are announced as a single
+ranged `SLIDE_ADDED` event, so a list can insert them all in one step.
+"""
+from collections import namedtuple
+from contextlib import contextmanager
+
+# Per-slide dirty flags, one bit per consumer
+DIRTY_PREVIEW = 1
+DIRTY_THEME = 2  # the preview shows an old theme; re-render it when it is shown
+DIRTY_ALL = DIRTY_PREVIEW
+
+# Change event kinds
+SLIDE_ADDED = "added"
+SLIDE_REMOVED = "removed"
+SLIDE_MOVED = "moved"
+SLIDE_CHANGED = "changed"
+PREVIEW_CHANGED = "preview"
+THEME_CHANGED = "theme"  # no slide ID; the affected slides are flagged DIRTY_THEME
+SLIDES_RESET = "reset"  # every slide replaced, e.g. by opening a deck; no slide ID
+
+# `index` is the slide's position after the change (before it, for removals).
+# `count` is the number of slides a SLIDE_ADDED event covers: `slide_id` and
+# the ones after it, `slide_ids(index, index + count)` when it is delivered.
+ChangeEvent = namedtuple("ChangeEvent", "kind slide_id index count", defaults=(1,))
+
+# What to draw for a slide: background `ImageRef`, text, style and text box, any
+# of which may be None (the box then is the standard `text_layout.SLIDE_TEXT_BOX`)
+Appearance = namedtuple("Appearance", "background text style box")
+
+
+class ImageRef:
+    """A picture used on a slide, identified by the SHA1 of its bytes."""
+
+    __slots__ = ("digest", "path")
+
+    def __init__(self, digest, path):
+        self.digest = digest
+        self.path = path
+
+
+class TextRun:
+    """A block of slide text and the style it was set in; None for the theme's."""
+
+    __slots__ = ("text", "style")
+
+    def __init__(self, text, style=None):
+        self.text = text
+        self.style = style
+
+
+class SlideRecord:
+    """What the app tracks about one slide.
+
+    `loaded` is False for a slide of an opened deck that has not been read
+    yet; its background and texts are then unknown, not empty. `themed` is
+    False for a slide on a layout other than the theme's.
+    """
+
+    __slots__ = ("slide_id", "background", "texts", "preview_path", "dirty", "loaded", "themed")
+
+    def __init__(self, slide_id, background=None, texts=(), preview_path=None, dirty=DIRTY_ALL,
+                 loaded=True, themed=True):
+        self.slide_id = slide_id
+        self.background = background
+        self.texts = tuple(texts)
+        self.preview_path = preview_path
+        self.dirty = dirty
+        self.loaded = loaded
+        self.themed = themed
+
+    @property
+    def text(self):
+        """All text runs of the slide joined into one string, or None."""
+        return "\n".join(run.text for run in self.texts) if self.texts else None
+
+    @property
+    def style(self):
+        """The style of the first text run, or None (also when it follows the theme)."""
+        return self.texts[0].style if self.texts else None
+
+    def shows_theme(self):
+        """Whether the slide's look depends on the theme."""
+        return self.themed and self.loaded and (
+            self.background is None or any(run.style is None for run in self.texts))
+
+
+class Document:
+    """Ordered slide records with dirty flags and a change-event stream."""
+
+    def __init__(self):
+        self._order = []
+        self._rows = {}  # slide ID -> position in `_order`
+        self._slides = {}
+        self._listeners = []
+        self._batching = False
+        self._pending = None  # SLIDE_ADDED event held back by `batch`
+        self.theme = None
+        self.theme_background = None  # ImageRef drawn behind themed slides, or None
+
+    def subscribe(self, callback):
+        """Call `callback(event)` after every change."""
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        self._listeners.remove(callback)
+
+    def __len__(self):
+        return len(self._order)
+
+    def __iter__(self):
+        """Iterate over the slide records in deck order."""
+        return (self._slides[slide_id] for slide_id in self._order)
+
+    def slide_ids(self, start=0, stop=None):
+        return self._order[start:stop]
+
+    def get(self, slide_id):
+        """Return the record of `slide_id`, or None."""
+        return self._slides.get(slide_id)
+
+    def index_of(self, slide_id):
+        return self._rows[slide_id]
+
+    def insert_slide(self, slide_id, index=None, background=None, texts=(), loaded=True,
+                     themed=True):
+        """Add a record for `slide_id` at `index` (default: the end) and return it."""
+        index = len(self._order) if index is None else index
+        record = SlideRecord(slide_id, background, texts, loaded=loaded, themed=themed)
+        self._slides[slide_id] = record
+        self._order.insert(index, slide_id)
+        self._reindex(index)
+        self._emit(SLIDE_ADDED, slide_id, index)
+        return record
+
+    def copy_slide(self, source_id, slide_id, index=None):
+        """Add `slide_id` as a copy of `source_id`; images and styles are shared."""
+        source = self._slides[source_id]
+        return self.insert_slide(slide_id, index, source.background, source.texts, source.loaded,
+                                 source.themed)
+
+    def reset(self, slide_ids):
+        """Replace every record with an unloaded one per slide ID, in one event."""
+        self._order = list(slide_ids)
+        self._rows = {}
+        self._reindex(0)
+        self._slides = {slide_id: SlideRecord(slide_id, dirty=0, loaded=False)
+                        for slide_id in self._order}
+        self._emit(SLIDES_RESET, None, 0)
+
+    def load_slide(self, slide_id, background, texts, themed=True):
+        """Fill in what was read from an unloaded slide."""
+        self._change(slide_id, background=background, texts=tuple(texts), loaded=True,
+                     themed=themed)
+
+    def remove_slide(self, slide_id):
+        """Drop the record of `slide_id` and return it."""
+        index = self._rows.pop(slide_id)
+        del self._order[index]
+        self._reindex(index)
+        record = self._slides.pop(slide_id)
+        self._emit(SLIDE_REMOVED, slide_id, index)
+        return record
+
+    def restore_slide(self, record, index):
+        """Put back a record returned by `remove_slide`."""
+        record.preview_path = None
+        record.dirty = DIRTY_ALL
+        self._slides[record.slide_id] = record
+        self._order.insert(index, record.slide_id)
+        self._reindex(index)
+        self._emit(SLIDE_ADDED, record.slide_id, index)
+
+    def move_slide(self, slide_id, index):
+        old_index = self._rows[slide_id]
+        index = max(0, min(index, len(self._order) - 1))
+        if index == old_index:
+            return
+        self._order.insert(index, self._order.pop(old_index))
+        self._reindex(min(index, old_index))
+        self._emit(SLIDE_MOVED, slide_id, index)
+
+    def set_background(self, slide_id, image_ref):
+        self._change(slide_id, background=image_ref)
+
+    def add_text(self, slide_id, text_run):
+        self._change(slide_id, texts=self._slides[slide_id].texts + (text_run,))
+
+    def set_texts(self, slide_id, texts):
+        self._change(slide_id, texts=tuple(texts))
+
+    def clear_slide(self, slide_id):
+        """Forget the background and text of `slide_id`."""
+        self._change(slide_id, background=None, texts=())
+
+    def set_theme(self, theme, background=None):
+        """Switch to `theme` (background: an `ImageRef` or None) in one event.
+
+        Only the slides that show the theme are flagged, with `DIRTY_THEME`;
+        their previews are left for consumers to redo when they are shown.
+        """
+        self.theme, self.theme_background = theme, background
+        for record in self._slides.values():
+            if record.shows_theme():
+                record.dirty |= DIRTY_THEME
+        self._emit(THEME_CHANGED, None, 0)
+
+    def appearance(self, record):
+        """Return the `Appearance` of `record`, filling in what the theme provides."""
+        theme = self.theme if record.themed else None
+        background = record.background or (self.theme_background if theme else None)
+        style, box = record.style, None
+        if record.texts and style is None and theme is not None:
+            style, box = theme.style, theme.box
+        return Appearance(background, record.text, style, box)
+
+    def set_preview(self, slide_id, preview_path):
+        """Record a rendered preview; this does not make the slide dirty."""
+        record = self._slides.get(slide_id)
+        if record is not None:
+            record.preview_path = preview_path
+            self._emit(PREVIEW_CHANGED, slide_id, self._rows[slide_id])
+
+    def mark_dirty(self, slide_ids=None, flags=DIRTY_ALL):
+        """Flag `slide_ids` (default: every slide) as needing `flags` redone."""
+        for slide_id in self._order if slide_ids is None else slide_ids:
+            self._slides[slide_id].dirty |= flags
+
+    def take_dirty(self, flag=DIRTY_PREVIEW, slide_ids=None):
+        """Return the slide IDs flagged with `flag`, in deck order, and clear it.
+
+        With `slide_ids`, only those slides are looked at, in the order given.
+        """
+        dirty = []
+        for slide_id in self._order if slide_ids is None else slide_ids:
+            record = self._slides.get(slide_id)
+            if record is None:
+                continue
+            if record.dirty & flag:
+                record.dirty &= ~flag
+                dirty.append(slide_id)
+        return dirty
+
+    def _change(self, slide_id, **values):
+        record = self._slides[slide_id]
+        for name, value in values.items():
+            setattr(record, name, value)
+        record.dirty = DIRTY_ALL
+        self._emit(SLIDE_CHANGED, slide_id, self._rows[slide_id])
+
+    def _reindex(self, start):
+        # Only the positions from `start` on moved; appending stays O(1)
+        for row in range(start, len(self._order)):
+            self._rows[self._order[row]] = row
+
+    @contextmanager
+    def batch(self):
+        """Announce slides added in the block at consecutive positions as one event.
+
+        Changes to those slides before the event is sent are not announced
+        separately; the slides are new and dirty anyway. Any other change
+        sends the held event first, so events stay in order.
+        """
+        if self._batching:
+            yield
+            return
+        self._batching = True
+        try:
+            yield
+        finally:
+            self._batching = False
+            self._flush()
+
+    def _emit(self, kind, slide_id, index):
+        pending = self._pending
+        if self._batching:
+            if kind == SLIDE_ADDED:
+                if pending is not None and index == pending.index + pending.count:
+                    self._pending = pending._replace(count=pending.count + 1)
+                else:
+                    self._flush()
+                    self._pending = ChangeEvent(kind, slide_id, index)
+                return
+            if (kind == SLIDE_CHANGED and pending is not None
+                    and pending.index <= index < pending.index + pending.count):
+                return
+        self._flush()
+        self._deliver(ChangeEvent(kind, slide_id, index))
+
+    def _flush(self):
+        if self._pending is not None:
+            event, self._pending = self._pending, None
+            self._deliver(event)
+
+    def _deliver(self, event):
+        for callback in list(self._listeners):
+            callback(event)
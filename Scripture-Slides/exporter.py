@@ -0,0 +1,181 @@
+"""Export a deck as a PNG sequence and/or a PDF without PowerPoint.
+
+Slides are drawn from the document records by the same code as the previews
+(`slide_image.draw_slide`), at full resolution, on a pool of worker
+processes. Each worker writes its PNG straight to disk and hands back only
+the JPEG-encoded page for the PDF, which is appended to the file in slide
+order as soon as it arrives. Only a few pages are in flight at once, so
+memory stays flat however long the deck is.
+
+This module does not import Qt, so the command-line build can export too;
+`deck_exporter.DeckExporter` runs an export in the background for the GUI.
+"""
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+
+from instrumentation import gauge, span
+
+EXPORT_SIZE = (1920, 1080)  # pixels; the 20 x 11.25 inch slide at 96 DPI
+PAGE_SIZE = (1440, 810)  # PDF points; the slide at 72 points per inch
+PDF_JPEG_QUALITY = 92
+PNG_COMPRESS_LEVEL = 1  # fast; the PNGs are for import into other tools, not archiving
+
+# What a worker needs to draw one slide; plain values so it pickles cheaply
+SlidePage = namedtuple("SlidePage", "image_path text style box")
+
+
+class ExportCancelled(Exception):
+    """Raised inside the export when it is cancelled."""
+
+
+def pages_from(document):
+    """Return a `SlidePage` for every slide of `document`, in deck order."""
+    pages = []
+    for record in document:
+        background, text, style, box = document.appearance(record)
+        pages.append(SlidePage(background.path if background else None, text, style, box))
+    return pages
+
+
+def render_page(page, png_path=None, pdf=False, size=EXPORT_SIZE):
+    """Draw `page`, save it to `png_path` if given, and return JPEG bytes if `pdf`.
+
+    Runs in a worker process.
+    """
+    from slide_image import draw_slide
+
+    image = draw_slide(size, page.image_path, page.text, page.style, page.box)
+    if png_path:
+        tmp_path = f"{png_path}.{os.getpid()}.tmp"
+        image.save(tmp_path, format="PNG", compress_level=PNG_COMPRESS_LEVEL)
+        os.replace(tmp_path, png_path)
+    if not pdf:
+        return None
+    jpeg = BytesIO()
+    image.save(jpeg, format="JPEG", quality=PDF_JPEG_QUALITY)
+    return jpeg.getvalue()
+
+
+class PdfWriter:
+    """Writes a PDF of full-page JPEG images, one page at a time.
+
+    Each page is written to disk as soon as it is added; only the byte
+    offsets of the objects are kept for the cross-reference table. The file
+    is built next to `path` and renamed into place by `close`.
+    """
+
+    def __init__(self, path, page_size=PAGE_SIZE):
+        self.path = path
+        self.page_size = page_size
+        self._tmp_path = f"{path}.{os.getpid()}.exporting"
+        self._file = open(self._tmp_path, "wb")
+        self._offsets = {}
+        self._pages = []
+        self._next_id = 3  # 1 is the catalog and 2 the page tree, written last
+        self._file.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def add_jpeg(self, data, width, height):
+        """Add a page showing the JPEG `data` of `width` x `height` pixels."""
+        page_width, page_height = self.page_size
+        image_id, content_id, page_id = self._reserve(3)
+        self._write_object(image_id, (
+            f"<< /Type /XObject /Subtype /Image /Width {width} /Height {height} "
+            f"/ColorSpace /DeviceRGB /BitsPerComponent 8 /Filter /DCTDecode "
+            f"/Length {len(data)} >>").encode("ascii"), data)
+        content = f"q {page_width} 0 0 {page_height} 0 0 cm /Im0 Do Q".encode("ascii")
+        self._write_object(content_id, f"<< /Length {len(content)} >>".encode("ascii"), content)
+        self._write_object(page_id, (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {page_width} {page_height}] "
+            f"/Resources << /XObject << /Im0 {image_id} 0 R >> >> "
+            f"/Contents {content_id} 0 R >>").encode("ascii"))
+        self._pages.append(page_id)
+
+    def close(self):
+        """Finish the file and move it to `path`."""
+        kids = " ".join(f"{page_id} 0 R" for page_id in self._pages)
+        self._write_object(2, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._pages)} >>"
+                           .encode("ascii"))
+        self._write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        xref_offset = self._file.tell()
+        count = self._next_id
+        lines = [f"xref\n0 {count}\n", "0000000000 65535 f \n"]
+        lines += [f"{self._offsets[object_id]:010d} 00000 n \n" for object_id in range(1, count)]
+        lines.append(f"trailer\n<< /Size {count} /Root 1 0 R >>\nstartxref\n{xref_offset}\n%%EOF\n")
+        self._file.write("".join(lines).encode("ascii"))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Stop writing and delete the partial file."""
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def _reserve(self, count):
+        first = self._next_id
+        self._next_id += count
+        return range(first, first + count)
+
+    def _write_object(self, object_id, header, stream=None):
+        self._offsets[object_id] = self._file.tell()
+        self._file.write(f"{object_id} 0 obj\n".encode("ascii") + header)
+        if stream is not None:
+            self._file.write(b"\nstream\n")
+            self._file.write(stream)
+            self._file.write(b"\nendstream")
+        self._file.write(b"\nendobj\n")
+
+
+def png_path_for(folder, index):
+    """Return the file name of slide `index` (0-based) in a PNG sequence."""
+    return os.path.join(folder, f"slide_{index + 1:03d}.png")
+
+
+def export_pages(pages, png_folder=None, pdf_path=None, size=EXPORT_SIZE, workers=None,
+                 progress=None, cancel_event=None):
+    """Render `pages` to a PNG sequence in `png_folder` and/or a PDF at `pdf_path`.
+
+    Pages are drawn on `workers` processes (default: one per CPU). Returns
+    the number of pages exported.
+    """
+    pages = list(pages)
+    if png_folder:
+        os.makedirs(png_folder, exist_ok=True)
+    pdf = PdfWriter(pdf_path) if pdf_path else None
+    workers = workers or os.cpu_count() or 1
+    window = 2 * workers  # pages submitted but not yet written
+    # Spawned workers do not inherit the GUI's threads and locks, as forked ones would
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+            futures = {}
+            for index in range(len(pages)):
+                while len(futures) < window and index + len(futures) < len(pages):
+                    submit = index + len(futures)
+                    png_path = png_path_for(png_folder, submit) if png_folder else None
+                    futures[submit] = executor.submit(render_page, pages[submit], png_path,
+                                                      pdf is not None, size)
+                gauge("export.in_flight", len(futures))
+                if cancel_event is not None and cancel_event.is_set():
+                    for future in futures.values():
+                        future.cancel()
+                    raise ExportCancelled()
+                # Waiting for the page, then appending it to the PDF
+                with span("export.page", {"page": index + 1}):
+                    jpeg = futures.pop(index).result()
+                    if pdf is not None:
+                        pdf.add_jpeg(jpeg, *size)
+                if progress is not None:
+                    progress(index + 1, len(pages))
+    except BaseException:
+        if pdf is not None:
+            pdf.abort()
+        raise
+    if pdf is not None:
+        pdf.close()
+    return len(pages)
@@ -0,0 +1,210 @@
+import hashlib
+import io
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+from PIL import Image
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.image import Image as PptxImage, ImagePart
+
+from instrumentation import count, span
+from lazy_package import is_lazy_blob
+
+# Downscaled variants kept in the cache, one per place an image is shown
+PREVIEW_SIZE = (1280, 720)
+VIEW_SIZE = (960, 540)
+THUMBNAIL_SIZE = (192, 108)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ImageCache:
+    """Content-addressed cache of image bytes and decoded, downscaled variants.
+
+    Entries are keyed by the SHA1 of the file contents, so the same picture
+    picked from two paths (or twice from one path) is read, decoded and
+    resized only once. The cache is bounded by the number of bytes it holds
+    and evicts the least recently used entries first. It is safe to use from
+    the preview worker threads.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # key -> (value, size in bytes)
+        self._digests = {}  # (path, mtime, size) -> digest
+
+    def digest(self, image_path):
+        """Return the SHA1 hex digest of the file at `image_path`.
+
+        Digests are remembered per path, modification time and size, so a file
+        is only hashed again when it changes on disk.
+        """
+        stat = os.stat(image_path)
+        stamp = (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            digest = self._digests.get(stamp)
+        if digest is None:
+            with span("image.hash"):
+                blob = self._read(image_path)
+                digest = hashlib.sha1(blob).hexdigest()
+            with self._lock:
+                self._digests[stamp] = digest
+            self._put(("blob", digest), blob, len(blob))
+        return digest
+
+    def blob(self, image_path):
+        """Return `(digest, bytes)` for the file at `image_path`."""
+        digest = self.digest(image_path)
+        blob = self._get(("blob", digest))
+        if blob is None:
+            blob = self._read(image_path)
+            self._put(("blob", digest), blob, len(blob))
+        return digest, blob
+
+    def variant(self, image_path, size):
+        """Return an RGB `PIL.Image` of the picture resized to `size`.
+
+        The returned image is shared between callers and must not be modified.
+        """
+        digest = self.digest(image_path)
+        key = ("variant", digest, tuple(size))
+        image = self._get(key)
+        if image is None:
+            with span("image.decode"), Image.open(image_path) as source:
+                # Let the JPEG decoder downscale while decoding instead of
+                # inflating a full 4K frame only to throw most of it away
+                source.draft("RGB", tuple(size))
+                image = source.convert("RGB").resize(tuple(size))
+            self._put(key, image, image.width * image.height * len(image.getbands()))
+        return image
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._digests.clear()
+            self.current_bytes = 0
+
+    def _read(self, image_path):
+        with open(image_path, "rb") as image_file:
+            return image_file.read()
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                count("image_cache.miss")
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        count("image_cache.hit")
+        return entry[0]
+
+    def _put(self, key, value, size):
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.current_bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.current_bytes += size
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def default_cache():
+    """Return the process-wide image cache."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ImageCache()
+        return _default_cache
+
+
+# One digest -> ImagePart map per open package, dropped with the package
+_picture_parts = weakref.WeakKeyDictionary()
+# Pictures of an opened deck not read yet, by size, hashed only on a size match
+_unhashed_parts = weakref.WeakKeyDictionary()
+
+
+def _image_parts_for(package):
+    parts = _picture_parts.get(package)
+    if parts is None:
+        # Seed from pictures already in the package, e.g. an opened deck
+        parts = {}
+        unhashed = {}
+        for part in package.iter_parts():
+            if isinstance(part, ImagePart):
+                if is_lazy_blob(part):
+                    unhashed.setdefault(part.blob_size, []).append(part)
+                else:
+                    parts.setdefault(part.sha1, part)
+        _picture_parts[package] = parts
+        _unhashed_parts[package] = unhashed
+    return parts
+
+
+def _hash_same_size(package, parts, size):
+    """Hash the unread pictures of `package` that are `size` bytes long into `parts`."""
+    for part in _unhashed_parts.get(package, {}).pop(size, []):
+        parts.setdefault(part.sha1, part)
+
+
+def image_part_for(package, image_path, cache=None):
+    """Return the image part of `package` holding the picture at `image_path`.
+
+    The part is looked up by content digest instead of letting python-pptx
+    re-read the file and hash every image part in the deck on each call, and
+    is created only for a picture the package does not hold yet.
+    """
+    cache = cache or default_cache()
+    parts = _image_parts_for(package)
+
+    digest = cache.digest(image_path)
+    image_part = parts.get(digest)
+    if image_part is None:
+        digest, blob = cache.blob(image_path)
+        _hash_same_size(package, parts, len(blob))
+        image_part = parts.get(digest)
+    if image_part is None:
+        image = PptxImage.from_blob(blob, os.path.basename(image_path))
+        image_part = ImagePart.new(package, image)
+        parts[digest] = image_part
+    return image_part
+
+
+def add_picture(slide, image_path, left, top, width=None, height=None, cache=None):
+    """Add a picture to `slide`, sharing one image part per distinct image.
+
+    Behaves like `slide.shapes.add_picture`, but finds the image part with
+    `image_part_for`, so every slide that shows the same picture points at
+    the same part in the saved file.
+    """
+    image_part = image_part_for(slide.part.package, image_path, cache)
+    shapes = slide.shapes
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+    pic = shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+    shapes._recalculate_extents()
+    return shapes._shape_factory(pic)
+
+
+def to_qpixmap(image):
+    """Convert a cached `PIL.Image` to a `QPixmap` (GUI thread only)."""
+    from PyQt5.QtGui import QImage, QPixmap
+
+    data = image.tobytes("raw", "RGB")
+    qimage = QImage(data, image.width, image.height, image.width * 3, QImage.Format_RGB888)
+    return QPixmap.fromImage(qimage.copy())
@@ -0,0 +1,210 @@
+"""Opt-in timing spans and counters for finding where the time goes.
+
+Recording is off by default. `span` then hands back one shared do-nothing
+context manager and `count` and `gauge` return at once, so the calls cost a
+global lookup and can stay in production builds. `enable` starts recording;
+the Diagnostics panel does it on request, and setting SCRIPTURE_SLIDES_TRACE
+to a file name does it at startup and writes the trace there on exit.
+
+Spans are named `area.what` (e.g. `preview.render`, `ui.add_slide`); the
+area becomes the trace category. Counters either add up (`count`, e.g. cache
+hits) or sample a level (`gauge`, e.g. a queue depth, kept over time in the
+trace). A recording exports as Chrome trace JSON, which chrome://tracing and
+https://ui.perfetto.dev open. Worker processes do not record.
+"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+TRACE_ENV = "SCRIPTURE_SLIDES_TRACE"
+MAX_EVENTS = 200000  # oldest events are dropped past this; the totals keep counting
+
+_recorder = None
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("recorder", "name", "args", "start")
+
+    def __init__(self, recorder, name, args):
+        self.recorder = recorder
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.recorder.add_span(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+class SpanStats:
+    """Running totals of one span name, in seconds."""
+
+    __slots__ = ("calls", "total", "worst")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    @property
+    def mean(self):
+        return self.total / self.calls if self.calls else 0.0
+
+
+class Recorder:
+    """Collects spans and counter samples from any thread."""
+
+    def __init__(self, max_events=MAX_EVENTS):
+        self.started = time.perf_counter()
+        self.events = deque(maxlen=max_events)  # (phase, name, start, value, thread ID, args)
+        self.spans = {}  # name -> SpanStats
+        self.counters = {}  # name -> total or latest level
+        self._threads = {}  # thread ID -> name
+        self._lock = threading.Lock()
+
+    def add_span(self, name, start, end, args=None):
+        thread_id = threading.get_ident()
+        with self._lock:
+            if thread_id not in self._threads:
+                self._threads[thread_id] = threading.current_thread().name
+            self.events.append(("X", name, start, end - start, thread_id, args))
+            stats = self.spans.get(name)
+            if stats is None:
+                stats = self.spans[name] = SpanStats()
+            stats.calls += 1
+            stats.total += end - start
+            stats.worst = max(stats.worst, end - start)
+
+    def count(self, name, delta=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + delta
+
+    def gauge(self, name, value):
+        with self._lock:
+            self.counters[name] = value
+            self.events.append(("C", name, time.perf_counter(), value, None, None))
+
+    def span_stats(self):
+        """Return `[(name, SpanStats), ...]`, most total time first."""
+        with self._lock:
+            return sorted(self.spans.items(), key=lambda item: item[1].total, reverse=True)
+
+    def counter_values(self):
+        with self._lock:
+            return sorted(self.counters.items())
+
+    def chrome_trace(self):
+        """Return the recording as a Chrome trace (JSON object format)."""
+        pid = os.getpid()
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self._threads)
+            counters = dict(self.counters)
+        trace = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                  "args": {"name": name}}
+                 for thread_id, name in threads.items()]
+        for phase, name, start, value, thread_id, args in events:
+            timestamp = round((start - self.started) * 1e6, 1)  # microseconds
+            if phase == "X":
+                event = {"name": name, "cat": name.split(".", 1)[0], "ph": "X",
+                         "ts": timestamp, "dur": round(value * 1e6, 1), "pid": pid,
+                         "tid": thread_id}
+                if args:
+                    event["args"] = args
+            else:
+                event = {"name": name, "ph": "C", "ts": timestamp, "pid": pid,
+                         "args": {"value": value}}
+            trace.append(event)
+        return {"traceEvents": trace, "displayTimeUnit": "ms",
+                "otherData": {"counters": counters}}
+
+    def write_chrome_trace(self, path):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as trace_file:
+            json.dump(self.chrome_trace(), trace_file)
+        os.replace(tmp_path, path)
+        return path
+
+
+def enabled():
+    return _recorder is not None
+
+
+def recorder():
+    """The active `Recorder`, or None when recording is off."""
+    return _recorder
+
+
+def enable():
+    """Start recording, if not already; return the `Recorder`."""
+    global _recorder
+    if _recorder is None:
+        _recorder = Recorder()
+    return _recorder
+
+
+def disable():
+    """Stop recording; return the `Recorder` that was active, or None."""
+    global _recorder
+    stopped, _recorder = _recorder, None
+    return stopped
+
+
+def span(name, args=None):
+    """Time a `with` block as `name`; `args` is a dict shown with it in the trace."""
+    active = _recorder
+    if active is None:
+        return _NULL_SPAN
+    return _Span(active, name, args)
+
+
+def count(name, delta=1):
+    """Add `delta` to the counter `name`."""
+    active = _recorder
+    if active is not None:
+        active.count(name, delta)
+
+
+def gauge(name, value):
+    """Record the current level of `name`, e.g. a queue depth."""
+    active = _recorder
+    if active is not None:
+        active.gauge(name, value)
+
+
+def traced(name):
+    """Decorate a function, typically a Qt slot, to run in a span called `name`.
+
+    The function is called with exactly the arguments given. Qt only drops
+    signal arguments a slot does not take for plain methods, so connect a
+    traced slot to such a signal (e.g. `clicked(bool)`) through a lambda.
+    """
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            active = _recorder
+            if active is None:
+                return function(*args, **kwargs)
+            with _Span(active, name, None):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
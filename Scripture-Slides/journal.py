@@ -0,0 +1,560 @@
+"""Undo/redo for deck edits, kept as small deltas and logged to disk.
+
+Each edit made through a `Journal` is recorded as a delta holding only what
+that edit touched: a detached slide, a removed shape element, the previous
+background or text. Undoing or redoing swaps that piece back, so it costs
+as much as the edit did, never a copy of the whole presentation. The undo
+history is trimmed, oldest first, to `max_bytes`.
+
+With a `path`, every edit, undo and redo is also appended to a JSON-lines
+log, and pictures are stored once by content digest next to it. Replaying
+the log onto a fresh deck rebuilds the same slides, with the same slide IDs,
+after a crash. Opening a .pptx starts the log over with an "open" entry,
+so recovery reopens the same file before replaying the edits made to it.
+Saving the deck starts it over the same way from the saved file (see
+`checkpoint`), so the log never grows past the edits made since the last save.
+"""
+import json
+import os
+from collections import deque
+from contextlib import contextmanager
+
+from lxml import etree
+
+from document import ImageRef
+from image_cache import default_cache
+from text_layout import TextStyle
+from theme import Theme
+
+DEFAULT_JOURNAL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recovery.journal")
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+_SMALL_DELTA = 128  # rough size of a delta that holds no XML or text
+
+
+class _SlideAdded:
+    """A new or duplicated slide; undone by detaching it."""
+
+    __slots__ = ("slide_id", "detached", "size")
+
+    def __init__(self, slide_id):
+        self.slide_id = slide_id
+        self.detached = None
+        self.size = _SMALL_DELTA
+
+    def undo(self, deck):
+        self.detached = deck.slides.detach(self.slide_id)
+
+    def redo(self, deck):
+        deck.slides.attach(self.detached)
+
+
+class _SlideDeleted:
+    __slots__ = ("slide_id", "detached", "size")
+
+    def __init__(self, detached):
+        self.slide_id = detached.sldId.id
+        self.detached = detached
+        self.size = _SMALL_DELTA + len(detached.part.blob)
+
+    def undo(self, deck):
+        deck.slides.attach(self.detached)
+
+    def redo(self, deck):
+        self.detached = deck.slides.detach(self.slide_id)
+
+
+class _SlideMoved:
+    __slots__ = ("slide_id", "old_index", "new_index", "size")
+
+    def __init__(self, slide_id, old_index, new_index):
+        self.slide_id = slide_id
+        self.old_index = old_index
+        self.new_index = new_index
+        self.size = _SMALL_DELTA
+
+    def undo(self, deck):
+        deck.slides.move(self.slide_id, self.old_index)
+
+    def redo(self, deck):
+        deck.slides.move(self.slide_id, self.new_index)
+
+
+class _ShapeAdded:
+    """A background picture or text box added to a slide.
+
+    `field` names the document field the shape changed ("background" or
+    "texts") and `before`/`after` are its values around the edit.
+    """
+
+    __slots__ = ("slide_id", "shape_id", "field", "before", "after", "shape", "size")
+
+    def __init__(self, slide_id, shape_id, field, before, after, size=_SMALL_DELTA):
+        self.slide_id = slide_id
+        self.shape_id = shape_id
+        self.field = field
+        self.before = before
+        self.after = after
+        self.shape = None
+        self.size = size
+
+    def undo(self, deck):
+        self.shape = deck.take_shape(deck.slides.slide(self.slide_id), self.shape_id)
+        _set_field(deck, self.slide_id, self.field, self.before)
+
+    def redo(self, deck):
+        deck.restore_shapes(deck.slides.slide(self.slide_id), [self.shape])
+        _set_field(deck, self.slide_id, self.field, self.after)
+
+
+class _SlideCleared:
+    __slots__ = ("slide_id", "shapes", "background", "texts", "size")
+
+    def __init__(self, slide_id, shapes, background, texts):
+        self.slide_id = slide_id
+        self.shapes = shapes
+        self.background = background
+        self.texts = texts
+        self.size = _SMALL_DELTA + sum(len(etree.tostring(element)) for _, element in shapes)
+
+    def undo(self, deck):
+        deck.restore_shapes(deck.slides.slide(self.slide_id), self.shapes)
+        _set_field(deck, self.slide_id, "background", self.background)
+        _set_field(deck, self.slide_id, "texts", self.texts)
+
+    def redo(self, deck):
+        self.shapes = deck.clear_slide(deck.slides.slide(self.slide_id))
+
+
+class _ThemeChanged:
+    """A switch of the deck's theme; undone by writing the previous one back."""
+
+    __slots__ = ("before", "after", "size")
+
+    def __init__(self, before, after):
+        self.before = before
+        self.after = after
+        self.size = _SMALL_DELTA
+
+    def undo(self, deck):
+        deck.apply_theme(self.before)
+
+    def redo(self, deck):
+        deck.apply_theme(self.after)
+
+
+class _Group:
+    """Several deltas undone and redone as one step."""
+
+    __slots__ = ("deltas", "size")
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.size = sum(delta.size for delta in deltas)
+
+    def undo(self, deck):
+        for delta in reversed(self.deltas):
+            delta.undo(deck)
+
+    def redo(self, deck):
+        for delta in self.deltas:
+            delta.redo(deck)
+
+
+def _set_field(deck, slide_id, field, value):
+    if field == "background":
+        deck.document.set_background(slide_id, value)
+    else:
+        deck.document.set_texts(slide_id, value)
+
+
+def _style_entry(style):
+    return [style.name, style.size, style.bold, list(style.color)] if style else None
+
+
+class Journal:
+    """Records deck edits for undo/redo and, optionally, crash recovery.
+
+    The GUI makes every undoable edit through the journal's methods, which
+    mirror the `Deck` and `SlideManager` calls they wrap.
+    """
+
+    def __init__(self, deck, path=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.deck = deck
+        self.path = path
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._undo = deque()
+        self._redo = []
+        self._group = None
+        self._log = None
+        self._lines = []  # entries logged after the last "open" entry
+        self._generation = 0  # bumped whenever the log starts over
+        # How many undo and redo steps the log on disk can replay; an undo or
+        # redo past them stops the writing until the next checkpoint
+        self._undoable = 0
+        self._redoable = 0
+        self._paused = False
+        if path:
+            self._log = open(path, "a", encoding="utf-8")
+
+    @classmethod
+    def replay(cls, path, deck, max_bytes=DEFAULT_MAX_BYTES):
+        """Apply the log at `path` to the empty `deck` and keep logging to it.
+
+        A last line cut short by a crash is dropped.
+        """
+        journal = cls(deck, max_bytes=max_bytes)
+        journal.path = path
+        valid_bytes = 0
+        with open(path, "rb") as log_file:
+            for line in log_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                journal._apply(entry)
+                valid_bytes += len(line)
+        with open(path, "r+b") as log_file:
+            log_file.truncate(valid_bytes)
+        journal._log = open(path, "a", encoding="utf-8")
+        return journal
+
+    @property
+    def blob_dir(self):
+        """Folder holding the pictures the log refers to, named by SHA1."""
+        return f"{self.path}.blobs"
+
+    def can_undo(self):
+        return bool(self._undo)
+
+    def can_redo(self):
+        return bool(self._redo)
+
+    def undo(self):
+        """Undo the last edit; returns False if there is nothing to undo."""
+        if not self._undo:
+            return False
+        delta = self._undo.pop()
+        self.current_bytes -= delta.size
+        with self.deck.document.batch():
+            delta.undo(self.deck)
+        self._redo.append(delta)
+        if self._undoable:
+            self._undoable -= 1
+            self._redoable += 1
+        else:
+            self._pause()
+        self._write({"op": "undo"})
+        return True
+
+    def redo(self):
+        """Redo the last undone edit; returns False if there is nothing to redo."""
+        if not self._redo:
+            return False
+        delta = self._redo.pop()
+        with self.deck.document.batch():
+            delta.redo(self.deck)
+        self._undo.append(delta)
+        self.current_bytes += delta.size
+        if self._redoable:
+            self._redoable -= 1
+            self._undoable += 1
+        else:
+            self._pause()
+        self._write({"op": "redo"})
+        return True
+
+    @contextmanager
+    def group(self):
+        """Record every edit made inside the block as a single undo step.
+
+        Slides added in the block are announced to the document's listeners
+        together; see `Document.batch`.
+        """
+        if self._group is not None:
+            yield
+            return
+        self._group = ([], [])
+        try:
+            with self.deck.document.batch():
+                yield
+        finally:
+            deltas, entries = self._group
+            self._group = None
+            if deltas:
+                self._record(_Group(deltas), {"op": "group", "ops": entries})
+
+    def open_deck(self, pptx_path):
+        """Replace the deck's slides with those of `pptx_path`; clears the history."""
+        pptx_path = os.path.abspath(pptx_path)
+        self.deck.load(pptx_path)
+        self._undo.clear()
+        self._redo.clear()
+        self.current_bytes = 0
+        if self._log is not None:
+            # Earlier entries were edits to a deck that is gone
+            self._log.truncate(0)
+        self._start_over([])
+        self._write({"op": "open", "path": pptx_path})
+
+    def mark(self):
+        """Return the log position of the deck as it is now, for `checkpoint`."""
+        return (self._generation, len(self._lines))
+
+    def checkpoint(self, pptx_path, mark=None):
+        """Start the log over from `pptx_path`, the deck as it was at `mark`.
+
+        Call it once the deck has been saved to `pptx_path`, with the `mark`
+        taken when the save started (default: now); edits logged since then
+        are kept. The undo history is kept as well, but only as far as the
+        new log can replay it. Returns False if the log was started over by
+        an open in between, and the checkpoint was skipped.
+        """
+        generation, start = mark or self.mark()
+        if generation != self._generation:
+            return False
+        pptx_path = os.path.abspath(pptx_path)
+        lines = self._lines[start:]
+        undoable = redoable = 0
+        replayable = True
+        for entry in lines:
+            if entry["op"] == "undo":
+                replayable = replayable and undoable > 0
+                undoable, redoable = undoable - 1, redoable + 1
+            elif entry["op"] == "redo":
+                replayable = replayable and redoable > 0
+                undoable, redoable = undoable + 1, redoable - 1
+            else:
+                undoable, redoable = undoable + 1, 0
+        self._start_over(lines)
+        self._undoable = min(max(undoable, 0), len(self._undo))
+        self._redoable = min(max(redoable, 0), len(self._redo))
+        if self.path:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as log_file:
+                for entry in [{"op": "open", "path": pptx_path}, *lines]:
+                    log_file.write(json.dumps(entry) + "\n")
+            if self._log is not None:
+                self._log.close()
+            os.replace(tmp_path, self.path)
+            self._log = open(self.path, "a", encoding="utf-8")
+            if not replayable:
+                # An undo in `lines` reaches back before the save
+                self._pause()
+            self._prune_blobs()
+        return True
+
+    def add_slide(self):
+        slide = self.deck.add_slide()
+        self._record(_SlideAdded(slide.slide_id), {"op": "add_slide"})
+        return slide
+
+    def delete_slide(self, slide_id):
+        detached = self.deck.slides.detach(slide_id)
+        self._record(_SlideDeleted(detached), {"op": "delete", "slide": slide_id})
+
+    def move_slide(self, slide_id, new_index):
+        old_index = self.deck.slides.index_of(slide_id)
+        self.deck.slides.move(slide_id, new_index)
+        new_index = self.deck.slides.index_of(slide_id)
+        self._record(_SlideMoved(slide_id, old_index, new_index),
+                     {"op": "move", "slide": slide_id, "index": new_index})
+
+    def duplicate_slide(self, slide_id):
+        duplicate = self.deck.slides.duplicate(slide_id)
+        self._record(_SlideAdded(duplicate.slide_id), {"op": "duplicate", "slide": slide_id})
+        return duplicate
+
+    def set_background(self, slide_id, image_path):
+        digest = self._store_blob(image_path)
+        before = self.deck.record(slide_id).background
+        picture = self.deck.set_background(self.deck.slides.slide(slide_id), image_path)
+        after = ImageRef(digest, image_path)
+        self._record(_ShapeAdded(slide_id, picture.shape_id, "background", before, after),
+                     {"op": "background", "slide": slide_id, "image": digest})
+        return picture
+
+    def add_text(self, slide_id, text, style=None):
+        before = self.deck.record(slide_id).texts
+        shape = self.deck.add_text(self.deck.slides.slide(slide_id), text, style)
+        after = self.deck.record(slide_id).texts
+        self._record(_ShapeAdded(slide_id, shape.shape_id, "texts", before, after,
+                                 _SMALL_DELTA + len(text)),
+                     {"op": "text", "slide": slide_id, "text": text, "style": _style_entry(style)})
+        return shape
+
+    def set_theme(self, theme):
+        """Switch the deck to `theme`; see `Deck.apply_theme`."""
+        entry = None
+        if theme is not None:
+            entry = theme.to_dict()
+            if theme.background:
+                entry["background"] = self._store_blob(theme.background)
+        before = self.deck.theme
+        self.deck.apply_theme(theme)
+        self._record(_ThemeChanged(before, theme), {"op": "theme", "theme": entry})
+
+    def clear_slide(self, slide_id):
+        record = self.deck.record(slide_id)
+        background, texts = record.background, record.texts
+        shapes = self.deck.clear_slide(self.deck.slides.slide(slide_id))
+        self._record(_SlideCleared(slide_id, shapes, background, texts),
+                     {"op": "clear", "slide": slide_id})
+
+    def add_passages(self, verse_store, references, translation, style=None, split=True, fits=None):
+        """Add slides for a reference list as one undo step; see `Deck.add_passages`.
+
+        The log records the resulting slides and text, not the references, so
+        replaying it does not need the verse store.
+        """
+        pages = self.deck.paginate_passages(verse_store, references, translation, style, split, fits)
+        added = []
+        with self.group():
+            for text in pages:
+                slide = self.add_slide()
+                self.add_text(slide.slide_id, text, style)
+                added.append((slide, text))
+        return added
+
+    def close(self, remove=False):
+        """Stop logging; with `remove`, delete the log and its pictures."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if remove and self.path:
+            for path in (self.path, *self._blob_paths()):
+                if os.path.exists(path):
+                    os.remove(path)
+            if os.path.isdir(self.blob_dir):
+                os.rmdir(self.blob_dir)
+
+    def _record(self, delta, entry):
+        if self._group is not None:
+            self._group[0].append(delta)
+            self._group[1].append(entry)
+            return
+        self._undo.append(delta)
+        self.current_bytes += delta.size
+        self._redo.clear()
+        while self.current_bytes > self.max_bytes and len(self._undo) > 1:
+            self.current_bytes -= self._undo.popleft().size
+        self._undoable = min(self._undoable + 1, len(self._undo))
+        self._redoable = 0
+        self._write(entry)
+
+    def _write(self, entry):
+        if entry["op"] != "open":
+            self._lines.append(entry)
+        if self._log is not None and not self._paused:
+            self._log.write(json.dumps(entry) + "\n")
+            self._log.flush()
+
+    def _start_over(self, lines):
+        self._lines = list(lines)
+        self._generation += 1
+        self._undoable = self._redoable = 0
+        self._paused = False
+
+    def _pause(self):
+        """Empty the log, which can no longer replay to the deck, until the next checkpoint.
+
+        Recovery then starts from the last saved file.
+        """
+        if self._log is not None and not self._paused:
+            self._log.truncate(0)
+        self._paused = True
+
+    def _prune_blobs(self):
+        """Delete the pictures neither the log nor the deck or its history refers to."""
+        keep = set()
+        entries = list(self._lines)
+        while entries:
+            entry = entries.pop()
+            if entry["op"] == "group":
+                entries.extend(entry["ops"])
+            elif entry["op"] == "background":
+                keep.add(entry["image"])
+            elif entry["op"] == "theme" and entry["theme"] and entry["theme"].get("background"):
+                keep.add(entry["theme"]["background"])
+        blob_dir = os.path.abspath(self.blob_dir)
+        for image_path in self._images_in_use():
+            if image_path and os.path.dirname(os.path.abspath(image_path)) == blob_dir:
+                keep.add(os.path.basename(image_path))
+        for blob_path in self._blob_paths():
+            if os.path.basename(blob_path) not in keep:
+                os.remove(blob_path)
+
+    def _images_in_use(self):
+        """Paths of the pictures shown by the deck or restored by its undo history."""
+        document = self.deck.document
+        refs = [record.background for record in document]
+        refs.append(document.theme_background)
+        themes = [self.deck.theme]
+        deltas = [*self._undo, *self._redo]
+        while deltas:
+            delta = deltas.pop()
+            if isinstance(delta, _Group):
+                deltas.extend(delta.deltas)
+            elif isinstance(delta, _ThemeChanged):
+                themes.extend((delta.before, delta.after))
+            elif isinstance(delta, _ShapeAdded) and delta.field == "background":
+                refs.extend((delta.before, delta.after))
+            elif isinstance(delta, _SlideCleared):
+                refs.append(delta.background)
+            elif getattr(delta, "detached", None) is not None and delta.detached.record:
+                refs.append(delta.detached.record.background)
+        paths = [ref.path for ref in refs if ref is not None]
+        paths.extend(theme.background for theme in themes if theme is not None)
+        return paths
+
+    def _apply(self, entry):
+        op = entry["op"]
+        if op == "undo":
+            self.undo()
+        elif op == "redo":
+            self.redo()
+        elif op == "group":
+            with self.group():
+                for child in entry["ops"]:
+                    self._apply(child)
+        elif op == "open":
+            self.open_deck(entry["path"])
+        elif op == "add_slide":
+            self.add_slide()
+        elif op == "delete":
+            self.delete_slide(entry["slide"])
+        elif op == "move":
+            self.move_slide(entry["slide"], entry["index"])
+        elif op == "duplicate":
+            self.duplicate_slide(entry["slide"])
+        elif op == "background":
+            self.set_background(entry["slide"], os.path.join(self.blob_dir, entry["image"]))
+        elif op == "text":
+            style = TextStyle(*entry["style"]) if entry["style"] else None
+            self.add_text(entry["slide"], entry["text"], style)
+        elif op == "clear":
+            self.clear_slide(entry["slide"])
+        elif op == "theme":
+            theme = Theme.from_dict(entry["theme"]) if entry["theme"] else None
+            if theme is not None and theme.background:
+                theme.background = os.path.join(self.blob_dir, theme.background)
+            self.set_theme(theme)
+        else:
+            raise ValueError(f"Unknown journal entry: {op}")
+
+    def _store_blob(self, image_path):
+        digest, data = default_cache().blob(image_path)
+        if self.path:
+            blob_path = os.path.join(self.blob_dir, digest)
+            if not os.path.exists(blob_path):
+                os.makedirs(self.blob_dir, exist_ok=True)
+                tmp_path = f"{blob_path}.tmp"
+                with open(tmp_path, "wb") as blob_file:
+                    blob_file.write(data)
+                os.replace(tmp_path, blob_path)
+        return digest
+
+    def _blob_paths(self):
+        if not os.path.isdir(self.blob_dir):
+            return []
+        return [os.path.join(self.blob_dir, name) for name in os.listdir(self.blob_dir)]
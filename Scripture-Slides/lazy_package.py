@@ -0,0 +1,213 @@
+"""Open existing .pptx files without reading or parsing every part up front.
+
+python-pptx reads every member of the zip into memory and parses every XML
+part when a presentation is opened, which for a large archive deck means
+loading all of its pictures and videos just to list the slides. Here only
+the small structural parts (the presentation, masters, layouts, themes and
+relationship files) are parsed at open. Slide XML is kept as raw bytes and
+parsed the first time the slide is used, and binary parts such as pictures
+and media are read from the file again whenever their bytes are needed,
+so they never stay in memory.
+
+The source file is kept open while the deck is in use; `PackageSource.close`
+releases it, e.g. so the deck can be saved over it, and the next read opens
+it again.
+"""
+import threading
+import zipfile
+
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.oxml import parse_xml
+from pptx.opc.package import PartFactory, _PackageLoader
+from pptx.opc.packuri import PACKAGE_URI
+from pptx.package import Package
+
+# Parts parsed on first use instead of at open
+_LAZY_XML_TYPES = (CT.PML_SLIDE, CT.PML_NOTES_SLIDE)
+
+
+class PackageSource:
+    """Thread-safe, on-demand access to the members of a zip package."""
+
+    def __init__(self, path):
+        self.path = path
+        self._zip = None
+        self._lock = threading.Lock()
+
+    def __contains__(self, pack_uri):
+        with self._lock:
+            return pack_uri.membername in self._open().NameToInfo
+
+    def __getitem__(self, pack_uri):
+        return self.read(pack_uri.membername)
+
+    def read(self, member):
+        with self._lock:
+            return self._open().read(member)
+
+    def size(self, member):
+        """Uncompressed size of `member`, from the zip directory."""
+        with self._lock:
+            return self._open().getinfo(member).file_size
+
+    def rels_xml_for(self, partname):
+        member = partname.rels_uri.membername
+        with self._lock:
+            zip_file = self._open()
+            return zip_file.read(member) if member in zip_file.NameToInfo else None
+
+    def close(self):
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+    def _open(self):
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.path, "r")
+        return self._zip
+
+
+class _LazyXml:
+    """Mixin for XML parts parsed from their raw bytes on first use."""
+
+    _raw = None
+
+    @classmethod
+    def load_lazy(cls, partname, content_type, package, raw):
+        part = cls.__new__(cls)
+        part._partname = partname
+        part._content_type = content_type
+        part._package = package
+        part._blob = None
+        part._raw = raw
+        return part
+
+    @property
+    def is_parsed(self):
+        return "_parsed" in self.__dict__
+
+    @property
+    def _element(self):
+        element = self.__dict__.get("_parsed")
+        if element is None:
+            element = self.__dict__["_parsed"] = parse_xml(self._raw)
+            self._raw = None
+        return element
+
+    @_element.setter
+    def _element(self, element):
+        self.__dict__["_parsed"] = element
+        self._raw = None
+
+    @property
+    def blob(self):
+        # An unparsed part is saved exactly as it was read
+        return self._raw if not self.is_parsed else super(_LazyXml, self).blob
+
+
+class _LazyBlob:
+    """Mixin for binary parts whose bytes are read from the source each time."""
+
+    _data = None
+    _source = None
+    _member = None
+
+    @classmethod
+    def load_lazy(cls, partname, content_type, package, source):
+        part = cls(partname, content_type, package, None)
+        part._source = source
+        part._member = partname.membername
+        return part
+
+    @property
+    def is_loaded(self):
+        return self._data is not None
+
+    @property
+    def blob_size(self):
+        """Size of the bytes without reading them."""
+        return len(self._data) if self._data is not None else self._source.size(self._member)
+
+    def read_blob(self):
+        return self._blob
+
+    @property
+    def _blob(self):
+        return self._data if self._data is not None else self._source.read(self._member)
+
+    @_blob.setter
+    def _blob(self, blob):
+        self._data = blob
+
+
+_lazy_classes = {}
+
+
+def _lazy_class(mixin, part_class):
+    key = (mixin, part_class)
+    lazy_class = _lazy_classes.get(key)
+    if lazy_class is None:
+        lazy_class = _lazy_classes[key] = type(f"Lazy{part_class.__name__}", (mixin, part_class), {})
+    return lazy_class
+
+
+def is_lazy_blob(part):
+    """Whether `part` reads its bytes from the source file on demand."""
+    return isinstance(part, _LazyBlob) and not part.is_loaded
+
+
+class _LazyPackageLoader(_PackageLoader):
+    def __init__(self, source, package):
+        super(_LazyPackageLoader, self).__init__(source.path, package)
+        self._source = source
+
+    @property
+    def _package_reader(self):
+        return self._source
+
+    @property
+    def _parts(self):
+        parts = self.__dict__.get("_lazy_parts")
+        if parts is not None:
+            return parts
+        content_types = self._content_types
+        package = self._package
+        source = self._source
+        parts = {}
+        for partname in self._xml_rels:
+            if partname == PACKAGE_URI or partname not in source:
+                continue
+            content_type = content_types[partname]
+            part_class = PartFactory._part_cls_for(content_type)
+            if content_type in _LAZY_XML_TYPES:
+                parts[partname] = _lazy_class(_LazyXml, part_class).load_lazy(
+                    partname, content_type, package, source[partname])
+            elif not content_type.endswith("xml"):
+                parts[partname] = _lazy_class(_LazyBlob, part_class).load_lazy(
+                    partname, content_type, package, source)
+            else:
+                parts[partname] = PartFactory(partname, content_type, package, source[partname])
+        self.__dict__["_lazy_parts"] = parts
+        return parts
+
+
+class _LazyPackage(Package):
+    def __init__(self, source):
+        super(_LazyPackage, self).__init__(source.path)
+        self.source = source
+
+    def _load(self):
+        pkg_xml_rels, parts = _LazyPackageLoader(self.source, self)._load()
+        self._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
+        return self
+
+
+def open_presentation(path):
+    """Open the .pptx at `path` lazily; return `(presentation, source)`."""
+    source = PackageSource(path)
+    main_part = _LazyPackage(source)._load().main_document_part
+    if not hasattr(main_part, "presentation"):
+        source.close()
+        raise ValueError(f"{path} is not a PowerPoint presentation")
+    return main_part.presentation, source
@@ -0,0 +1,285 @@
+"""Full-screen output window for projecting slides live.
+
+A slide is shown as two layers: its background picture, scaled to the output
+screen once and shared by every slide that uses it, and its text, laid out by
+`text_layout` like the text frames in the saved deck. The layers of the
+current slide and its neighbours are kept in memory, so stepping to the next
+or previous slide only swaps which layers are painted. A live text edit
+redraws the text layer alone, over the background already on screen.
+
+The time from an input (a key press or a list selection) to the end of the
+paint that shows its result is measured for every change.
+"""
+import statistics
+import time
+from collections import OrderedDict, deque
+
+from PyQt5.QtCore import QPointF, QRect, QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QFontMetricsF, QPainter, QPixmap
+from PyQt5.QtWidgets import QApplication, QWidget
+
+from deck import SLIDE_WIDTH
+from image_cache import default_cache, to_qpixmap
+from text_layout import LINE_SPACING, SLIDE_TEXT_BOX, TEXT_INSETS, TextStyle, layout_text
+
+OUTPUT_ASPECT = 9 / 16
+MAX_BACKGROUNDS = 8  # distinct background pictures kept scaled for the screen
+
+_NEXT_KEYS = (Qt.Key_Right, Qt.Key_Down, Qt.Key_PageDown, Qt.Key_Space)
+_PREVIOUS_KEYS = (Qt.Key_Left, Qt.Key_Up, Qt.Key_PageUp, Qt.Key_Backspace)
+
+
+class LatencyCounter:
+    """Input-to-display times of the most recent slide changes, in milliseconds."""
+
+    def __init__(self, samples=120):
+        self.samples = deque(maxlen=samples)
+
+    def record(self, latency_ms):
+        self.samples.append(latency_ms)
+
+    @property
+    def last(self):
+        return self.samples[-1] if self.samples else None
+
+    @property
+    def median(self):
+        return statistics.median(self.samples) if self.samples else None
+
+    @property
+    def worst(self):
+        return max(self.samples) if self.samples else None
+
+    def summary(self):
+        if not self.samples:
+            return "Latency: -"
+        return (f"Latency: {self.last:.1f} ms "
+                f"(median {self.median:.1f}, worst {self.worst:.1f})")
+
+
+class _Frame:
+    """The layers of one slide at output resolution; either may be None."""
+
+    __slots__ = ("background", "text")
+
+    def __init__(self, background, text):
+        self.background = background
+        self.text = text
+
+
+def output_screens():
+    """Return the connected screens, the one to project on (not the primary, if possible) first."""
+    app = QApplication.instance()
+    primary = app.primaryScreen()
+    return sorted(app.screens(), key=lambda screen: screen is primary)
+
+
+def render_text_layer(size, text, style=None, box=None):
+    """Draw `text` in `box` on a transparent pixmap of `size` (width, height)."""
+    width, height = size
+    layer = QPixmap(width, height)
+    layer.fill(Qt.transparent)
+    if not text:
+        return layer
+    style = style or TextStyle()
+    box = box or SLIDE_TEXT_BOX
+    layout = layout_text(text, style, box)
+    scale = width / (SLIDE_WIDTH * 72)  # output pixels per point
+
+    font = QFont(style.name)
+    font.setPixelSize(max(1, round(layout.size * scale)))
+    font.setBold(style.bold)
+    left, top, _, _ = box
+    x = (left + TEXT_INSETS[0]) * 72 * scale
+    y = (top + TEXT_INSETS[1]) * 72 * scale + QFontMetricsF(font).ascent()
+
+    painter = QPainter(layer)
+    painter.setRenderHint(QPainter.TextAntialiasing)
+    painter.setFont(font)
+    painter.setPen(QColor(*style.color))
+    for line in layout.lines:
+        painter.drawText(QPointF(x, y), line)
+        y += layout.size * LINE_SPACING * scale
+    painter.end()
+    return layer
+
+
+class LiveOutputWindow(QWidget):
+    """Frameless full-screen window showing one slide of a `Document`.
+
+    `load_slide(slide_id)` reads a slide of a lazily opened deck that has not
+    been read yet, e.g. `Deck.load_slide`.
+    """
+
+    closed = pyqtSignal()
+    advanceRequested = pyqtSignal(int)  # +1 for the next slide, -1 for the previous one
+    frameShown = pyqtSignal(float)  # input-to-display latency in ms
+
+    def __init__(self, document, load_slide=None, parent=None):
+        super(LiveOutputWindow, self).__init__(parent, Qt.Window | Qt.FramelessWindowHint)
+        self.setWindowTitle("Scripture Slides Output")
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.setAttribute(Qt.WA_NoSystemBackground)
+        self.setCursor(Qt.BlankCursor)
+        self.document = document
+        self.load_slide = load_slide
+        self.latency = LatencyCounter()
+        self.slide_id = None
+        self._frame = None
+        self._frames = {}
+        self._backgrounds = OrderedDict()  # image digest -> scaled QPixmap
+        self._neighbours = ()
+        self._loading = None  # slide being read for `_compose`
+        self._input_started = None
+        self._key_pressed = None
+        self._size = (1280, 720)
+
+    def show_on(self, screen):
+        """Cover `screen` with the output."""
+        self.winId()  # the native window must exist to be moved to a screen
+        self.windowHandle().setScreen(screen)
+        self.setGeometry(screen.geometry())
+        size = screen.size() * screen.devicePixelRatio()
+        self._set_frame_size(size.width(), size.height())
+        self.showFullScreen()
+
+    def show_slide(self, slide_id, neighbours=(), started=None):
+        """Show `slide_id` and prepare `neighbours` in the background.
+
+        `started` is the `time.perf_counter()` of the input that asked for
+        the change; it defaults to a key press on this window, or now.
+        """
+        self._input_started = self._key_pressed or started or time.perf_counter()
+        self._key_pressed = None
+        self.slide_id = slide_id
+        self._frame = self._frames.get(slide_id) or self._compose(slide_id)
+        self._frames[slide_id] = self._frame
+        self._neighbours = tuple(neighbours)
+        self.update()
+
+    def set_live_text(self, text, style=None, box=None):
+        """Replace the text of the shown slide, keeping its background layer."""
+        if self._frame is None:
+            return
+        self._input_started = time.perf_counter()
+        text_layer = render_text_layer(self._size, text, style, box)
+        self._frame = _Frame(self._frame.background, text_layer)
+        self._frames.pop(self.slide_id, None)  # the saved slide looks different
+        self.update()
+
+    def invalidate(self, slide_id):
+        """Drop the layers of `slide_id` after it changed; redraw it if shown."""
+        if slide_id == self._loading:
+            return  # `_compose` is drawing it from what was just read
+        self._frames.pop(slide_id, None)
+        if slide_id == self.slide_id:
+            if self.document.get(slide_id) is None:
+                self._frame = _Frame(None, None)
+                self.update()
+            else:
+                self.show_slide(slide_id, self._neighbours, time.perf_counter())
+
+    def invalidate_all(self):
+        """Drop the layers of every slide, e.g. after a theme change; redraw the shown one."""
+        self._frames.clear()
+        if self.slide_id is not None:
+            self.invalidate(self.slide_id)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        rect = self._slide_rect()
+        frame = self._frame
+        if rect != self.rect():
+            painter.fillRect(self.rect(), Qt.black)  # letterbox bars
+        if frame is None or frame.background is None:
+            painter.fillRect(rect, Qt.black if frame is None else Qt.white)
+        else:
+            painter.drawPixmap(rect, frame.background)
+        if frame is not None and frame.text is not None:
+            painter.drawPixmap(rect, frame.text)
+        painter.end()
+
+        if self._input_started is not None:
+            latency_ms = (time.perf_counter() - self._input_started) * 1000
+            self._input_started = None
+            self.latency.record(latency_ms)
+            self.frameShown.emit(latency_ms)
+        if self._neighbours:
+            # After the frame is on screen, not before
+            QTimer.singleShot(0, self._prepare_neighbours)
+
+    def keyPressEvent(self, event):
+        if event.key() in _NEXT_KEYS:
+            self._key_pressed = time.perf_counter()
+            self.advanceRequested.emit(1)
+        elif event.key() in _PREVIOUS_KEYS:
+            self._key_pressed = time.perf_counter()
+            self.advanceRequested.emit(-1)
+        elif event.key() == Qt.Key_Escape:
+            self.close()
+        else:
+            super(LiveOutputWindow, self).keyPressEvent(event)
+
+    def closeEvent(self, event):
+        self.closed.emit()
+        super(LiveOutputWindow, self).closeEvent(event)
+
+    def _slide_rect(self):
+        """The largest 16:9 rectangle centred in the window."""
+        width = min(self.width(), round(self.height() / OUTPUT_ASPECT))
+        height = round(width * OUTPUT_ASPECT)
+        return QRect((self.width() - width) // 2, (self.height() - height) // 2, width, height)
+
+    def _set_frame_size(self, width, height):
+        width = min(width, round(height / OUTPUT_ASPECT))
+        size = (width, round(width * OUTPUT_ASPECT))
+        if size != self._size:
+            self._size = size
+            self._frames.clear()
+            self._backgrounds.clear()
+
+    def _prepare_neighbours(self):
+        """Compose one missing neighbour per event-loop pass, then drop other frames.
+
+        Going one at a time keeps input handled between compositions.
+        """
+        missing = [slide_id for slide_id in self._neighbours
+                   if slide_id not in self._frames and self.document.get(slide_id) is not None]
+        if missing:
+            self._frames[missing[0]] = self._compose(missing[0])
+            if len(missing) > 1:
+                QTimer.singleShot(0, self._prepare_neighbours)
+                return
+        keep = {self.slide_id, *self._neighbours}
+        self._frames = {slide_id: frame for slide_id, frame in self._frames.items()
+                        if slide_id in keep}
+        self._neighbours = ()
+
+    def _compose(self, slide_id):
+        record = self.document.get(slide_id)
+        if record is None:
+            return _Frame(None, None)
+        if not record.loaded and self.load_slide is not None:
+            self._loading = slide_id
+            try:
+                self.load_slide(slide_id)
+            finally:
+                self._loading = None
+        appearance = self.document.appearance(record)
+        text = None
+        if appearance.text:
+            text = render_text_layer(self._size, appearance.text, appearance.style, appearance.box)
+        return _Frame(self._background(appearance.background), text)
+
+    def _background(self, image_ref):
+        if image_ref is None:
+            return None
+        pixmap = self._backgrounds.get(image_ref.digest)
+        if pixmap is None:
+            pixmap = to_qpixmap(default_cache().variant(image_ref.path, self._size))
+            self._backgrounds[image_ref.digest] = pixmap
+            while len(self._backgrounds) > MAX_BACKGROUNDS:
+                self._backgrounds.popitem(last=False)
+        else:
+            self._backgrounds.move_to_end(image_ref.digest)
+        return pixmap
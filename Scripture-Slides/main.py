@@ -1,22 +1,27 @@
+import time
+_STARTED = time.perf_counter()
+
+import multiprocessing
 import sys
 import os
-import time
 import warnings
 from PyQt5.QtWidgets import (QMainWindow, QApplication, QFileDialog, QFontComboBox, QPushButton,
-                             QListWidget, QColorDialog, QGraphicsScene, QGraphicsTextItem, QGraphicsView, QTextEdit, QMenu)
-from PyQt5.QtGui import QFont, QColor, QPixmap, QBrush, QIcon, QTextCursor, QTextCharFormat
-from PyQt5.uic import loadUi
-from PyQt5.QtCore import Qt, pyqtSignal
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
+                             QListWidget, QListWidgetItem, QProgressDialog, QShortcut, QColorDialog, QGraphicsScene, QGraphicsTextItem, QGraphicsView, QTextEdit, QMenu)
+from PyQt5.QtGui import QFont, QColor, QKeySequence, QPixmap, QBrush, QIcon, QTextCursor, QTextCharFormat, QTextOption
+from PyQt5 import sip
+from PyQt5.QtCore import Qt, QEvent, QObject, QTimer, pyqtSignal
 from PyQt5.QtWidgets import QGraphicsPixmapItem, QDialog, QLabel, QVBoxLayout, QPushButton, QSpinBox # Added for DraggableImageItem
-import win32com.client as win32
-import msvcrt
 
 warnings.simplefilter("ignore", DeprecationWarning)
 
-from PIL import Image, ImageDraw, ImageFont
+# python-pptx, PIL and SQLite are imported on first use, not at startup
+import instrumentation
+from instrumentation import count, gauge, traced
+from slide_list_model import SlideListModel
+from references import ReferenceParseError, format_verses, parse_references
+from ui_loader import setup_ui
+
+_LINE_SEPARATOR = "\u2028"  # a line break within a paragraph in a QTextDocument
 
 class DraggableTextItem(QGraphicsTextItem):
     def __init__(self, text):
@@ -25,125 +30,312 @@ class DraggableTextItem(QGraphicsTextItem):
         self.setFlag(QGraphicsTextItem.ItemIsMovable, True)      # Enable dragging
         self.setFlag(QGraphicsTextItem.ItemIsSelectable, True)   # Enable selection
 
+    def sceneEvent(self, event):
+        # The text keeps no undo history (see add_text_item), so let Undo and
+        # Redo reach the Edit menu instead of doing nothing here
+        if event.type() == QEvent.ShortcutOverride and (
+                event.matches(QKeySequence.Undo) or event.matches(QKeySequence.Redo)):
+            event.ignore()
+            return True
+        return super().sceneEvent(event)
+
 class DraggableImageItem(QGraphicsPixmapItem):  # QGraphicsPixmapItem imported here
     def __init__(self, pixmap):
         super().__init__(pixmap)
         self.setFlags(QGraphicsPixmapItem.ItemIsMovable | QGraphicsPixmapItem.ItemIsSelectable)
 
+def show_pixmap(scene, view, item, pixmap):
+    """Show `pixmap` fitted in `view`, reusing `item` when it is still in `scene`.
+
+    Swapping the pixmap of the existing item avoids tearing down and rebuilding
+    the scene on every selection change. Returns the item now showing it.
+    """
+    if item is None or sip.isdeleted(item) or item.scene() is not scene or len(scene.items()) != 1:
+        scene.clear()
+        item = scene.addPixmap(pixmap)
+        item.setTransformationMode(Qt.SmoothTransformation)
+    else:
+        item.setPixmap(pixmap)
+    scene.setSceneRect(item.boundingRect())
+    view.fitInView(item, Qt.KeepAspectRatio)
+    return item
+
+
 class VerseRepeatWindow(QDialog):
-    def __init__(self, parent=None):
+    versesChosen = pyqtSignal(list)  # [(reference, text), ...]
+    passagesRequested = pyqtSignal(str, str, bool)  # references, translation, split long passages
+
+    def __init__(self, parent=None, verse_store=None):
         super(VerseRepeatWindow, self).__init__(parent)
         self.setWindowTitle("Add Verse")
 
         # Load the UI file for the VerseRepeatWindow (optional if you don't have one)
-        loadUi("Scripture-Slides/AddVerse.ui", self)
+        setup_ui(self, "AddVerse.ui")
+
+        self.verse_store = verse_store
+        self.lineEditReference.setPlaceholderText("John 3:16 or a phrase")
+        self.lineEditReference.textChanged.connect(lambda: self.search_verses())
+        self.FontComboBox.currentTextChanged.connect(lambda: self.search_verses())
+        self.addButton.clicked.connect(lambda: self.confirm_verses())
+        self.cancelButton.clicked.connect(self.reject)
+
+    @traced("ui.search_verses")
+    def search_verses(self):
+        """Look up the typed reference, or search for it as a phrase."""
+        self.resultsListWidget.clear()
+        query = self.lineEditReference.text().strip()
+        if not self.verse_store or not query:
+            return
+
+        translation = self.FontComboBox.currentText()
+        try:
+            passages = self.verse_store.passages(translation, parse_references(query))
+            verses = [verse for passage in passages for verse in passage]
+        except ReferenceParseError:
+            verses = self.verse_store.search(translation, query) if len(query) >= 3 else []
+
+        for verse in verses:
+            reference, text = format_verses([verse]), verse[3]
+            item = QListWidgetItem(f"{reference}  {text}")
+            item.setData(Qt.UserRole, (reference, text))
+            self.resultsListWidget.addItem(item)
+
+    @traced("ui.confirm_verses")
+    def confirm_verses(self):
+        """Send the selected verses, or the whole typed reference, to the main window."""
+        items = self.resultsListWidget.selectedItems()
+        query = self.lineEditReference.text().strip()
+        if not items and query:
+            try:
+                parse_references(query)
+            except ReferenceParseError:
+                pass
+            else:
+                # A reference list becomes slides in one batch
+                self.passagesRequested.emit(query, self.FontComboBox.currentText(),
+                                            self.checkBox.isChecked())
+                self.accept()
+                return
+        if not items:
+            items = [self.resultsListWidget.item(row) for row in range(self.resultsListWidget.count())]
+        if items:
+            self.versesChosen.emit([item.data(Qt.UserRole) for item in items])
+        self.accept()
 
 class SlideShowWindow(QMainWindow):
     closed = pyqtSignal()
 
     def __init__(self, parent=None):
         super(SlideShowWindow, self).__init__(parent)
-        loadUi("Scripture-Slides/SlideShowWindow.ui", self)
+        setup_ui(self, "SlideShowWindow.ui")
         
         self.backButton.clicked.connect(self.close)
 
         # Initialize QGraphicsScene and other attributes needed for live edit
         self.scene = QGraphicsScene(self.graphicsView)
         self.graphicsView.setScene(self.scene)
+        self.preview_item = None
         
         # Track currently selected slide and previews
         self.current_slide_index = None
         self.slide_previews = {}
-
-        # Connect buttons for live editing
-        self.LiveEditBtn.clicked.connect(self.enter_live_edit_mode)
-        self.LiveBtn.clicked.connect(self.apply_live_changes)
+        self.slide_model = SlideListModel(self)
+        self.slideListWidget.setModel(self.slide_model)
+        self.slideListWidget.selectionModel().currentChanged.connect(
+            lambda current, previous: self.display_slide_in_graphics_view())
+        # Unread slides of an opened deck are read as they scroll into view
+        self.slide_model.previewWanted.connect(parent.want_slide)
+
+        # Live output: LiveBtn projects the selected slide on the chosen
+        # screen, LiveEditBtn pushes the text box to it while typing
+        self.output = None
+        self.live_slide_id = None
+        self.LiveEditBtn.clicked.connect(self.toggle_live_edit)
+        self.LiveBtn.clicked.connect(self.toggle_live_output)
+        self.fill_screen_choices()
 
         # New text box for copying/pasting text
         self.textInputBox = QTextEdit(self)
         self.textInputBox.setPlaceholderText("Copy and paste text here...")
         self.textInputBox.setFixedHeight(100)
+        self.textInputBox.textChanged.connect(self.push_live_text)
         layout = QVBoxLayout(self.graphicsView)
         layout.addWidget(self.textInputBox)
         self.setLayout(layout)
-    
-    def enter_live_edit_mode(self):
-        """Enable live editing of the selected slide."""
-        selected_items = self.slideListWidget.selectedItems()
-        if selected_items:
-            selected_item = selected_items[0].text()
-            print(f"Entering live edit mode for {selected_item}")
-
-            # Enable text and image items to be moved and edited
-            for item in self.scene.items():
-                if isinstance(item, (DraggableTextItem, DraggableImageItem)):
-                    item.setFlag(QGraphicsTextItem.ItemIsMovable, True)
 
-    def apply_live_changes(self):
-        """Apply live changes to the selected slide in the PowerPoint file."""
-        selected_items = self.slideListWidget.selectedItems()
-        if selected_items:
-            selected_item = selected_items[0].text()
-            selected_index = int(selected_item.split(" ")[1]) - 1
-            slide = self.parent().prs.slides[selected_index]
-            
-            # Clear existing shapes on the slide
-            for shape in slide.shapes:
-                sp = shape._element
-                sp.getparent().remove(sp)
+    def current_slide_id(self):
+        """Return the slide ID of the selected list entry, or None."""
+        return self.slide_model.slide_id(self.slideListWidget.currentIndex().row())
+
+    def fill_screen_choices(self):
+        """List the screens the output can go to, a secondary one first."""
+        from live_output import output_screens
 
-            # Add copied text from the input box to slide
-            pasted_text = self.textInputBox.toPlainText()
-            text_item = DraggableTextItem(pasted_text)
-            text_item.setFont(QFont("Arial", 20))
-            self.scene.addItem(text_item)
+        self.screenComboBox.clear()
+        for screen in output_screens():
+            self.screenComboBox.addItem(screen.name(), screen)
 
-            # Save preview and update slide
-            self.parent().save_slide_preview()
-            print(f"Changes applied to {selected_item}")
+    def toggle_live_output(self):
+        """Open the full-screen output on the chosen screen, or close it."""
+        if self.output is not None:
+            self.output.close()
+            return
+        from live_output import LiveOutputWindow, output_screens
+
+        screen = self.screenComboBox.currentData() or output_screens()[0]
+        self.output = LiveOutputWindow(self.parent().document, self.parent().deck.load_slide)
+        self.output.advanceRequested.connect(self.step_slide)
+        self.output.frameShown.connect(self.show_latency)
+        self.output.closed.connect(self.on_output_closed)
+        self.output.show_on(screen)
+        self.LiveBtn.setText("End Live")
+        self.show_live_slide()
+
+    def on_output_closed(self):
+        self.output = None
+        self.LiveBtn.setText("Go Live")
+
+    def show_live_slide(self, started=None):
+        """Put the selected slide on the output, with its neighbours made ready."""
+        row = self.slideListWidget.currentIndex().row()
+        slide_id = self.slide_model.slide_id(row)
+        if self.output is None or slide_id is None:
+            return
+        neighbours = [self.slide_model.slide_id(r) for r in (row + 1, row - 1)]
+        self.output.show_slide(slide_id, [n for n in neighbours if n is not None], started)
+
+    @traced("ui.step_slide")
+    def step_slide(self, offset):
+        """Select the slide `offset` rows away, e.g. from a key press on the output."""
+        row = self.slideListWidget.currentIndex().row() + offset
+        if 0 <= row < self.slide_model.rowCount():
+            self.slideListWidget.setCurrentIndex(self.slide_model.index(row))
+
+    def show_latency(self, latency_ms):
+        if self.output is not None:
+            self.latencyLabel.setText(self.output.latency.summary())
+
+    def live_appearance(self):
+        """The text style and box of the slide being edited live."""
+        parent = self.parent()
+        record = parent.document.get(self.live_slide_id)
+        if record is not None and record.texts:
+            _, _, style, box = parent.document.appearance(record)
+            return style, box
+        theme, style = parent.deck.theme, parent.slide_text_style()
+        if style is not None or theme is None:
+            return style or parent.current_text_style(), None
+        return theme.style, theme.box
+
+    def toggle_live_edit(self):
+        """Start editing the selected slide's text live, or apply the edit."""
+        if self.live_slide_id is not None:
+            self.apply_live_changes()
+            return
+        slide_id = self.current_slide_id()
+        if slide_id is None:
+            return
+        record = self.parent().document.get(slide_id)
+        self.textInputBox.setPlainText(record.text or "")
+        self.live_slide_id = slide_id
+        self.LiveEditBtn.setText("Apply Edit")
+        count("ui.live_edit")
+
+    @traced("ui.live_text")
+    def push_live_text(self):
+        """Show the text box on the output; only the text layer is redrawn."""
+        if self.live_slide_id is not None and self.output is not None:
+            self.output.set_live_text(self.textInputBox.toPlainText(), *self.live_appearance())
+
+    def stop_live_edit(self):
+        self.live_slide_id = None
+        self.LiveEditBtn.setText("Live Edit")
+
+    @traced("ui.apply_live_changes")
+    def apply_live_changes(self):
+        """Write the live-edited text to its slide as one undoable step.
+
+        Text that followed the theme keeps following it.
+        """
+        slide_id = self.live_slide_id
+        self.stop_live_edit()
+        record = self.parent().document.get(slide_id)
+        if record is None:
+            return
+        style = record.style if record.texts else self.parent().slide_text_style()
+        text = self.textInputBox.toPlainText()
+        background = record.background
+        journal = self.parent().journal
+        with journal.group():
+            journal.clear_slide(slide_id)
+            if background is not None:
+                journal.set_background(slide_id, background.path)
+            if text.strip():
+                journal.add_text(slide_id, text, style)
+        print(f"Changes applied to slide {slide_id}")
+
+    def on_document_changed(self, event):
+        """Redraw the output when the slide it shows, or a neighbour, changed."""
+        from document import SLIDES_RESET, THEME_CHANGED
+
+        if event.kind == SLIDES_RESET:
+            self.load_slide_previews(self.parent().ordered_slide_previews())
+        if self.output is not None:
+            if event.kind == THEME_CHANGED:
+                self.output.invalidate_all()
+            else:
+                self.output.invalidate(event.slide_id)
 
     def load_slide_previews(self, slide_previews):
-        """Load slide previews from the main window to display."""
+        """Load slide previews (slide ID -> image path or None, in deck order) to display."""
         self.slide_previews = slide_previews
         self.update_slide_list()
         
     def update_slide_list(self):
-        """Populate the slide list with preview images."""
-        self.slideListWidget.clear()
-        for slide_name in self.slide_previews:
-            self.slideListWidget.addItem(slide_name)
-        self.slideListWidget.itemSelectionChanged.connect(self.display_slide_in_graphics_view)
+        """Bring the thumbnail strip in line with the slide previews."""
+        self.slide_model.sync(self.slide_previews, self.slide_previews)
 
+    @traced("ui.slideshow_select")
     def display_slide_in_graphics_view(self):
-        """Display the selected slide in QGraphicsView."""
-        selected_items = self.slideListWidget.selectedItems()
-        if selected_items:
-            selected_item = selected_items[0].text()
-            image_path = self.slide_previews.get(selected_item)
+        """Display the selected slide in QGraphicsView and on the live output."""
+        started = time.perf_counter()
+        index = self.slideListWidget.currentIndex()
+        if index.isValid():
+            selected_item = index.data()
+            slide_id = index.data(SlideListModel.SlideIdRole)
+            if self.live_slide_id is not None and slide_id != self.live_slide_id:
+                self.stop_live_edit()  # an unapplied edit is dropped
+            self.show_live_slide(started)  # the projector first
+            image_path = self.slide_previews.get(slide_id)
             if image_path:
-                self.show_slide_preview(image_path)
+                self.show_slide_preview(image_path, slide_id)
+                self.prefetch_neighbours(index.row())
             else:
                 print(f"No preview available for {selected_item}")
                 
-    def show_slide_preview(self, image_path):
-        """Display an image in the QGraphicsView."""
-        pixmap = QPixmap(image_path)
-        self.scene.clear()
-        self.scene.addPixmap(pixmap)
-        self.graphicsView.fitInView(self.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
-        
-    def enter_live_edit_mode(self):
-        """Enable live editing of the selected slide."""
-        # Logic for entering live edit mode based on the selected slide
-        print("Entering live edit mode.")
-        # Additional code here for text/image manipulation in live edit mode
-        
-    def apply_live_changes(self):
-        """Apply live changes to the selected slide."""
-        print("Applying live changes to the slideshow.")
-        # Logic to save changes to the main slideshow (update presentation object, etc.)
+    def show_slide_preview(self, image_path, slide_id=None):
+        """Display a slide preview in the QGraphicsView at the view's resolution."""
+        from preview_cache import level_for
+
+        cache = self.parent().preview_cache
+        level = level_for(self.graphicsView.viewport().width(), self.devicePixelRatioF())
+        pixmap = cache.pixmap(slide_id, image_path, level)
+        self.preview_item = show_pixmap(self.scene, self.graphicsView, self.preview_item, pixmap)
+
+    def prefetch_neighbours(self, row, radius=2):
+        """Decode the previews around `row` in the background."""
+        from preview_cache import level_for
+
+        slide_ids = list(self.slide_previews)
+        neighbours = slide_ids[max(0, row - radius):row + radius + 1]
+        level = level_for(self.graphicsView.viewport().width(), self.devicePixelRatioF())
+        self.parent().preview_cache.prefetch(
+            [(slide_id, self.slide_previews[slide_id]) for slide_id in neighbours
+             if self.slide_previews[slide_id]], level)
         
     def closeEvent(self, event):
+        if self.output is not None:
+            self.output.close()
         # Emit the closed signal
         self.closed.emit()
         super(SlideShowWindow, self).closeEvent(event)
@@ -152,7 +344,7 @@ class ScriptureSlides(QMainWindow):
     def __init__(self):
         super(ScriptureSlides, self).__init__()
         self.setWindowFlags(Qt.Window | Qt.WindowMinimizeButtonHint | Qt.WindowCloseButtonHint)
-        loadUi("Scripture-Slides/ScriptureSlides.ui", self)
+        setup_ui(self, "ScriptureSlides.ui")
 
         self.setStyleSheet(""" 
                 QComboBox#fontComboBox {
@@ -192,24 +384,67 @@ class ScriptureSlides(QMainWindow):
         """)
 
         # Initialize presentation object and QGraphicsScene only once
-        self.prs = Presentation()
-        self.prs.slide_width = Inches(20)
-        self.prs.slide_height = Inches(11.25)
-        self.slide_count = 0
-        self.slide_previews = {}
+        # The deck, preview renderer and verse store are created on first use
+        self._deck = None
+        self._journal = None
+        self._preview_renderer = None
+        self._preview_cache = None
+        self._verse_store = None
+        self._deck_saver = None
+        self._deck_exporter = None
+
+        # Autosave to the last save path once a minute when the deck has changed
+        self.save_path = None
+        self.saved_revision = 0
+        self.pending_revision = 0
+        self.pending_mark = None  # journal position of the deck being saved
+        self.save_progress = None
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave)
+        self.autosave_timer.start(60 * 1000)
+        # Dirty slides are re-rendered in one batch once control returns to the event loop
+        self.preview_flush_timer = QTimer(self)
+        self.preview_flush_timer.setSingleShot(True)
+        self.preview_flush_timer.setInterval(0)
+        self.preview_flush_timer.timeout.connect(self.flush_previews)
+
+        # Slides of an opened deck are read once their row is painted
+        self.wanted_slides = set()
+        self.load_slides_timer = QTimer(self)
+        self.load_slides_timer.setSingleShot(True)
+        self.load_slides_timer.setInterval(0)
+        self.load_slides_timer.timeout.connect(self.load_wanted_slides)
 
         # Initialize QGraphicsScene for preview
         self.scene = QGraphicsScene(self.graphicsView)
         self.graphicsView.setScene(self.scene)
+        self.preview_item = None
 
         # Connect buttons to functions
-        self.addSlideBtn.clicked.connect(self.add_slide)
-        self.addBackgroundImageBtn.clicked.connect(self.add_background_image)
-        self.createPresentationBtn.clicked.connect(self.create_presentation)
-        self.slideListWidget.itemSelectionChanged.connect(self.display_slide_in_graphics_view)
+        self.addSlideBtn.clicked.connect(lambda: self.add_slide())
+        self.addBackgroundImageBtn.clicked.connect(lambda: self.add_background_image())
+        self.createPresentationBtn.clicked.connect(lambda: self.create_presentation())
+        self.slide_model = SlideListModel(self)
+        self.slideListWidget.setModel(self.slide_model)
+        self.slideListWidget.selectionModel().currentChanged.connect(
+            lambda current, previous: self.display_slide_in_graphics_view())
+        self.slide_model.previewWanted.connect(self.want_slide)
         self.addTextBtn.clicked.connect(self.add_text_item) 
+        self.actionOpen.triggered.connect(lambda: self.open_presentation())
+        QShortcut(QKeySequence.Open, self, self.open_presentation)
+        self.actionDiagnostics.triggered.connect(self.open_diagnostics_panel)
+        self.diagnostics_panel = None
+        # Themes are listed in File > Presets when it opens
+        self.imported_themes = []
+        self.menuPresets.aboutToShow.connect(self.fill_theme_menu)
+        self.actionImport_Preset_2.triggered.connect(self.import_theme)
+        self.actionExport_Preset_2.triggered.connect(self.export_theme)
         self.slideListWidget.setContextMenuPolicy(Qt.CustomContextMenu)
         self.slideListWidget.customContextMenuRequested.connect(self.open_context_menu)
+        self.actionUndo.setShortcut(QKeySequence.Undo)
+        self.actionUndo.triggered.connect(lambda: self.undo())
+        self.actionRedo.setShortcut(QKeySequence.Redo)
+        self.actionRedo.triggered.connect(lambda: self.redo())
         self.current_slide = None
         self.VerseRepeatBtn.clicked.connect(self.open_verse_repeat_window)
         self.verse_repeat_window = None
@@ -229,20 +464,129 @@ class ScriptureSlides(QMainWindow):
         # Default font settings
         self.current_font = QFont("Arial", 20)
         self.current_color = QColor(0, 0, 0)  # Default to black
+        # Until the font controls are used, new slide text follows the theme
+        self.text_style_overridden = False
         self.current_alignment = Qt.AlignLeft
-
+        self.current_text_item = None
+        self._fitting_text = False
+
+
+    @property
+    def deck(self):
+        """The presentation being built, created on first use."""
+        if self._deck is None:
+            from deck import Deck
+            from journal import DEFAULT_JOURNAL_PATH, Journal
+            from theme import DEFAULT_THEME
+
+            self._deck = Deck(theme=DEFAULT_THEME)
+            self._deck.document.subscribe(self.on_document_changed)
+            # A journal left behind means the last session did not close cleanly
+            if os.path.exists(DEFAULT_JOURNAL_PATH) and os.path.getsize(DEFAULT_JOURNAL_PATH):
+                self._journal = Journal.replay(DEFAULT_JOURNAL_PATH, self._deck)
+                print(f"Recovered {len(self._deck.document)} slides from the last session.")
+            else:
+                self._journal = Journal(self._deck, DEFAULT_JOURNAL_PATH)
+        return self._deck
+
+    @property
+    def journal(self):
+        """Undo/redo history of the deck, also logged for crash recovery."""
+        self.deck
+        return self._journal
+
+    @property
+    def document(self):
+        """Per-slide state (background, text, preview) and its change events."""
+        return self.deck.document
+
+    @property
+    def prs(self):
+        return self.deck.prs
+
+    @property
+    def slide_manager(self):
+        return self.deck.slides
+
+    @property
+    def preview_renderer(self):
+        """Renders previews off the GUI thread and delivers them back by signal."""
+        if self._preview_renderer is None:
+            from preview_renderer import PreviewRenderer
+            self._preview_renderer = PreviewRenderer(self)
+            self._preview_renderer.previewReady.connect(self.on_preview_ready)
+            self._preview_renderer.previewFailed.connect(self.on_preview_failed)
+        return self._preview_renderer
+
+    @property
+    def preview_cache(self):
+        """Decoded preview pixmaps, shared with the slideshow window."""
+        if self._preview_cache is None:
+            from preview_cache import PreviewPixmapCache
+            self._preview_cache = PreviewPixmapCache(self)
+        return self._preview_cache
+
+    @property
+    def verse_store(self):
+        if self._verse_store is None:
+            from verse_store import VerseStore
+            self._verse_store = VerseStore()
+        return self._verse_store
+
+    @property
+    def deck_exporter(self):
+        """Exports PDF and PNG pages on a pool of worker processes."""
+        if self._deck_exporter is None:
+            from deck_exporter import DeckExporter
+            self._deck_exporter = DeckExporter(self)
+            self._deck_exporter.progress.connect(self.on_save_progress)
+            self._deck_exporter.exported.connect(self.on_export_finished)
+            self._deck_exporter.failed.connect(self.on_export_failed)
+            self._deck_exporter.cancelled.connect(self.on_export_cancelled)
+        return self._deck_exporter
+
+    @property
+    def deck_saver(self):
+        """Writes the deck on a background thread, reusing unchanged parts."""
+        if self._deck_saver is None:
+            from deck_saver import DeckSaver
+            self._deck_saver = DeckSaver(self)
+            self._deck_saver.progress.connect(self.on_save_progress)
+            self._deck_saver.saved.connect(self.on_save_finished)
+            self._deck_saver.failed.connect(self.on_save_failed)
+            self._deck_saver.cancelled.connect(self.on_save_cancelled)
+        return self._deck_saver
+
+    @verse_store.setter
+    def verse_store(self, verse_store):
+        self._verse_store = verse_store
+
+    def warm_up(self):
+        """Load the deck and preview modules once the window is on screen."""
+        self.deck
+        self.preview_renderer
 
     def open_slideshow_window(self):
         """Open the Slideshow window and hide the main window."""
-        if not self.slideshow_window or not self.slideshow_window.isVisible():
+        # The window is built once and reused on later opens
+        if self.slideshow_window is None:
             self.slideshow_window = SlideShowWindow(self)
-            self.slideshow_window.load_slide_previews(self.slide_previews)  # Pass slide previews here
+            self.slideshow_window.closed.connect(self.show_main_window)
+        if not self.slideshow_window.isVisible():
+            self.slideshow_window.load_slide_previews(self.ordered_slide_previews())  # Pass slide previews here
             self.hide()  # Hide the main window
             self.slideshow_window.show()
-            self.slideshow_window.closed.connect(self.show_main_window)
         else:
             self.slideshow_window.raise_()
 
+    def open_diagnostics_panel(self):
+        """Show the span timings and counters, built on first use."""
+        if self.diagnostics_panel is None:
+            from diagnostics_panel import DiagnosticsPanel
+            self.diagnostics_panel = DiagnosticsPanel(self)
+        self.diagnostics_panel.show()
+        self.diagnostics_panel.raise_()
+
     def show_main_window(self):
         """Show the main window when slideshow window is closed."""
         self.show()
@@ -253,10 +597,14 @@ class ScriptureSlides(QMainWindow):
 
     def open_verse_repeat_window(self):
         """Open the Verse Repeat window."""
-        # Check if window already exists to prevent multiple instances
-        if self.verse_repeat_window is None or not self.verse_repeat_window.isVisible():
-            self.verse_repeat_window = VerseRepeatWindow(self)
+        # The dialog is built once and reused on later opens
+        if self.verse_repeat_window is None:
+            self.verse_repeat_window = VerseRepeatWindow(self, self.verse_store)
             self.verse_repeat_window.finished.connect(self.on_verse_repeat_window_closed)
+            self.verse_repeat_window.versesChosen.connect(self.insert_verses)
+            self.verse_repeat_window.passagesRequested.connect(self.add_passage_slides)
+        if not self.verse_repeat_window.isVisible():
+            self.verse_repeat_window.lineEditReference.selectAll()
             self.verse_repeat_window.show()
         else:
             self.verse_repeat_window.raise_()  # Bring the existing window to the front
@@ -264,7 +612,15 @@ class ScriptureSlides(QMainWindow):
     def on_verse_repeat_window_closed(self):
         """Handle the closing of the Verse Repeat window."""
         print("Verse Repeat window closed.")
-        self.verse_repeat_window = None  # Reset the window instance when closed
+
+
+    @traced("ui.insert_verses")
+    def insert_verses(self, verses):
+        """Put the chosen verses into the slide's text item."""
+        self.add_text_item()
+        text = "\n".join(f"{text} ({reference})" for reference, text in verses)
+        self.current_text_item.setPlainText(text)
+        self.apply_text_formatting()
 
 
     #TEXT FORMATTING BUTTONS!!
@@ -279,19 +635,87 @@ class ScriptureSlides(QMainWindow):
         text_item.setFont(self.current_font)
         text_item.setDefaultTextColor(self.current_color)
         self.scene.addItem(text_item)
-        text_item.setTextWidth(200)  # Optional, for wrapping text
         self.current_text_item = text_item  # Track the currently edited text item
+        self.place_text_item(text_item)
+        # The line breaks fit_text_item swaps in would each be an undo step,
+        # undone only to be put back; Edit > Undo covers slide edits instead
+        text_item.document().setUndoRedoEnabled(False)
+        text_item.document().contentsChanged.connect(self.fit_text_item)
+        self.fit_text_item()
+
+    def slide_scale(self):
+        """Return the scene units per point of the slide shown in the view."""
+        from deck import SLIDE_WIDTH
+
+        if self.preview_item is not None and not sip.isdeleted(self.preview_item) \
+                and self.preview_item.scene() is self.scene:
+            return self.preview_item.boundingRect().width() / (SLIDE_WIDTH * 72)
+        return 1.0
+
+    def place_text_item(self, text_item):
+        """Move `text_item` to the slide text box."""
+        from text_layout import SLIDE_TEXT_BOX, TEXT_INSETS
+
+        left, top, _, _ = SLIDE_TEXT_BOX
+        scale = self.slide_scale()
+        text_item.setPos((left + TEXT_INSETS[0]) * 72 * scale, (top + TEXT_INSETS[1]) * 72 * scale)
+
+    def fit_text_item(self):
+        """Shrink the edited text to the largest size that fits the slide text box.
+
+        Runs on every keystroke; the font never grows past the size picked
+        in the toolbar. Lines break where `text_layout` breaks them, as in
+        the previews and the saved deck, not where Qt's font metrics would:
+        the spaces it breaks at become line separators, which Qt shows as
+        line breaks within the paragraph.
+        """
+        from text_layout import break_positions, content_size, layout_text
+
+        text_item = self.current_text_item
+        if text_item is None or sip.isdeleted(text_item) or self._fitting_text:
+            return
+        document = text_item.document()
+        raw = document.toRawText()  # paragraphs end in U+2029, our breaks are U+2028
+        text = raw.replace(_LINE_SEPARATOR, " ").replace("\u2029", "\n")
+        layout = layout_text(text, self.current_text_style())
+        breaks = set(break_positions(text, layout))
+        scale = self.slide_scale()
+        font = QFont(self.current_font)
+        font.setPixelSize(max(1, round(layout.size * scale)))
+        self._fitting_text = True
+        try:
+            option = document.defaultTextOption()
+            if option.wrapMode() != QTextOption.NoWrap:
+                option.setWrapMode(QTextOption.NoWrap)
+                document.setDefaultTextOption(option)
+            # Swapping one character for another keeps the cursor where it is
+            cursor = QTextCursor(document)
+            cursor.beginEditBlock()
+            for position, char in enumerate(raw):
+                wanted = _LINE_SEPARATOR if position in breaks else " "
+                if char in (" ", _LINE_SEPARATOR) and char != wanted:
+                    cursor.setPosition(position)
+                    cursor.setPosition(position + 1, QTextCursor.KeepAnchor)
+                    cursor.insertText(wanted)
+            cursor.endEditBlock()
+            text_item.setTextWidth(content_size()[0] * scale)
+            if text_item.font() != font:
+                text_item.setFont(font)
+        finally:
+            self._fitting_text = False
 
     def apply_text_formatting(self):
         """Apply all current font settings to the tracked text item without creating duplicates."""
         if hasattr(self, 'current_text_item') and self.current_text_item:
             # Apply formatting only to the existing text item
-            self.current_text_item.setFont(self.current_font)
+            self.fit_text_item()
             self.current_text_item.setDefaultTextColor(self.current_color)
             cursor = self.current_text_item.textCursor()
             cursor.select(QTextCursor.Document)
             text_format = QTextCharFormat()
-            text_format.setFont(self.current_font)
+            # The size is left to fit_text_item
+            text_format.setFontFamily(self.current_font.family())
+            text_format.setFontWeight(self.current_font.weight())
             text_format.setForeground(self.current_color)
             cursor.mergeCharFormat(text_format)
         else:
@@ -300,41 +724,47 @@ class ScriptureSlides(QMainWindow):
     def change_font_family(self, font):
         """Update the font family for the current text item only."""
         self.current_font.setFamily(font.family())
+        self.text_style_overridden = True
         self.apply_text_formatting()
 
 
     def change_font_family(self, font):
         """Update the font family for the selected text item."""
         self.current_font.setFamily(font.family())
+        self.text_style_overridden = True
         if self.current_text_item:
-            self.current_text_item.setFont(self.current_font)
+            self.fit_text_item()
 
     def increase_font_size(self):
         """Increase the font size by 1 point."""
         self.current_font.setPointSize(self.current_font.pointSize() + 1)
+        self.text_style_overridden = True
         if self.current_text_item:
-            self.current_text_item.setFont(self.current_font)
+            self.fit_text_item()
 
     def decrease_font_size(self):
         """Decrease the font size by 1 point."""
         if self.current_font.pointSize() > 1:  # Ensure size stays positive
             self.current_font.setPointSize(self.current_font.pointSize() - 1)
+        self.text_style_overridden = True
         if self.current_text_item:
-            self.current_text_item.setFont(self.current_font)
+            self.fit_text_item()
 
     def change_font_color(self):
         """Open color dialog to select a font color."""
         color = QColorDialog.getColor(self.current_color, self)
         if color.isValid():
             self.current_color = color
+            self.text_style_overridden = True
             if self.current_text_item:
                 self.current_text_item.setDefaultTextColor(self.current_color)
 
     def toggle_bold(self):
         """Toggle bold for the current font."""
         self.current_font.setBold(not self.current_font.bold())
+        self.text_style_overridden = True
         if self.current_text_item:
-            self.current_text_item.setFont(self.current_font)
+            self.fit_text_item()
 
     def set_text_alignment(self, alignment):
         """Set text alignment for the current text item."""
@@ -343,33 +773,124 @@ class ScriptureSlides(QMainWindow):
             self.current_text_item.setTextAlignment(self.current_alignment)
     
 
+    @traced("ui.add_slide")
     def add_slide(self):
-        """Add a new blank slide and save its preview."""
-        slide_layout = self.prs.slide_layouts[6]  # Layout for a blank slide
-        self.current_slide = self.prs.slides.add_slide(slide_layout)
-        self.slide_count += 1
+        """Add a new blank slide; the list and its preview follow from the document."""
+        self.current_slide = self.journal.add_slide()  # Blank slide
+        print(f"Slide {len(self.document)} added!")
+
+    def current_text_style(self):
+        """Return the current font settings as a `TextStyle`."""
+        from text_layout import TextStyle
+
+        return TextStyle(self.current_font.family(), self.current_font.pointSize(),
+                         self.current_font.bold(), self.current_color.getRgb()[:3])
+
+    def slide_text_style(self):
+        """The style for new slide text: None to follow the theme, unless the font was changed."""
+        return self.current_text_style() if self.text_style_overridden else None
+
+    def text_fits(self, text):
+        """Return whether `text` fits the slide text box in the current font."""
+        from text_layout import SLIDE_TEXT_BOX, text_fits
+
+        theme = self.deck.theme
+        if self.text_style_overridden or theme is None:
+            return text_fits(text, self.current_text_style(), SLIDE_TEXT_BOX)
+        return text_fits(text, theme.style, theme.box)
+
+    @traced("ui.add_passage_slides")
+    def add_passage_slides(self, references, translation, split=True):
+        """Turn a reference list like "John 3:16-18; Rom 8:28" into slides in one pass.
+
+        All ranges are fetched with a single query and long passages are split
+        across slides when `split` is set. The previews of the new slides are
+        queued as one batch once control returns to the event loop.
+        """
+        style = self.slide_text_style()
+        try:
+            added = self.journal.add_passages(self.verse_store, references, translation, style,
+                                           split=split, fits=self.text_fits)
+        except ReferenceParseError as error:
+            print(error)
+            return
+        if not added:
+            print(f"No verses found for {references} ({translation})")
+            return
 
-        slide_item = f"Slide {self.slide_count}"
-        self.slideListWidget.addItem(slide_item)
-        
-        self.save_slide_preview()  # Capture preview (using placeholder data)
-        print(f"{slide_item} added!")
+        self.current_slide = added[-1][0]
+        print(f"{len(added)} slides added for {references}")
+
+    def selected_slide_id(self):
+        """Return the slide ID of the selected list entry, or None."""
+        return self.slide_model.slide_id(self.slideListWidget.currentIndex().row())
+
+    def slide_row(self, slide_id):
+        """Return the list row showing `slide_id`, or -1."""
+        return self.slide_model.row_of(slide_id)
+
+    def preview_path(self, slide_id):
+        """Return the rendered preview of `slide_id`, or None."""
+        record = self.document.get(slide_id)
+        return record.preview_path if record is not None else None
 
+    def ordered_slide_previews(self):
+        """Return slide ID -> preview path, None until rendered, for every slide in deck order."""
+        return {record.slide_id: record.preview_path for record in self.document}
+
+    @traced("ui.document_changed")
+    def on_document_changed(self, event):
+        """Bring the slide list and previews in line with one document change."""
+        from document import (DIRTY_THEME, PREVIEW_CHANGED, SLIDE_ADDED, SLIDE_MOVED,
+                              SLIDE_REMOVED, SLIDES_RESET, THEME_CHANGED)
+
+        if event.kind == SLIDES_RESET:
+            self.preview_cache.clear()
+            self.scene.clear()
+            self.current_slide = None
+            self.slide_model.set_slides(self.document.slide_ids())
+        elif event.kind == SLIDE_ADDED:
+            self.slide_model.insert_slides(
+                event.index, self.document.slide_ids(event.index, event.index + event.count))
+        elif event.kind == SLIDE_REMOVED:
+            self.slide_model.remove_slide(self.slide_row(event.slide_id))
+            self.preview_renderer.forget(event.slide_id)
+            self.preview_cache.invalidate(event.slide_id)
+        elif event.kind == SLIDE_MOVED:
+            self.slide_model.move_slide(self.slide_row(event.slide_id), event.index)
+        elif event.kind == PREVIEW_CHANGED:
+            self.show_preview(event.slide_id)
+        elif event.kind == THEME_CHANGED:
+            # Thumbnails are redone as they are painted, not all at once
+            self.use_theme_font()
+            self.slide_model.mark_stale([record.slide_id for record in self.document
+                                         if record.dirty & DIRTY_THEME])
+            if self.selected_slide_id() is not None:
+                self.want_slide(self.selected_slide_id())
+        if self.slideshow_window is not None and event.kind != PREVIEW_CHANGED:
+            self.slideshow_window.on_document_changed(event)
+        # Added and changed slides are flagged dirty; render them in one batch
+        if event.kind != PREVIEW_CHANGED and not self.preview_flush_timer.isActive():
+            self.preview_flush_timer.start()
+
+    @traced("ui.add_background_image")
     def add_background_image(self):
         """Add a draggable background image to the QGraphicsView and PowerPoint slide."""
-        selected_items = self.slideListWidget.selectedItems()
-        if not selected_items:
+        slide_id = self.selected_slide_id()
+        if slide_id is None:
             print("No slide selected. Add a slide first.")
             return
 
-        selected_index = self.slideListWidget.currentRow()
-        self.current_slide = self.prs.slides[selected_index]  # Get the actual slide from the selected index
+        self.current_slide = self.slide_manager.slide(slide_id)  # Get the actual slide from the selected entry
 
         # Open file dialog to select an image
         image_path, _ = QFileDialog.getOpenFileName(self, 'Open Background Image', '', 'Image files (*.jpg *.png)')
         if image_path:
-            # Add image to QGraphicsView for a preview
-            pixmap = QPixmap(image_path)
+            # Add image to QGraphicsView for a preview, using the cached
+            # view-sized variant rather than decoding the full-size file
+            from image_cache import VIEW_SIZE, default_cache, to_qpixmap
+
+            pixmap = to_qpixmap(default_cache().variant(image_path, VIEW_SIZE))
             image_item = DraggableImageItem(pixmap)
             
             # Clear any previous background image to avoid stacking images
@@ -382,113 +903,423 @@ class ScriptureSlides(QMainWindow):
             self.graphicsView.fitInView(self.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
             print(f"Draggable background image {image_path} added to the graphics view.")
 
-            # Update preview with new image path
-            self.save_slide_preview(image_path)
-
-            # Set the background image in PowerPoint slide
-            left, top, width, height = 0, 0, self.prs.slide_width, self.prs.slide_height
-            self.current_slide.shapes.add_picture(image_path, left, top, width, height)
+            # Set the background image in PowerPoint slide; this also queues its preview
+            self.journal.set_background(slide_id, image_path)
             print(f"Background image {image_path} added to slide in PowerPoint presentation.")
 
 
-    def save_slide_preview(self, image_path=None):
-        """Simulate the current slide preview and save it as an image."""
-        preview_folder = "./slide_previews/"
-        os.makedirs(preview_folder, exist_ok=True)
-        
-        slide_number = self.slideListWidget.currentRow() + 1
-        preview_image_path = f"{preview_folder}slide_{slide_number}.png"
-        
-        slide_width, slide_height = 1280, 720
-        image = Image.new("RGB", (slide_width, slide_height), "white")
-        draw = ImageDraw.Draw(image)
-
-        if image_path:
-            background = Image.open(image_path)
-            background = background.resize((slide_width, slide_height))
-            image.paste(background, (0, 0))
-
-        text = f"Slide {slide_number}"
-        font = ImageFont.load_default()
-        draw.text((50, 50), text, fill=(0, 0, 0), font=font)
+    def save_slide_preview(self, slide_id=None):
+        """Queue a re-render of the slide preview."""
+        if slide_id is None:
+            slide_id = self.selected_slide_id()
+        if slide_id is None:
+            return
+        self.document.mark_dirty([slide_id])
+        self.preview_flush_timer.start()
 
-        image.save(preview_image_path)
-        print(f"Preview for Slide {slide_number} saved at {preview_image_path}")
-        
-        self.slide_previews[f"Slide {slide_number}"] = preview_image_path
+    def use_theme_font(self):
+        """Show the theme's font in the font controls; new slide text follows the theme again."""
+        theme = self.deck.theme
+        if theme is None:
+            return
+        style = theme.style
+        self.current_font = QFont(style.name, style.size)
+        self.current_font.setBold(style.bold)
+        self.current_color = QColor(*style.color)
+        self.fontComboBox.blockSignals(True)
+        self.fontComboBox.setCurrentFont(self.current_font)
+        self.fontComboBox.blockSignals(False)
+        self.text_style_overridden = False
+
+    def fill_theme_menu(self):
+        """List the built-in and imported themes in File > Presets, the current one checked."""
+        from PyQt5.QtWidgets import QActionGroup
+        from theme import BUILTIN_THEMES
+
+        for action in self.menuPresets.actions():
+            if action.data() is not None:
+                self.menuPresets.removeAction(action)
+        group = QActionGroup(self.menuPresets)
+        current = self.deck.theme.name if self.deck.theme is not None else None
+        first_preset = self.actionImport_Preset_2
+        for theme in (*BUILTIN_THEMES, *self.imported_themes):
+            action = group.addAction(theme.name)
+            action.setCheckable(True)
+            action.setChecked(theme.name == current)
+            action.setData(theme.name)
+            action.triggered.connect(lambda checked, theme=theme: self.apply_theme(theme))
+            self.menuPresets.insertAction(first_preset, action)
+        separator = self.menuPresets.insertSeparator(first_preset)
+        separator.setData("")
+
+    @traced("ui.apply_theme")
+    def apply_theme(self, theme):
+        """Switch every slide to `theme` as one undoable edit."""
+        self.journal.set_theme(theme)
+        print(f"Theme {theme.name} applied to {len(self.document)} slides")
+
+    def import_theme(self):
+        """Apply a theme preset file and list it in File > Presets."""
+        from theme import load_theme
+
+        path, _ = QFileDialog.getOpenFileName(self, 'Import Preset', '', 'Theme presets (*.json)')
+        if not path:
+            return
+        try:
+            theme = load_theme(path)
+        except (OSError, ValueError, KeyError) as error:
+            print(f"Could not import {path}: {error}")
+            return
+        self.imported_themes = [known for known in self.imported_themes if known.name != theme.name]
+        self.imported_themes.append(theme)
+        self.apply_theme(theme)
 
-    def display_image_in_graphics_view(self, image_path):
-        """Display an image in the QGraphicsView."""
-        pixmap = QPixmap(image_path)
-        self.scene.clear()
-        self.scene.addPixmap(pixmap)
-        self.graphicsView.fitInView(self.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
+    def export_theme(self):
+        """Save the current theme as a preset file."""
+        from theme import save_theme
 
+        theme = self.deck.theme
+        if theme is None:
+            print("The deck has no theme to export.")
+            return
+        path, _ = QFileDialog.getSaveFileName(self, 'Export Preset', f"{theme.name}.json",
+                                              'Theme presets (*.json)')
+        if path:
+            save_theme(theme, path)
+            print(f"Theme {theme.name} saved at {path}")
+
+    def rerender_all_previews(self):
+        """Re-render every slide preview in one batch, e.g. after a theme change."""
+        self.document.mark_dirty()
+        self.flush_previews()
+
+    @traced("ui.flush_previews")
+    def flush_previews(self):
+        """Submit one batch of renders for the slides flagged dirty since the last flush."""
+        from document import DIRTY_PREVIEW, DIRTY_THEME
+
+        jobs = []
+        dirty = self.document.take_dirty(DIRTY_PREVIEW)
+        self.document.take_dirty(DIRTY_THEME, dirty)  # rendered in the current theme now
+        for slide_id in dirty:
+            background, text, style, box = self.document.appearance(self.document.get(slide_id))
+            jobs.append((slide_id, f"Slide {self.slide_row(slide_id) + 1}",
+                         background.path if background else None, text, style, box))
+        if jobs:
+            self.preview_renderer.submit_batch(jobs)
+
+    @traced("ui.preview_ready")
+    def on_preview_ready(self, slide_id, preview_image_path):
+        """Store a finished preview; the document event updates the views."""
+        self.document.set_preview(slide_id, preview_image_path)
+        print(f"Preview for slide {slide_id} saved at {preview_image_path}")
+
+    def show_preview(self, slide_id):
+        """Refresh the thumbnail and views of a slide whose preview was re-rendered."""
+        preview_image_path = self.preview_path(slide_id)
+        self.preview_cache.invalidate(slide_id)
+        self.slide_model.set_preview(slide_id, preview_image_path)
+
+        # Only replace the scene when it holds nothing the user is editing
+        if self.selected_slide_id() == slide_id:
+            editing = any(isinstance(item, (DraggableTextItem, DraggableImageItem))
+                          for item in self.scene.items())
+            if not editing:
+                self.display_image_in_graphics_view(preview_image_path, slide_id)
+
+        if self.slideshow_window and self.slideshow_window.isVisible():
+            self.slideshow_window.load_slide_previews(self.ordered_slide_previews())
+
+    def on_preview_failed(self, slide_id, message):
+        """Report a preview that could not be rendered."""
+        print(f"Preview for slide {slide_id} failed: {message}")
+
+    def display_image_in_graphics_view(self, image_path, slide_id=None):
+        """Display a slide preview in the QGraphicsView at the view's resolution."""
+        from preview_cache import level_for
+
+        level = level_for(self.graphicsView.viewport().width(), self.devicePixelRatioF())
+        pixmap = self.preview_cache.pixmap(slide_id, image_path, level)
+        self.preview_item = show_pixmap(self.scene, self.graphicsView, self.preview_item, pixmap)
+
+    def prefetch_neighbours(self, row, radius=2):
+        """Decode the previews of the slides around `row` in the background."""
+        from preview_cache import level_for
+
+        requests = []
+        for neighbour in range(max(0, row - radius), min(row + radius + 1, self.slide_model.rowCount())):
+            slide_id = self.slide_model.slide_id(neighbour)
+            preview_path = self.preview_path(slide_id)
+            if neighbour != row and preview_path:
+                requests.append((slide_id, preview_path))
+        level = level_for(self.graphicsView.viewport().width(), self.devicePixelRatioF())
+        self.preview_cache.prefetch(requests, level)
+
+    @traced("ui.select_slide")
     def display_slide_in_graphics_view(self):
         """Display the selected slide in QGraphicsView."""
-        selected_items = self.slideListWidget.selectedItems()
-        if selected_items:
-            selected_item = selected_items[0].text()
-            image_path = self.slide_previews.get(selected_item)
+        index = self.slideListWidget.currentIndex()
+        if index.isValid():
+            selected_item = index.data()
+            slide_id = index.data(SlideListModel.SlideIdRole)
+            image_path = self.preview_path(slide_id)
             if image_path:
-                self.display_image_in_graphics_view(image_path)
+                self.display_image_in_graphics_view(image_path, slide_id)
+                self.prefetch_neighbours(index.row())
+            elif not self.document.get(slide_id).loaded:
+                self.deck.load_slide(slide_id)  # shown once its preview is rendered
             else:
                 print(f"No preview available for {selected_item}")
 
     def open_context_menu(self, position):
-        """Open a custom context menu for deleting slides."""
+        """Open a custom context menu for managing slides."""
         context_menu = QMenu(self)
+        move_up_action = context_menu.addAction("Move Up")
+        move_down_action = context_menu.addAction("Move Down")
+        duplicate_action = context_menu.addAction("Duplicate Slide")
         delete_action = context_menu.addAction("Delete Slide")
         action = context_menu.exec_(self.slideListWidget.mapToGlobal(position))
         
         if action == delete_action:
             self.delete_slide()
-
+        elif action == duplicate_action:
+            self.duplicate_slide()
+        elif action == move_up_action:
+            self.move_slide(-1)
+        elif action == move_down_action:
+            self.move_slide(1)
+
+    @traced("ui.delete_slide")
     def delete_slide(self):
         """Delete the selected slide from the list and presentation."""
-        selected_row = self.slideListWidget.currentRow()
+        selected_row = self.slideListWidget.currentIndex().row()
         if selected_row >= 0:
-            selected_item = self.slideListWidget.takeItem(selected_row)
-            slide_name = selected_item.text()
-            
-            preview_path = self.slide_previews.pop(slide_name, None)
-            if preview_path and os.path.exists(preview_path):
-                os.remove(preview_path)
-                print(f"Deleted preview image: {preview_path}")
+            slide_name = f"Slide {selected_row + 1}"
+            slide_id = self.slide_model.slide_id(selected_row)
+            preview_path = self.preview_path(slide_id)
 
-            new_prs = Presentation()
-            new_prs.slide_width = self.prs.slide_width
-            new_prs.slide_height = self.prs.slide_height
-            
-            for i, slide in enumerate(self.prs.slides):
-                if i != selected_row:
-                    new_slide = new_prs.slides.add_slide(slide.slide_layout)
-                    for shape in slide.shapes:
-                        if shape.has_text_frame:
-                            new_shape = new_slide.shapes.add_shape(
-                                shape.auto_shape_type, shape.left, shape.top, shape.width, shape.height
-                            )
-                            new_shape.text = shape.text_frame.text
-                        elif hasattr(shape, "image"):
-                            image_path = shape.image.filename
-                            if os.path.exists(image_path):
-                                new_slide.shapes.add_picture(image_path, shape.left, shape.top)
-                            else:
-                                print(f"Warning: Image file {image_path} not found. Skipping this image.")
-            
-            self.prs = new_prs
+            # Drop the slide from the slide ID list; no other slide is touched
+            self.journal.delete_slide(slide_id)
+            if preview_path:
+                print(f"Deleted preview image: {preview_path}")
             print(f"{slide_name} deleted.")
 
+    @traced("ui.move_slide")
+    def move_slide(self, offset):
+        """Move the selected slide up (-1) or down (+1) in the deck."""
+        selected_row = self.slideListWidget.currentIndex().row()
+        new_row = selected_row + offset
+        if selected_row < 0 or not 0 <= new_row < self.slide_model.rowCount():
+            return
+
+        self.journal.move_slide(self.slide_model.slide_id(selected_row), new_row)
+        self.slideListWidget.setCurrentIndex(self.slide_model.index(new_row))
+
+    @traced("ui.duplicate_slide")
+    def duplicate_slide(self):
+        """Insert a copy of the selected slide right after it."""
+        slide_id = self.selected_slide_id()
+        if slide_id is None:
+            return
+
+        duplicate = self.journal.duplicate_slide(slide_id)
+        print(f"Slide {self.slide_row(duplicate.slide_id) + 1} duplicated from slide {slide_id}.")
+
+    @traced("ui.undo")
+    def undo(self):
+        """Undo the last slide edit."""
+        if not self.journal.undo():
+            print("Nothing to undo.")
+
+    @traced("ui.redo")
+    def redo(self):
+        """Redo the last undone slide edit."""
+        if not self.journal.redo():
+            print("Nothing to redo.")
+
+    @traced("ui.open_presentation")
+    def open_presentation(self):
+        """Open an existing .pptx in place of the current slides.
+
+        The slide list is filled at once; each slide is read and previewed
+        when it is shown or exported.
+        """
+        open_path, _ = QFileDialog.getOpenFileName(self, 'Open Presentation', '', 'PowerPoint files (*.pptx)')
+        if not open_path:
+            return
+        for slide_id in self.document.slide_ids():
+            self.preview_renderer.forget(slide_id)
+        try:
+            self.journal.open_deck(open_path)
+        except Exception as error:
+            print(f"Could not open {open_path}: {error}")
+            return
+        print(f"Opened {open_path} with {len(self.document)} slides")
+
+    def want_slide(self, slide_id):
+        """Queue a slide whose list row is being painted, if unread or previewed in an old theme."""
+        from document import DIRTY_THEME
+
+        record = self.document.get(slide_id)
+        if record is not None and (not record.loaded or record.dirty & DIRTY_THEME):
+            self.wanted_slides.add(slide_id)
+            gauge("slides.wanted", len(self.wanted_slides))
+            self.load_slides_timer.start()
+
+    @traced("ui.load_slides")
+    def load_wanted_slides(self):
+        """Read the queued slides; their previews are then rendered in one batch."""
+        from document import DIRTY_THEME
+
+        wanted, self.wanted_slides = self.wanted_slides, set()
+        gauge("slides.wanted", 0)
+        stale = []
+        for slide_id in wanted:
+            record = self.document.get(slide_id)
+            if record is None:
+                continue
+            if record.loaded:
+                stale.append(slide_id)
+            else:
+                self.deck.load_slide(slide_id)
+        # Previews showing an old theme are redone with the others
+        if self.document.take_dirty(DIRTY_THEME, stale):
+            self.document.mark_dirty(stale)
+            self.preview_flush_timer.start()
+
+    @traced("ui.create_presentation")
     def create_presentation(self):
-        """Save the PowerPoint presentation."""
-        save_path, _ = QFileDialog.getSaveFileName(self, 'Save Presentation', '', 'PowerPoint files (*.pptx)')
-        if save_path:
-            self.prs.save(save_path)
-            print(f"Presentation saved at {save_path}")
+        """Save the PowerPoint presentation, or export it, in the background."""
+        save_path, _ = QFileDialog.getSaveFileName(
+            self, 'Save Presentation', '',
+            'PowerPoint files (*.pptx);;PDF files (*.pdf);;PNG sequence (*.png)')
+        if save_path.lower().endswith((".pdf", ".png")):
+            self.export_presentation(save_path)
+        elif save_path:
+            if self.deck_saver.is_saving():
+                print("A save is already in progress.")
+                return
+            self.save_path = save_path
+            self.save_progress = QProgressDialog("Saving presentation...", "Cancel", 0, 100, self)
+            self.save_progress.setWindowModality(Qt.WindowModal)
+            self.save_progress.canceled.connect(self.deck_saver.cancel)
+            self.start_save(save_path)
+
+    def autosave(self):
+        """Save to the last save path if anything changed since then."""
+        if self.save_path and self._deck is not None and self.deck.revision != self.saved_revision:
+            self.start_save(self.save_path)
+
+    def start_save(self, save_path):
+        revision = self.deck.revision
+        mark = self.journal.mark()
+        if self.deck_saver.save(self.deck, save_path):
+            self.pending_revision = revision
+            self.pending_mark = mark
+
+    def on_save_progress(self, done, total):
+        if self.save_progress is not None:
+            self.save_progress.setValue(int(done * 100 / total))
+
+    def on_save_finished(self, save_path):
+        self.saved_revision = self.pending_revision
+        # Recovery now starts from the saved file, not from the edits before it
+        self.journal.checkpoint(save_path, self.pending_mark)
+        self.close_save_progress()
+        print(f"Presentation saved at {save_path}")
+
+    def on_save_failed(self, message):
+        self.close_save_progress()
+        print(f"Saving the presentation failed: {message}")
+
+    def on_save_cancelled(self):
+        self.close_save_progress()
+        print("Save cancelled; the file on disk was left unchanged.")
+
+    def export_presentation(self, export_path):
+        """Export every slide to a PDF, or to a folder of PNGs named after `export_path`."""
+        if self.deck_exporter.is_exporting():
+            print("An export is already in progress.")
+            return
+        self.deck.load_all()
+        if export_path.lower().endswith(".pdf"):
+            started = self.deck_exporter.export(self.document, pdf_path=export_path)
+        else:
+            started = self.deck_exporter.export(self.document,
+                                                png_folder=os.path.splitext(export_path)[0])
+        if started:
+            self.save_progress = QProgressDialog("Exporting slides...", "Cancel", 0, 100, self)
+            self.save_progress.setWindowModality(Qt.WindowModal)
+            self.save_progress.canceled.connect(self.deck_exporter.cancel)
+
+    def on_export_finished(self, export_path):
+        self.close_save_progress()
+        print(f"Slides exported to {export_path}")
+
+    def on_export_failed(self, message):
+        self.close_save_progress()
+        print(f"Exporting the slides failed: {message}")
+
+    def on_export_cancelled(self):
+        self.close_save_progress()
+        print("Export cancelled.")
+
+    def close_save_progress(self):
+        if self.save_progress is not None:
+            self.save_progress.reset()
+            self.save_progress = None
+
+    def closeEvent(self, event):
+        if self._preview_renderer is not None:
+            self._preview_renderer.shutdown()
+        if self._preview_cache is not None:
+            self._preview_cache.shutdown()
+        self.slide_model.shutdown()
+        if self.slideshow_window is not None:
+            self.slideshow_window.slide_model.shutdown()
+            if self.slideshow_window.output is not None:
+                self.slideshow_window.output.close()
+        if self._verse_store is not None:
+            self._verse_store.close()
+        if self._deck_saver is not None:
+            self._deck_saver.shutdown()  # let a running save finish
+        if self._deck_exporter is not None:
+            self._deck_exporter.shutdown()
+        if self._deck is not None:
+            self.journal.close(remove=True)  # a clean exit needs no recovery
+            self._deck.close()
+        trace_path = os.environ.get(instrumentation.TRACE_ENV)
+        if trace_path and instrumentation.enabled():
+            instrumentation.recorder().write_chrome_trace(trace_path)
+            print(f"Trace written to {trace_path}")
+        super(ScriptureSlides, self).closeEvent(event)
+
+
+class FirstPaintProbe(QObject):
+    """Reports the time to the first painted widget, then quits.
+
+    Installed when SCRIPTURE_SLIDES_STARTUP_PROBE is set; used by
+    benchmarks/startup_benchmark.py.
+    """
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint:
+            QApplication.instance().removeEventFilter(self)
+            print(f"first-paint {time.perf_counter() - _STARTED:.4f}", flush=True)
+            QTimer.singleShot(0, QApplication.quit)
+        return False
 
 
 if __name__ == "__main__":
+    # Exports run on a spawn process pool, which a frozen app must set up first
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
+    if os.environ.get(instrumentation.TRACE_ENV):
+        instrumentation.enable()
+    if os.environ.get("SCRIPTURE_SLIDES_STARTUP_PROBE"):
+        probe = FirstPaintProbe(app)
+        app.installEventFilter(probe)
     ui = ScriptureSlides()
     ui.show()
+    QTimer.singleShot(250, ui.warm_up)  # after the first paint
     sys.exit(app.exec_())
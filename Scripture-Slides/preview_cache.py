@@ -0,0 +1,136 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5.QtCore import QObject, QSize, pyqtSignal
+from PyQt5.QtGui import QImageReader, QPixmap
+
+from instrumentation import count, gauge, span
+
+# Preview widths the cache decodes to. Previews are JPEGs, whose decoder can
+# scale by 1/2, 1/4 and 1/8 while decoding, so the small levels are much
+# cheaper to load than the full image.
+LEVELS = (160, 320, 640, 1280)
+PREVIEW_ASPECT = 9 / 16
+
+DEFAULT_MAX_BYTES = 96 * 1024 * 1024
+
+
+def level_for(width, device_pixel_ratio=1.0):
+    """Return the smallest level at least `width` device pixels wide."""
+    needed = width * device_pixel_ratio
+    for level in LEVELS:
+        if level >= needed:
+            return level
+    return LEVELS[-1]
+
+
+def read_preview(path, level):
+    """Decode the preview at `path` scaled to `level` pixels wide (any thread)."""
+    with span("preview.decode", {"level": level}):
+        reader = QImageReader(path)
+        reader.setScaledSize(QSize(level, round(level * PREVIEW_ASPECT)))
+        return reader.read()
+
+
+class PreviewPixmapCache(QObject):
+    """In-memory LRU of decoded slide previews keyed by slide ID and level.
+
+    Lookups that miss decode synchronously; `prefetch` decodes neighbouring
+    slides on a background thread so arrowing through the slide list finds
+    them ready. QImages are decoded off the GUI thread and turned into
+    QPixmaps on it, as Qt requires.
+    """
+
+    pixmapReady = pyqtSignal(object, int)  # slide ID, level
+
+    def __init__(self, parent=None, max_bytes=DEFAULT_MAX_BYTES):
+        super(PreviewPixmapCache, self).__init__(parent)
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # (slide ID, level) -> (path, pixmap, bytes)
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+        self._decoded.connect(self._store_decoded)
+
+    _decoded = pyqtSignal(object, int, str, object)  # slide ID, level, path, QImage
+
+    def pixmap(self, slide_id, path, level):
+        """Return the preview pixmap for `slide_id` at `level`, decoding it if needed."""
+        cached = self._lookup(slide_id, path, level)
+        if cached is not None:
+            self.hits += 1
+            count("preview_cache.hit")
+            return cached
+        self.misses += 1
+        count("preview_cache.miss")
+        pixmap = QPixmap.fromImage(read_preview(path, level))
+        self._insert(slide_id, level, path, pixmap)
+        return pixmap
+
+    def cached(self, slide_id, path, level):
+        """Return the cached pixmap for `slide_id` at `level` without decoding, or None."""
+        return self._lookup(slide_id, path, level)
+
+    def prefetch(self, requests, level):
+        """Decode `[(slide_id, path), ...]` in the background if not cached yet."""
+        for slide_id, path in requests:
+            key = (slide_id, level)
+            if not path or self._lookup(slide_id, path, level, touch=False) is not None:
+                continue
+            with self._lock:
+                if (key, path) in self._pending:
+                    continue
+                self._pending.add((key, path))
+                gauge("preview_cache.prefetch_queue", len(self._pending))
+            future = self._executor.submit(read_preview, path, level)
+            future.add_done_callback(
+                lambda f, slide_id=slide_id, path=path: self._on_decoded(slide_id, level, path, f))
+
+    def invalidate(self, slide_id):
+        """Drop every cached level of `slide_id`."""
+        for key in [key for key in self._entries if key[0] == slide_id]:
+            self.current_bytes -= self._entries.pop(key)[2]
+
+    def clear(self):
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _lookup(self, slide_id, path, level, touch=True):
+        entry = self._entries.get((slide_id, level))
+        if entry is None or entry[0] != path:
+            return None
+        if touch:
+            self._entries.move_to_end((slide_id, level))
+        return entry[1]
+
+    def _insert(self, slide_id, level, path, pixmap):
+        key = (slide_id, level)
+        size = pixmap.width() * pixmap.height() * max(1, pixmap.depth() // 8)
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.current_bytes -= previous[2]
+        self._entries[key] = (path, pixmap, size)
+        self.current_bytes += size
+        while self.current_bytes > self.max_bytes and len(self._entries) > 1:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self.current_bytes -= evicted_size
+
+    def _on_decoded(self, slide_id, level, path, future):
+        # Worker thread: hand the QImage to the GUI thread by signal
+        with self._lock:
+            self._pending.discard(((slide_id, level), path))
+            gauge("preview_cache.prefetch_queue", len(self._pending))
+        if not future.cancelled() and future.exception() is None and not future.result().isNull():
+            self._decoded.emit(slide_id, level, path, future.result())
+
+    def _store_decoded(self, slide_id, level, path, image):
+        if self._lookup(slide_id, path, level, touch=False) is None:
+            self._insert(slide_id, level, path, QPixmap.fromImage(image))
+            self.pixmapReady.emit(slide_id, level)
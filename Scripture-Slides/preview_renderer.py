@@ -0,0 +1,177 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from PyQt5.QtCore import QObject, pyqtSignal
+from PIL import ImageDraw, ImageFont
+
+from image_cache import PREVIEW_SIZE
+from instrumentation import gauge, span
+from slide_image import draw_slide
+
+PREVIEW_FOLDER = "./slide_previews/"
+PREVIEW_QUALITY = 90
+
+
+def render_preview(preview_path, label, image_path=None, text=None, style=None, box=None,
+                   size=PREVIEW_SIZE):
+    """Render one slide preview to a JPEG file.
+
+    Runs on a worker thread or process, so it must not touch any Qt object.
+    The file is written next to its final name and renamed into place so the
+    GUI never picks up a half-written image. JPEG lets the GUI decode reduced
+    sizes directly (see preview_cache.py).
+    """
+    with span("preview.render"):
+        image = draw_slide(size, image_path, text, style, box)
+        ImageDraw.Draw(image).text((50, 50), label, fill=(0, 0, 0), font=ImageFont.load_default())
+
+        os.makedirs(os.path.dirname(preview_path) or ".", exist_ok=True)
+        tmp_path = f"{preview_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        image.save(tmp_path, format="JPEG", quality=PREVIEW_QUALITY)
+        os.replace(tmp_path, preview_path)
+    return preview_path
+
+
+class PreviewRenderer(QObject):
+    """Renders slide previews on a worker pool and signals when they are ready.
+
+    Every job is tagged with a per-slide generation number that is also part of
+    the output file name. Submitting a new job for a slide cancels the pending
+    one and any result from an older generation is deleted, so a slow render
+    can never overwrite a newer one.
+    """
+
+    previewReady = pyqtSignal(object, str)  # slide key, preview image path
+    previewFailed = pyqtSignal(object, str)  # slide key, error message
+    batchFinished = pyqtSignal()
+
+    def __init__(self, parent=None, max_workers=None, use_processes=False):
+        super(PreviewRenderer, self).__init__(parent)
+        max_workers = max_workers or os.cpu_count() or 1
+        # PIL releases the GIL while decoding and resizing, so threads are
+        # enough for interactive work; processes help with very large batches
+        if use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers,
+                                                thread_name_prefix="preview")
+        self._lock = threading.Lock()
+        self._generations = {}
+        self._futures = {}
+        self._ready_paths = {}
+        self._batch_pending = 0
+
+    def preview_path_for(self, slide_key, generation):
+        """Return the file path used for one generation of a slide preview."""
+        name = f"slide_{slide_key}"
+        return os.path.join(PREVIEW_FOLDER, f"{name}.{generation}.jpg")
+
+    def forget(self, slide_key):
+        """Cancel pending work for `slide_key` and delete its preview file."""
+        self.cancel(slide_key)
+        with self._lock:
+            preview_path = self._ready_paths.pop(slide_key, None)
+            self._generations.pop(slide_key, None)
+        _remove_quietly(preview_path)
+
+    def submit(self, slide_key, label, image_path=None, text=None, style=None, box=None,
+               _batch=False):
+        """Queue a preview render for `slide_key`, superseding any pending one."""
+        self.cancel(slide_key)
+        with self._lock:
+            generation = self._generations.get(slide_key, 0) + 1
+            self._generations[slide_key] = generation
+
+        preview_path = self.preview_path_for(slide_key, generation)
+        future = self._executor.submit(render_preview, preview_path, label, image_path, text,
+                                       style, box)
+        with self._lock:
+            self._futures[slide_key] = future
+            gauge("preview.queue", len(self._futures))
+        future.add_done_callback(
+            lambda f: self._on_done(slide_key, generation, f, _batch))
+        return future
+
+    def submit_batch(self, jobs):
+        """Queue many renders at once, e.g. after a theme change.
+
+        `jobs` is an iterable of `(slide_key, label, image_path, text, style,
+        box)` tuples.
+        `batchFinished` is emitted once every job of the batch has settled.
+        """
+        jobs = list(jobs)
+        with self._lock:
+            self._batch_pending += len(jobs)
+        for slide_key, label, image_path, text, style, box in jobs:
+            self.submit(slide_key, label, image_path, text, style, box, _batch=True)
+        if not jobs:
+            self.batchFinished.emit()
+
+    def pending(self):
+        """Number of renders queued or in flight."""
+        with self._lock:
+            return len(self._futures)
+
+    def cancel(self, slide_key):
+        """Drop the pending render for `slide_key`, if any."""
+        with self._lock:
+            future = self._futures.pop(slide_key, None)
+            if future is not None:
+                gauge("preview.queue", len(self._futures))
+            # Bumping the generation makes a render already in flight stale
+            if slide_key in self._generations:
+                self._generations[slide_key] += 1
+        if future is not None:
+            future.cancel()
+
+    def cancel_all(self):
+        """Drop every pending render."""
+        with self._lock:
+            slide_keys = list(self._futures)
+        for slide_key in slide_keys:
+            self.cancel(slide_key)
+
+    def shutdown(self):
+        """Cancel outstanding work and stop the worker pool."""
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _on_done(self, slide_key, generation, future, batch):
+        # Called on a worker thread; emitting a signal queues the delivery onto
+        # the thread the receivers live in, which is the GUI thread
+        with self._lock:
+            batch_done = False
+            if batch:
+                self._batch_pending -= 1
+                batch_done = self._batch_pending == 0
+            stale = self._generations.get(slide_key) != generation
+            if self._futures.get(slide_key) is future:
+                del self._futures[slide_key]
+                gauge("preview.queue", len(self._futures))
+            error = None if future.cancelled() else future.exception()
+            previous_path = None
+            if not stale and not future.cancelled() and error is None:
+                previous_path = self._ready_paths.get(slide_key)
+                self._ready_paths[slide_key] = future.result()
+        if batch_done:
+            self.batchFinished.emit()
+        if future.cancelled():
+            return
+        if stale:
+            if error is None:
+                _remove_quietly(future.result())
+            return
+        if error is not None:
+            self.previewFailed.emit(slide_key, str(error))
+        else:
+            _remove_quietly(previous_path)
+            self.previewReady.emit(slide_key, future.result())
+
+
+def _remove_quietly(path):
+    if path and os.path.exists(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,183 @@
+import re
+from collections import namedtuple
+
+from verse_store import BOOKS, book_name
+
+# A span of verses; end_verse None means "to the end of end_chapter"
+VerseRange = namedtuple("VerseRange", "book start_chapter start_verse end_chapter end_verse")
+
+SINGLE_CHAPTER_BOOKS = {BOOKS.index(name) + 1 for name in ("Obadiah", "Philemon", "2 John", "3 John", "Jude")}
+
+# Common abbreviations that are not simply a unique prefix of the book name
+_ABBREVIATIONS = {
+    "gn": "Genesis", "ex": "Exodus", "lv": "Leviticus", "nm": "Numbers", "dt": "Deuteronomy",
+    "jos": "Joshua", "jdg": "Judges", "jdgs": "Judges", "ru": "Ruth", "sm": "Samuel",
+    "kgs": "Kings", "ki": "Kings", "chr": "Chronicles", "ch": "Chronicles", "ne": "Nehemiah",
+    "es": "Esther", "jb": "Job", "ps": "Psalms", "psa": "Psalms", "pss": "Psalms",
+    "psalm": "Psalms", "pr": "Proverbs", "prv": "Proverbs", "ec": "Ecclesiastes",
+    "eccl": "Ecclesiastes", "qoh": "Ecclesiastes", "song": "Song of Solomon",
+    "sos": "Song of Solomon", "sg": "Song of Solomon", "cant": "Song of Solomon",
+    "is": "Isaiah", "jer": "Jeremiah", "lam": "Lamentations", "ezk": "Ezekiel",
+    "dn": "Daniel", "jl": "Joel", "am": "Amos", "ob": "Obadiah", "jon": "Jonah",
+    "mt": "Matthew", "mk": "Mark", "mrk": "Mark", "lk": "Luke", "jn": "John", "jhn": "John",
+    "ac": "Acts", "rm": "Romans", "ro": "Romans", "co": "Corinthians", "ga": "Galatians",
+    "php": "Philippians", "phil": "Philippians", "phm": "Philemon", "philem": "Philemon",
+    "th": "Thessalonians", "ti": "Timothy", "jas": "James", "jm": "James", "pt": "Peter",
+    "jud": "Jude", "jd": "Jude", "rv": "Revelation", "revelations": "Revelation",
+}
+_NUMERALS = {"i": "1", "ii": "2", "iii": "3", "first": "1", "second": "2", "third": "3"}
+
+_ITEM = re.compile(
+    r"^\s*(?P<book>(?:[1-3]|i{1,3}|first|second|third)?\s*[a-z][a-z .]*?)?\s*"
+    r"(?:(?P<c1>\d+)(?:\s*:\s*(?P<v1>\d+))?"
+    r"(?:\s*[-–—]\s*(?P<c2>\d+)(?:\s*:\s*(?P<v2>\d+))?)?)?\s*$",
+    re.IGNORECASE)
+
+
+class ReferenceParseError(ValueError):
+    """Raised when a verse reference cannot be understood."""
+
+
+def _normalize(name):
+    return re.sub(r"[\s.]+", "", name.lower())
+
+
+def _build_book_index():
+    names = {}
+    for number, name in enumerate(BOOKS, start=1):
+        names[_normalize(name)] = number
+    return names
+
+
+_BOOK_INDEX = _build_book_index()
+
+
+def resolve_book(text):
+    """Return the book number for a full name or abbreviation such as "1 Cor" or "Ps"."""
+    words = text.strip().lower().replace(".", " ").split()
+    if not words:
+        raise ReferenceParseError("Missing book name")
+    prefix = ""
+    if len(words) > 1 and words[0] in _NUMERALS:
+        prefix, words = _NUMERALS[words[0]], words[1:]
+    elif words[0][0].isdigit():
+        prefix, words[0] = words[0][0], words[0][1:]
+    name = "".join(words)
+    name = _normalize(_ABBREVIATIONS.get(name, name))
+
+    key = prefix + name
+    if key in _BOOK_INDEX:
+        return _BOOK_INDEX[key]
+    matches = [number for full, number in _BOOK_INDEX.items() if full.startswith(key)]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        raise ReferenceParseError(f"Ambiguous book name: {text.strip()}")
+    raise ReferenceParseError(f"Unknown book: {text.strip()}")
+
+
+def parse_references(text):
+    """Parse a reference list such as "John 3:16-18; Rom 8:28, 31-39" into `VerseRange`s.
+
+    Books may be abbreviated, and later items inherit the book and chapter of
+    the one before them: after "Rom 8:28" a bare "31-39" means verses 31-39
+    of Romans 8, while after "Ps 23" a bare "24" means Psalm 24. Ranges may
+    span chapters ("John 3:16-4:2") and whole chapters may be given
+    ("Gen 1-2").
+    """
+    ranges = []
+    book = None
+    for group in text.split(";"):
+        chapter = None
+        verse_mode = False
+        for item in group.split(","):
+            if not item.strip():
+                continue
+            match = _ITEM.match(item)
+            if not match or not (match.group("book") or match.group("c1")):
+                raise ReferenceParseError(f"Cannot read reference: {item.strip()}")
+            if match.group("book") and match.group("book").strip():
+                book = resolve_book(match.group("book"))
+                chapter, verse_mode = None, False
+            if book is None:
+                raise ReferenceParseError(f"Missing book name before: {item.strip()}")
+            if not match.group("c1"):
+                raise ReferenceParseError(f"Missing chapter in: {item.strip()}")
+
+            c1, v1, c2, v2 = (int(value) if value else None
+                              for value in match.group("c1", "v1", "c2", "v2"))
+            if book in SINGLE_CHAPTER_BOOKS and v1 is None and chapter is None:
+                # "Jude 3" names a verse, there being only one chapter
+                chapter, verse_mode = 1, True
+            if v1 is None and verse_mode:
+                # A bare number continues with verses of the current chapter
+                c1, v1 = chapter, c1
+                if c2 is not None and v2 is None:
+                    c2, v2 = chapter, c2
+
+            if v1 is None:
+                # Whole chapters: "Ps 23" or "Gen 1-2" or "Gen 1-2:3"
+                end_chapter = c2 if c2 is not None else c1
+                ranges.append(VerseRange(book, c1, 1, end_chapter, v2))
+                chapter, verse_mode = end_chapter, False
+            elif c2 is None:
+                ranges.append(VerseRange(book, c1, v1, c1, v1))
+                chapter, verse_mode = c1, True
+            elif v2 is None:
+                # "3:16-18": the second number is a verse in the same chapter
+                ranges.append(VerseRange(book, c1, v1, c1, c2))
+                chapter, verse_mode = c1, True
+            else:
+                ranges.append(VerseRange(book, c1, v1, c2, v2))
+                chapter, verse_mode = c2, True
+
+    for verse_range in ranges:
+        if (verse_range.end_chapter, verse_range.end_verse or 2 ** 31) < \
+                (verse_range.start_chapter, verse_range.start_verse):
+            raise ReferenceParseError(f"Range runs backwards: {format_reference(verse_range)}")
+    return ranges
+
+
+def format_reference(verse_range):
+    """Return the display form of a `VerseRange`, e.g. "John 3:16-18"."""
+    book, c1, v1, c2, v2 = verse_range
+    name = book_name(book)
+    if v1 == 1 and v2 is None:
+        return f"{name} {c1}" if c1 == c2 else f"{name} {c1}-{c2}"
+    if c1 == c2:
+        return f"{name} {c1}:{v1}" if v1 == v2 else f"{name} {c1}:{v1}-{v2}"
+    return f"{name} {c1}:{v1}-{c2}:{v2 if v2 is not None else ''}".rstrip(":")
+
+
+def format_verses(verses):
+    """Return the reference covering `[(book, chapter, verse, text), ...]`."""
+    first, last = verses[0], verses[-1]
+    return format_reference(VerseRange(first[0], first[1], first[2], last[1], last[2]))
+
+
+def verse_text(verses, numbered=True):
+    """Join verses into slide text, prefixing verse numbers when `numbered`."""
+    if not numbered or len(verses) == 1:
+        return " ".join(text for _, _, _, text in verses)
+    return " ".join(f"{verse} {text}" for _, _, verse, text in verses)
+
+
+def paginate(verses, fits, page_text=verse_text):
+    """Split verses into slide-sized pages.
+
+    `fits(text)` tells whether a block of text fits the slide's text box, and
+    `page_text(verses)` returns the text a page of verses is shown as.
+    Verses are kept whole and packed greedily; a verse that does not fit on
+    its own still gets a page to itself.
+    """
+    pages = []
+    page = []
+    for verse in verses:
+        candidate = page + [verse]
+        if page and not fits(page_text(candidate)):
+            pages.append(page)
+            candidate = [verse]
+        page = candidate
+    if page:
+        pages.append(page)
+    return pages
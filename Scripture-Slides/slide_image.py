@@ -0,0 +1,41 @@
+"""Drawing slides into PIL images, shared by the previews and the exporter.
+
+Nothing here touches Qt, so the headless command-line build and the export
+worker processes can use it without loading the GUI toolkit.
+"""
+from PIL import Image, ImageDraw
+
+from deck import SLIDE_WIDTH
+from image_cache import default_cache
+from text_layout import LINE_SPACING, SLIDE_TEXT_BOX, TEXT_INSETS, TextStyle, layout_text, load_font
+
+
+def draw_slide(size, image_path=None, text=None, style=None, box=None):
+    """Draw a slide's background and text into a new RGB `PIL.Image` of `size`.
+
+    Text is laid out by `text_layout` in `box` (default: `SLIDE_TEXT_BOX`),
+    like the text frames in the saved deck, so the image wraps the same way
+    at any size. Safe on any thread or process.
+    """
+    slide_width, slide_height = size
+    image = Image.new("RGB", (slide_width, slide_height), "white")
+    draw = ImageDraw.Draw(image)
+
+    if image_path:
+        # Decoded once per distinct image and shared by every slide using it
+        background = default_cache().variant(image_path, size)
+        image.paste(background, (0, 0))
+
+    if text:
+        style = style or TextStyle()
+        box = box or SLIDE_TEXT_BOX
+        layout = layout_text(text, style, box)
+        scale = slide_width / (SLIDE_WIDTH * 72)  # image pixels per point
+        body_font = load_font(style.name, max(1, round(layout.size * scale)), style.bold)
+        left, top, _, _ = box
+        x = (left + TEXT_INSETS[0]) * 72 * scale
+        y = (top + TEXT_INSETS[1]) * 72 * scale
+        for line in layout.lines:
+            draw.text((x, y), line, fill=style.color, font=body_font)
+            y += layout.size * LINE_SPACING * scale
+    return image
@@ -0,0 +1,171 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QSize, Qt, pyqtSignal
+
+from preview_cache import LEVELS, PreviewPixmapCache
+
+THUMBNAIL_LEVEL = LEVELS[0]
+THUMBNAIL_ICON_SIZE = QSize(160, 90)
+
+# Enough decoded thumbnails for a few screens of the strip; rows scrolled far
+# out of view are evicted and decoded again if they come back
+THUMBNAIL_CACHE_BYTES = 8 * 1024 * 1024
+
+
+class SlideListModel(QAbstractListModel):
+    """Slide strip model: one row per slide ID, labelled "Slide N" with a thumbnail.
+
+    Views only ask for the rows they paint, so thumbnails are decoded lazily
+    and only for visible rows, on a background thread, into a small bounded
+    cache. Rows are inserted, removed and moved individually instead of
+    rebuilding the list, and the "Slide N" labels follow the row position.
+
+    `previewWanted` is emitted when a row without a preview is painted, so
+    slides of an opened deck can be read and rendered as they scroll into view.
+    Rows marked stale, e.g. after a theme change, keep their thumbnail but ask
+    for a new preview the same way.
+    """
+
+    SlideIdRole = Qt.UserRole
+
+    previewWanted = pyqtSignal(object)  # slide ID
+
+    def __init__(self, parent=None, max_thumbnail_bytes=THUMBNAIL_CACHE_BYTES):
+        super(SlideListModel, self).__init__(parent)
+        self._slide_ids = []
+        self._rows = {}
+        self._previews = {}
+        self._stale = set()
+        self.thumbnails = PreviewPixmapCache(self, max_bytes=max_thumbnail_bytes)
+        self.thumbnails.pixmapReady.connect(self._on_thumbnail_ready)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._slide_ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        slide_id = self._slide_ids[index.row()]
+        if role == Qt.DisplayRole:
+            return f"Slide {index.row() + 1}"
+        if role == self.SlideIdRole:
+            return slide_id
+        if role == Qt.DecorationRole:
+            return self._thumbnail(slide_id)
+        return None
+
+    def slide_ids(self):
+        return list(self._slide_ids)
+
+    def slide_id(self, row):
+        """Return the slide ID at `row`, or None."""
+        return self._slide_ids[row] if 0 <= row < len(self._slide_ids) else None
+
+    def row_of(self, slide_id):
+        """Return the row showing `slide_id`, or -1."""
+        return self._rows.get(slide_id, -1)
+
+    def set_slides(self, slide_ids, previews=None):
+        """Replace the whole list, e.g. when a deck is opened."""
+        self.beginResetModel()
+        self._slide_ids = list(slide_ids)
+        self._previews = dict(previews or {})
+        self._stale.clear()
+        self._reindex()
+        self.thumbnails.clear()
+        self.endResetModel()
+
+    def sync(self, slide_ids, previews):
+        """Bring the list in line with `slide_ids`, touching only what changed."""
+        slide_ids = list(slide_ids)
+        if slide_ids != self._slide_ids:
+            self.set_slides(slide_ids, previews)
+            return
+        for slide_id in slide_ids:
+            if self._previews.get(slide_id) != previews.get(slide_id):
+                self.set_preview(slide_id, previews.get(slide_id))
+
+    def insert_slides(self, row, slide_ids):
+        """Insert `slide_ids` at `row`."""
+        if not slide_ids:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(slide_ids) - 1)
+        self._slide_ids[row:row] = slide_ids
+        self._reindex()
+        self.endInsertRows()
+        self._relabel(row + len(slide_ids))
+
+    def remove_slide(self, row):
+        """Remove the row at `row` and return its slide ID."""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        slide_id = self._slide_ids.pop(row)
+        self._previews.pop(slide_id, None)
+        self._stale.discard(slide_id)
+        self._reindex()
+        self.endRemoveRows()
+        self._relabel(row)
+        self.thumbnails.invalidate(slide_id)
+        return slide_id
+
+    def move_slide(self, row, new_row):
+        """Move the row at `row` so that it ends up at `new_row`."""
+        if row == new_row:
+            return
+        # Qt wants the destination as the row to insert before, in the old order
+        destination = new_row + 1 if new_row > row else new_row
+        self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), destination)
+        self._slide_ids.insert(new_row, self._slide_ids.pop(row))
+        self._reindex()
+        self.endMoveRows()
+        # The labels of every row between the two positions changed
+        first, last = min(row, new_row), max(row, new_row)
+        self.dataChanged.emit(self.index(first), self.index(last), [Qt.DisplayRole])
+
+    def set_preview(self, slide_id, preview_path):
+        """Point `slide_id` at a new preview image and refresh its thumbnail."""
+        if preview_path:
+            self._previews[slide_id] = preview_path
+        else:
+            self._previews.pop(slide_id, None)
+        self._stale.discard(slide_id)
+        self.thumbnails.invalidate(slide_id)
+        self._emit_changed(slide_id, Qt.DecorationRole)
+
+    def mark_stale(self, slide_ids):
+        """Have the painted rows of `slide_ids` ask for new previews."""
+        self._stale.update(slide_ids)
+        if self._stale and self._slide_ids:
+            self.dataChanged.emit(self.index(0), self.index(len(self._slide_ids) - 1),
+                                  [Qt.DecorationRole])
+
+    def shutdown(self):
+        self.thumbnails.shutdown()
+
+    def _thumbnail(self, slide_id):
+        preview_path = self._previews.get(slide_id)
+        if slide_id in self._stale or not preview_path:
+            self.previewWanted.emit(slide_id)
+        if not preview_path:
+            return None
+        pixmap = self.thumbnails.cached(slide_id, preview_path, THUMBNAIL_LEVEL)
+        if pixmap is None:
+            self.thumbnails.prefetch([(slide_id, preview_path)], THUMBNAIL_LEVEL)
+        return pixmap
+
+    def _on_thumbnail_ready(self, slide_id, level):
+        if level == THUMBNAIL_LEVEL:
+            self._emit_changed(slide_id, Qt.DecorationRole)
+
+    def _emit_changed(self, slide_id, role):
+        row = self.row_of(slide_id)
+        if row >= 0:
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [role])
+
+    def _relabel(self, first):
+        # Every row from `first` on moved by the insert or removal, so its
+        # "Slide N" label changed
+        if first < len(self._slide_ids):
+            self.dataChanged.emit(self.index(first), self.index(len(self._slide_ids) - 1),
+                                  [Qt.DisplayRole])
+
+    def _reindex(self):
+        self._rows = {slide_id: row for row, slide_id in enumerate(self._slide_ids)}
@@ -0,0 +1,150 @@
+import copy
+from collections import namedtuple
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.packuri import PackURI
+from pptx.oxml.ns import qn
+
+# Attributes in slide XML that point at a relationship of the slide part
+_REL_ATTRIBUTES = (qn("r:embed"), qn("r:link"), qn("r:id"))
+
+# A slide taken out of the deck by `SlideManager.detach`, ready to be put back
+DetachedSlide = namedtuple("DetachedSlide", "index sldId part record")
+
+
+class SlideManager:
+    """Deletes, moves and duplicates slides in place by editing the slide ID list.
+
+    Slides are addressed by their stable slide ID (`slide.slide_id`) rather than
+    by position, so callers can key previews and list entries on an ID that
+    survives reordering. No other slide is touched by any operation.
+
+    `changed`, if given, is called with the parts each operation modified,
+    and `document`, if given, is a `document.Document` kept in step.
+    """
+
+    def __init__(self, prs, changed=None, document=None):
+        self.prs = prs
+        self._changed = changed or (lambda *parts: None)
+        self._document = document
+        self._last_part_number = None  # highest N used in a /ppt/slides/slideN.xml name
+
+    @property
+    def _sldIdLst(self):
+        return self.prs.slides._sldIdLst
+
+    def slide_ids(self):
+        """Return the slide IDs in deck order."""
+        return [sldId.id for sldId in self._sldIdLst.sldId_lst]
+
+    def slide(self, slide_id):
+        """Return the slide with `slide_id`, or None."""
+        return self.prs.slides.get(slide_id)
+
+    def index_of(self, slide_id):
+        """Return the zero-based position of `slide_id` in the deck."""
+        return self.slide_ids().index(slide_id)
+
+    def delete(self, slide_id):
+        """Remove the slide with `slide_id` from the deck.
+
+        The slide part becomes unreachable and is simply not written on save;
+        shared parts such as background pictures stay with the slides that still
+        reference them.
+        """
+        self.detach(slide_id)
+
+    def detach(self, slide_id):
+        """Remove the slide with `slide_id` but return it as a `DetachedSlide`.
+
+        The slide part and its shapes are kept as they are, so `attach` can put
+        the very same slide, with the same slide ID, back in place.
+        """
+        sldId = self._find(slide_id)
+        index = self._sldIdLst.index(sldId)
+        part = self.prs.part.related_part(sldId.rId)
+        self._sldIdLst.remove(sldId)
+        self.prs.part.rels.pop(sldId.rId)
+        self._changed(self.prs.part)
+        record = self._document.remove_slide(slide_id) if self._document is not None else None
+        return DetachedSlide(index, sldId, part, record)
+
+    def attach(self, detached):
+        """Put a slide returned by `detach` back at its old position."""
+        sldId = detached.sldId
+        sldId.rId = self.prs.part.relate_to(detached.part, RT.SLIDE)
+        self._sldIdLst.insert(detached.index, sldId)
+        self._changed(self.prs.part, detached.part)
+        if self._document is not None and detached.record is not None:
+            self._document.restore_slide(detached.record, detached.index)
+
+    def add_slide(self, layout):
+        """Append a slide using `layout` and return it."""
+        partname = self._free_partname()
+        slide = self.prs.slides.add_slide(layout)
+        slide.part.partname = partname
+        return slide
+
+    def move(self, slide_id, new_index):
+        """Move the slide with `slide_id` to position `new_index`."""
+        sldId = self._find(slide_id)
+        self._sldIdLst.remove(sldId)
+        new_index = max(0, min(new_index, len(self._sldIdLst)))
+        self._sldIdLst.insert(new_index, sldId)
+        self._changed(self.prs.part)
+        if self._document is not None:
+            self._document.move_slide(slide_id, new_index)
+
+    def duplicate(self, slide_id):
+        """Insert a copy of the slide right after it and return the new slide.
+
+        Shapes are deep-copied and their relationships re-pointed at the same
+        target parts, so a duplicated picture shares its image part with the
+        original instead of being embedded again.
+        """
+        source = self.slide(slide_id)
+        if source is None:
+            raise KeyError(slide_id)
+        duplicate = self.add_slide(source.slide_layout)
+
+        rId_map = {}
+        for rId, rel in source.part.rels.items():
+            if rel.reltype in (RT.SLIDE_LAYOUT, RT.NOTES_SLIDE):
+                continue
+            if rel.is_external:
+                rId_map[rId] = duplicate.part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+            else:
+                rId_map[rId] = duplicate.part.relate_to(rel.target_part, rel.reltype)
+
+        cSld = copy.deepcopy(source._element.cSld)
+        for element in cSld.iter():
+            for attribute in _REL_ATTRIBUTES:
+                rId = element.get(attribute)
+                if rId in rId_map:
+                    element.set(attribute, rId_map[rId])
+        duplicate._element.replace(duplicate._element.cSld, cSld)
+        self._changed(duplicate.part)
+
+        new_index = self.index_of(slide_id) + 1
+        if self._document is not None:
+            self._document.copy_slide(slide_id, duplicate.slide_id, new_index)
+        self.move(duplicate.slide_id, new_index)
+        return duplicate
+
+    def _free_partname(self):
+        # python-pptx names a new slide part after the slide count, which is
+        # taken after a delete; number new parts past every name ever used
+        # instead, including those of detached slides that may come back
+        if self._last_part_number is None:
+            self._last_part_number = max(
+                (rel.target_part.partname.idx or 0 for rel in self.prs.part.rels.values()
+                 if rel.reltype == RT.SLIDE), default=0)
+        self._last_part_number += 1
+        return PackURI(f"/ppt/slides/slide{self._last_part_number}.xml")
+
+    def _find(self, slide_id):
+        for sldId in self._sldIdLst.sldId_lst:
+            if sldId.id == slide_id:
+                return sldId
+        raise KeyError(slide_id)
+
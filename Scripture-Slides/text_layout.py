@@ -0,0 +1,217 @@
+"""Font sizing and line breaking for slide text boxes.
+
+The same glyph widths drive the slide previews and the text frames written
+to the .pptx, so both break lines in the same places. Widths come from the
+font's TrueType file through PIL and are memoized per font, which keeps a
+layout cheap enough to redo on every keystroke or for thousands of verses.
+"""
+import threading
+from collections import namedtuple
+from functools import lru_cache
+
+from PIL import ImageFont
+
+# Verse text box on each slide: left, top, width, height in inches
+SLIDE_TEXT_BOX = (1, 1, 18, 9.25)
+
+# PowerPoint's default text frame insets (left/right, top/bottom) in inches
+TEXT_INSETS = (0.1, 0.05)
+LINE_SPACING = 1.2  # line height as a multiple of the font size
+MIN_FONT_SIZE = 8
+
+_REFERENCE_SIZE = 1000  # glyph widths are measured once at this size
+
+# Common family names whose files are not simply "<family>.ttf"
+_FONT_FILES = {
+    ("arial", False): ["arial.ttf", "Arial.ttf", "LiberationSans-Regular.ttf"],
+    ("arial", True): ["arialbd.ttf", "Arial Bold.ttf", "LiberationSans-Bold.ttf"],
+    ("times new roman", False): ["times.ttf", "Times New Roman.ttf", "LiberationSerif-Regular.ttf"],
+    ("times new roman", True): ["timesbd.ttf", "Times New Roman Bold.ttf", "LiberationSerif-Bold.ttf"],
+}
+_FALLBACK_FILES = {False: ["DejaVuSans.ttf"], True: ["DejaVuSans-Bold.ttf", "DejaVuSans.ttf"]}
+
+
+class TextLayout(namedtuple("TextLayout", "size paragraphs fits")):
+    """A font size and the wrapped lines of each paragraph at that size."""
+
+    __slots__ = ()
+
+    @property
+    def lines(self):
+        return [line for paragraph in self.paragraphs for line in paragraph]
+
+    def text(self, line_break="\n"):
+        """Join the lines with `line_break` and the paragraphs with newlines."""
+        return "\n".join(line_break.join(paragraph) for paragraph in self.paragraphs)
+
+
+class TextStyle:
+    """Font settings applied to slide text."""
+
+    __slots__ = ("name", "size", "bold", "color")
+
+    def __init__(self, name="Arial", size=20, bold=False, color=(0, 0, 0)):
+        self.name = name
+        self.size = size
+        self.bold = bold
+        self.color = tuple(color)
+
+
+def load_font(family, size, bold=False):
+    """Return a PIL font for `family` at `size` pixels, falling back to a bundled one."""
+    for file_name in _font_files(family, bold):
+        try:
+            return ImageFont.truetype(file_name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size=size)
+
+
+def _font_files(family, bold):
+    key = (family.lower(), bool(bold))
+    compact = family.replace(" ", "")
+    suffixes = ("-Bold", " Bold", "bd") if bold else ("", "-Regular")
+    candidates = list(_FONT_FILES.get(key, []))
+    candidates += [f"{name}{suffix}.ttf" for name in (family, compact) for suffix in suffixes]
+    return candidates + _FALLBACK_FILES[bool(bold)]
+
+
+class GlyphWidths:
+    """Advance widths of one font, in ems, memoized per character and per word.
+
+    A table is shared by every thread laying out text in its font. The
+    FreeType face behind it is not thread-safe, so measuring a character
+    not seen before holds a lock; memoized widths are read without one.
+    """
+
+    def __init__(self, family, bold=False):
+        self.family = family
+        self.bold = bold
+        self._font = load_font(family, _REFERENCE_SIZE, bold)
+        self._font_lock = threading.Lock()
+        self._chars = {}
+        self._words = {}
+        self.space = self.char(" ")
+
+    def char(self, char):
+        width = self._chars.get(char)
+        if width is None:
+            with self._font_lock:
+                width = self._chars.get(char)
+                if width is None:
+                    width = self._chars[char] = self._font.getlength(char) / _REFERENCE_SIZE
+        return width
+
+    def word(self, word):
+        width = self._words.get(word)
+        if width is None:
+            width = sum(self.char(char) for char in word)
+            if len(self._words) < 100000:
+                self._words[word] = width
+        return width
+
+
+@lru_cache(maxsize=None)
+def glyph_widths(family, bold=False):
+    """Return the shared `GlyphWidths` table for a font."""
+    return GlyphWidths(family, bool(bold))
+
+
+def content_size(box=SLIDE_TEXT_BOX):
+    """Return the usable `(width, height)` of `box` in points, inside the insets."""
+    _, _, width, height = box
+    inset_x, inset_y = TEXT_INSETS
+    return (width - 2 * inset_x) * 72, (height - 2 * inset_y) * 72
+
+
+def wrap(text, widths, size, max_width):
+    """Break each paragraph of `text` into lines no wider than `max_width` points."""
+    max_em = max_width / size
+    paragraphs = []
+    for paragraph in text.split("\n"):
+        lines = []
+        line, line_em = [], 0.0
+        for word in paragraph.split(" "):
+            word_em = widths.word(word)
+            if line and line_em + widths.space + word_em > max_em:
+                lines.append(" ".join(line))
+                line, line_em = [], 0.0
+            if word_em > max_em:
+                # A word wider than the box is broken between characters
+                for chunk in _split_word(word, widths, max_em):
+                    if line:
+                        lines.append(" ".join(line))
+                    line, line_em = [chunk], widths.word(chunk)
+                continue
+            line_em += word_em + (widths.space if line else 0.0)
+            line.append(word)
+        lines.append(" ".join(line))
+        paragraphs.append(lines)
+    return paragraphs
+
+
+def _split_word(word, widths, max_em):
+    chunk, chunk_em = "", 0.0
+    for char in word:
+        char_em = widths.char(char)
+        if chunk and chunk_em + char_em > max_em:
+            yield chunk
+            chunk, chunk_em = "", 0.0
+        chunk += char
+        chunk_em += char_em
+    yield chunk
+
+
+def layout_at(text, style, size, box=SLIDE_TEXT_BOX):
+    """Lay out `text` in `box` at a fixed `size`."""
+    width, height = content_size(box)
+    paragraphs = wrap(text, glyph_widths(style.name, style.bold), size, width)
+    line_count = sum(len(lines) for lines in paragraphs)
+    return TextLayout(size, paragraphs, line_count * size * LINE_SPACING <= height)
+
+
+def layout_text(text, style, box=SLIDE_TEXT_BOX, min_size=MIN_FONT_SIZE):
+    """Return the largest layout of `text` in `box` up to `style.size` points.
+
+    Binary search over whole point sizes between `min_size` and the style's
+    size. If even `min_size` overflows, that layout is returned with
+    `fits` set to False.
+    """
+    best = layout_at(text, style, style.size, box)
+    if best.fits or style.size <= min_size:
+        return best
+    best = layout_at(text, style, min_size, box)
+    if not best.fits:
+        return best
+    low, high = min_size + 1, style.size - 1
+    while low <= high:
+        size = (low + high) // 2
+        layout = layout_at(text, style, size, box)
+        if layout.fits:
+            best, low = layout, size + 1
+        else:
+            high = size - 1
+    return best
+
+
+def break_positions(text, layout):
+    """Return the indices of the spaces in `text` where `layout` starts a new line.
+
+    Lines that end inside a word too wide for the box have no space to
+    replace, so they are not included.
+    """
+    positions = []
+    position = 0
+    for lines in layout.paragraphs:
+        for line in lines[:-1]:
+            position += len(line)
+            if text[position:position + 1] == " ":
+                positions.append(position)
+                position += 1
+        position += len(lines[-1]) + 1  # the last line and its newline
+    return positions
+
+
+def text_fits(text, style, box=SLIDE_TEXT_BOX):
+    """Return whether `text` fits `box` at the style's size."""
+    return layout_at(text, style, style.size, box).fits
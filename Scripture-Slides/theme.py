@@ -0,0 +1,225 @@
+"""Named slide themes: background, text style and text box, kept in the slide layout.
+
+A theme is written once into the layout new slides use (see
+`write_theme_layout`): the layout's background, and a body placeholder whose
+position and list style carry the text box and font. Slides reference the
+layout, so they show the theme without a picture or font of their own, and
+switching themes rewrites one layout part however many slides the deck has.
+
+Themes are also saved as small JSON presets (`save_theme`, `load_theme`).
+"""
+import json
+import os
+
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Emu, Inches
+
+from text_layout import SLIDE_TEXT_BOX, TextStyle
+
+THEME_LAYOUT_PREFIX = "Scripture Slides Theme: "
+THEME_BODY_IDX = 1  # placeholder index of the theme text box on layout and slides
+WHITE = (255, 255, 255)
+
+# Solid backgrounds are drawn into small images here, one per colour, so the
+# previews scale and cache them like any background picture
+THEME_FOLDER = "./slide_previews/themes/"
+_SOLID_SIZE = (16, 9)
+
+
+class Theme:
+    """A named look for a deck's slides.
+
+    `background` is a picture path, or None for the solid `color`; `box` is
+    the text box (left, top, width, height) in inches.
+    """
+
+    __slots__ = ("name", "background", "color", "style", "box")
+
+    def __init__(self, name, background=None, color=WHITE, style=None, box=SLIDE_TEXT_BOX):
+        self.name = name
+        self.background = background
+        self.color = tuple(color)
+        self.style = style or TextStyle()
+        self.box = tuple(box)
+
+    def text_key(self):
+        """What slide text is laid out against; equal keys break lines the same way."""
+        style = self.style
+        return (style.name, style.size, bool(style.bold), style.color, self.box)
+
+    def preview_background(self):
+        """The picture previews draw behind the slides, or None for plain white."""
+        if self.background:
+            return self.background
+        if self.color == WHITE:
+            return None
+        return _solid_background(self.color)
+
+    def to_dict(self):
+        style = self.style
+        return {"name": self.name, "background": self.background, "color": _hex(self.color),
+                "font": {"name": style.name, "size": style.size, "bold": style.bold,
+                         "color": _hex(style.color)},
+                "box": list(self.box)}
+
+    @classmethod
+    def from_dict(cls, values):
+        font = values.get("font", {})
+        default = TextStyle()
+        style = TextStyle(font.get("name", default.name), font.get("size", default.size),
+                          font.get("bold", default.bold),
+                          _rgb(font["color"]) if "color" in font else default.color)
+        return cls(values["name"], values.get("background"),
+                   _rgb(values["color"]) if "color" in values else WHITE, style,
+                   values.get("box", SLIDE_TEXT_BOX))
+
+
+BUILTIN_THEMES = (
+    Theme("Plain"),
+    Theme("Night", color=(16, 24, 48), style=TextStyle("Arial", 40, True, (255, 255, 255))),
+    Theme("Parchment", color=(244, 236, 216),
+          style=TextStyle("Times New Roman", 36, False, (74, 52, 30))),
+)
+DEFAULT_THEME = BUILTIN_THEMES[0]
+
+
+def load_theme(path):
+    """Read a theme preset; a relative background path is taken from the preset's folder."""
+    with open(path, encoding="utf-8") as theme_file:
+        theme = Theme.from_dict(json.load(theme_file))
+    if theme.background and not os.path.isabs(theme.background):
+        theme.background = os.path.join(os.path.dirname(os.path.abspath(path)), theme.background)
+    return theme
+
+
+def save_theme(theme, path):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as theme_file:
+        json.dump(theme.to_dict(), theme_file, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+def is_theme_layout(layout):
+    return layout.name.startswith(THEME_LAYOUT_PREFIX)
+
+
+def write_theme_layout(layout, theme, image_part=None):
+    """Make `layout` show `theme`; None turns it back into a plain blank layout.
+
+    `image_part` is the package's part for the theme's background picture.
+    The layout's previous background and theme text box are replaced.
+    """
+    cSld = layout._element.cSld
+    for bg in cSld.findall(qn("p:bg")):
+        rIds = bg.xpath("./p:bgPr/a:blipFill/a:blip/@r:embed")
+        cSld.remove(bg)
+        for rId in rIds:
+            layout.part.drop_rel(rId)
+    body = _body_sp(layout)
+    if body is not None:
+        body.getparent().remove(body)
+    if theme is None:
+        cSld.set("name", "Blank")
+        return
+
+    cSld.set("name", THEME_LAYOUT_PREFIX + theme.name)
+    if image_part is not None:
+        rId = layout.part.relate_to(image_part, RT.IMAGE)
+        fill = (f'<a:blipFill dpi="0" rotWithShape="1"><a:blip r:embed="{rId}"/><a:srcRect/>'
+                f'<a:stretch><a:fillRect/></a:stretch></a:blipFill>')
+    else:
+        fill = f'<a:solidFill><a:srgbClr val="{_hex(theme.color)}"/></a:solidFill>'
+    cSld.insert(0, parse_xml(f'<p:bg {nsdecls("p", "a", "r")}><p:bgPr>{fill}<a:effectLst/>'
+                             f'</p:bgPr></p:bg>'))
+
+    spTree = cSld.spTree
+    shape_id = max([int(value) for value in spTree.xpath(".//p:cNvPr/@id")] or [0]) + 1
+    left, top, width, height = (Inches(value) for value in theme.box)
+    style = theme.style
+    spTree.insert_element_before(parse_xml(
+        f'<p:sp {nsdecls("p", "a")}>'
+        f'<p:nvSpPr><p:cNvPr id="{shape_id}" name="Theme Text"/>'
+        f'<p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+        f'<p:nvPr><p:ph type="body" idx="{THEME_BODY_IDX}"/></p:nvPr></p:nvSpPr>'
+        f'<p:spPr><a:xfrm><a:off x="{left}" y="{top}"/><a:ext cx="{width}" cy="{height}"/>'
+        f'</a:xfrm></p:spPr>'
+        f'<p:txBody><a:bodyPr wrap="square"><a:noAutofit/></a:bodyPr>'
+        f'<a:lstStyle><a:lvl1pPr marL="0" indent="0"><a:spcBef><a:spcPts val="0"/></a:spcBef>'
+        f'<a:buNone/><a:defRPr sz="{round(style.size * 100)}" b="{int(bool(style.bold))}">'
+        f'<a:solidFill><a:srgbClr val="{_hex(style.color)}"/></a:solidFill>'
+        f'<a:latin typeface="{_attribute(style.name)}"/></a:defRPr></a:lvl1pPr></a:lstStyle>'
+        f'<a:p><a:endParaRPr lang="en-US"/></a:p></p:txBody></p:sp>'), "p:extLst")
+
+
+def read_theme_layout(layout, picture_path):
+    """Return the `Theme` written into `layout`, or None if it holds none.
+
+    `picture_path(image_part)` returns a file the background picture can be
+    read from.
+    """
+    if not is_theme_layout(layout):
+        return None
+    cSld = layout._element.cSld
+    background, color = None, WHITE
+    rIds = cSld.xpath("./p:bg/p:bgPr/a:blipFill/a:blip/@r:embed")
+    if rIds:
+        background = picture_path(layout.part.related_part(rIds[0]))
+    colors = cSld.xpath("./p:bg/p:bgPr/a:solidFill/a:srgbClr/@val")
+    if colors:
+        color = _rgb(colors[0])
+
+    style, box = TextStyle(), SLIDE_TEXT_BOX
+    body = _body_sp(layout)
+    if body is not None:
+        offsets = body.xpath("./p:spPr/a:xfrm/a:off")
+        extents = body.xpath("./p:spPr/a:xfrm/a:ext")
+        if offsets and extents:
+            (off,), (ext,) = offsets, extents
+            box = tuple(round(Emu(int(value)).inches, 4)
+                        for value in (off.get("x"), off.get("y"), ext.get("cx"), ext.get("cy")))
+        fonts = body.xpath("./p:txBody/a:lstStyle/a:lvl1pPr/a:defRPr")
+        if fonts:
+            font = fonts[0]
+            typefaces = font.xpath("./a:latin/@typeface")
+            font_colors = font.xpath("./a:solidFill/a:srgbClr/@val")
+            style = TextStyle(typefaces[0] if typefaces else style.name,
+                              round(int(font.get("sz", style.size * 100)) / 100),
+                              font.get("b") in ("1", "true"),
+                              _rgb(font_colors[0]) if font_colors else style.color)
+    return Theme(layout.name[len(THEME_LAYOUT_PREFIX):], background, color, style, box)
+
+
+def _body_sp(layout):
+    shapes = layout._element.cSld.spTree.xpath(
+        f"./p:sp[p:nvSpPr/p:nvPr/p:ph[@idx='{THEME_BODY_IDX}']]")
+    return shapes[0] if shapes else None
+
+
+def _solid_background(color):
+    from PIL import Image
+
+    path = os.path.join(THEME_FOLDER, f"solid_{_hex(color)}.png")
+    if not os.path.exists(path):
+        os.makedirs(THEME_FOLDER, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        Image.new("RGB", _SOLID_SIZE, color).save(tmp_path, format="PNG")
+        os.replace(tmp_path, path)
+    return path
+
+
+def _hex(color):
+    return "".join(f"{channel:02X}" for channel in color)
+
+
+def _rgb(value):
+    if isinstance(value, str):
+        return tuple(bytes.fromhex(value.lstrip("#")))
+    return tuple(value)
+
+
+def _attribute(text):
+    return (text.replace("&", "&amp;").replace('"', "&quot;")
+            .replace("<", "&lt;").replace(">", "&gt;"))
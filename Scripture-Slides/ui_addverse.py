@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'AddVerse.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_AddVerse(object):
+    def setupUi(self, AddVerse):
+        AddVerse.setObjectName("AddVerse")
+        AddVerse.resize(400, 400)
+        AddVerse.setMinimumSize(QtCore.QSize(400, 400))
+        AddVerse.setMaximumSize(QtCore.QSize(400, 400))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        AddVerse.setFont(font)
+        self.FontComboBox = QtWidgets.QComboBox(AddVerse)
+        self.FontComboBox.setGeometry(QtCore.QRect(280, 10, 100, 31))
+        self.FontComboBox.setStyleSheet("QComboBox#FontComboBox {\n"
+"    font-family: \'Inter 18pt\', sans-serif;\n"
+"    font-size: 10pt;\n"
+"    color: black;\n"
+"    background-color: white;\n"
+"    border: 1px solid #ccc;\n"
+"    padding: 5px;\n"
+"    border-radius: 8px;\n"
+"}\n"
+"\n"
+"QComboBox#FontComboBox::drop-down {\n"
+"    background-color: transparent;\n"
+"    width: 30px;\n"
+"}\n"
+"\n"
+"QComboBox#FontComboBox::drop-down:hover {\n"
+"   background-color: #EFEFEF;\n"
+"   border-radius: 8px;\n"
+"}\n"
+"\n"
+"QComboBox#FontComboBox::drop-down:pressed {\n"
+"   background-color: #BFBFBF;\n"
+"}\n"
+"\n"
+"QComboBox#FontComboBox::down-arrow {\n"
+"    image: url(C:/Users/markt/Scripture-Slides/Scripture-Slides/assets/arrowDown.png);\n"
+"    width: 18px;\n"
+"    height: 18px;\n"
+"}\n"
+"\n"
+"QComboBox#FontComboBox QAbstractItemView {\n"
+"    font-family: \'Inter 18pt\', sans-serif;\n"
+"    font-size: 10pt;\n"
+"    color: black;\n"
+"    background-color: white;\n"
+"    border: none;\n"
+"}\n"
+"")
+        self.FontComboBox.setObjectName("FontComboBox")
+        self.FontComboBox.addItem("")
+        self.FontComboBox.addItem("")
+        self.FontComboBox.addItem("")
+        self.labelReference = QtWidgets.QLabel(AddVerse)
+        self.labelReference.setGeometry(QtCore.QRect(20, 60, 120, 20))
+        self.labelReference.setObjectName("labelReference")
+        self.lineEditReference = QtWidgets.QLineEdit(AddVerse)
+        self.lineEditReference.setGeometry(QtCore.QRect(150, 60, 230, 25))
+        self.lineEditReference.setObjectName("lineEditReference")
+        self.resultsListWidget = QtWidgets.QListWidget(AddVerse)
+        self.resultsListWidget.setGeometry(QtCore.QRect(20, 150, 360, 160))
+        font = QtGui.QFont()
+        font.setPointSize(9)
+        self.resultsListWidget.setFont(font)
+        self.resultsListWidget.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+        self.resultsListWidget.setWordWrap(True)
+        self.resultsListWidget.setObjectName("resultsListWidget")
+        self.addButton = QtWidgets.QPushButton(AddVerse)
+        self.addButton.setGeometry(QtCore.QRect(220, 320, 75, 30))
+        self.addButton.setObjectName("addButton")
+        self.cancelButton = QtWidgets.QPushButton(AddVerse)
+        self.cancelButton.setGeometry(QtCore.QRect(300, 320, 75, 30))
+        self.cancelButton.setObjectName("cancelButton")
+        self.checkBox = QtWidgets.QCheckBox(AddVerse)
+        self.checkBox.setGeometry(QtCore.QRect(30, 100, 271, 41))
+        font = QtGui.QFont()
+        font.setPointSize(10)
+        self.checkBox.setFont(font)
+        self.checkBox.setChecked(False)
+        self.checkBox.setTristate(False)
+        self.checkBox.setObjectName("checkBox")
+
+        self.retranslateUi(AddVerse)
+        QtCore.QMetaObject.connectSlotsByName(AddVerse)
+
+    def retranslateUi(self, AddVerse):
+        _translate = QtCore.QCoreApplication.translate
+        AddVerse.setWindowTitle(_translate("AddVerse", "Add Verse"))
+        self.FontComboBox.setItemText(0, _translate("AddVerse", "NIV"))
+        self.FontComboBox.setItemText(1, _translate("AddVerse", "ESV"))
+        self.FontComboBox.setItemText(2, _translate("AddVerse", "NKJV"))
+        self.labelReference.setText(_translate("AddVerse", "Verse Reference:"))
+        self.addButton.setText(_translate("AddVerse", "Confirm"))
+        self.cancelButton.setText(_translate("AddVerse", "Cancel"))
+        self.checkBox.setText(_translate("AddVerse", "Continue to Next Slide if verse exceeds"))
+
+
+UI_SHA1 = "974ee539f8121a83940920ddd054dccb021dbbaa"
@@ -0,0 +1,35 @@
+import importlib
+import os
+
+from PyQt5.QtCore import QDir
+
+from build_ui import ASSETS_PREFIX, UI_DIR, compiled_module_name, ui_digest
+
+QDir.addSearchPath(ASSETS_PREFIX, os.path.join(UI_DIR, "assets"))
+
+
+def setup_ui(widget, ui_file):
+    """Build the widgets described by `ui_file` onto `widget`, like `uic.loadUi`.
+
+    Uses the module precompiled by build_ui.py when it was compiled from the
+    .ui file as it is now, which avoids parsing XML at startup. Falls back
+    to `loadUi` while a .ui file is being edited and has not been rebuilt yet.
+    """
+    ui_path = os.path.join(UI_DIR, ui_file)
+    try:
+        module = importlib.import_module(compiled_module_name(ui_file))
+    except ImportError:
+        module = None
+    if module is None or (os.path.exists(ui_path) and
+                          getattr(module, "UI_SHA1", None) != ui_digest(ui_path)):
+        from PyQt5.uic import loadUi
+        loadUi(ui_path, widget)
+        return
+
+    ui_class = next(value for name, value in vars(module).items() if name.startswith("Ui_"))
+    ui = ui_class()
+    ui.setupUi(widget)
+
+    # Expose child widgets as attributes of `widget`, as loadUi does
+    for name, value in vars(ui).items():
+        setattr(widget, name, value)
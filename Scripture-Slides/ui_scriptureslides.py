@@ -0,0 +1,691 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'ScriptureSlides.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_MainWindow(object):
+    def setupUi(self, MainWindow):
+        MainWindow.setObjectName("MainWindow")
+        MainWindow.resize(1200, 700)
+        MainWindow.setMinimumSize(QtCore.QSize(1200, 700))
+        MainWindow.setMaximumSize(QtCore.QSize(1200, 700))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        MainWindow.setFont(font)
+        icon = QtGui.QIcon()
+        icon.addPixmap(QtGui.QPixmap("assets:ScriptureSlidesIcon.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        MainWindow.setWindowIcon(icon)
+        MainWindow.setStyleSheet("")
+        self.centralwidget = QtWidgets.QWidget(MainWindow)
+        self.centralwidget.setStyleSheet("#centralwidget{\n"
+"    border: 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QWidget {\n"
+"    background-color: white;\n"
+"    border: 1px solid #dcdcdc;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"\n"
+"QLabel{\n"
+"    border: 0px;\n"
+"}\n"
+"\n"
+"QPushButton:hover{\n"
+"    background-color: #EFEFEF;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: #BFBFBF;\n"
+"}\n"
+"")
+        self.centralwidget.setObjectName("centralwidget")
+        self.MainButtons = QtWidgets.QWidget(self.centralwidget)
+        self.MainButtons.setGeometry(QtCore.QRect(50, 490, 441, 161))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.MainButtons.setFont(font)
+        self.MainButtons.setStyleSheet("#MainButtons{\n"
+"    border-radius: 0px;\n"
+"}")
+        self.MainButtons.setObjectName("MainButtons")
+        self.addSlideBtn = QtWidgets.QPushButton(self.MainButtons)
+        self.addSlideBtn.setGeometry(QtCore.QRect(30, 20, 41, 41))
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        self.addSlideBtn.setFont(font)
+        self.addSlideBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.addSlideBtn.setStyleSheet("")
+        self.addSlideBtn.setText("")
+        icon1 = QtGui.QIcon()
+        icon1.addPixmap(QtGui.QPixmap("assets:plus.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.addSlideBtn.setIcon(icon1)
+        self.addSlideBtn.setIconSize(QtCore.QSize(16, 16))
+        self.addSlideBtn.setObjectName("addSlideBtn")
+        self.label = QtWidgets.QLabel(self.MainButtons)
+        self.label.setGeometry(QtCore.QRect(80, 20, 71, 41))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(18)
+        self.label.setFont(font)
+        self.label.setObjectName("label")
+        self.addBackgroundImageBtn = QtWidgets.QPushButton(self.MainButtons)
+        self.addBackgroundImageBtn.setGeometry(QtCore.QRect(170, 20, 41, 41))
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        self.addBackgroundImageBtn.setFont(font)
+        self.addBackgroundImageBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.addBackgroundImageBtn.setText("")
+        self.addBackgroundImageBtn.setIcon(icon1)
+        self.addBackgroundImageBtn.setIconSize(QtCore.QSize(17, 16))
+        self.addBackgroundImageBtn.setObjectName("addBackgroundImageBtn")
+        self.label_2 = QtWidgets.QLabel(self.MainButtons)
+        self.label_2.setGeometry(QtCore.QRect(220, 20, 211, 41))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(18)
+        self.label_2.setFont(font)
+        self.label_2.setObjectName("label_2")
+        self.label_5 = QtWidgets.QLabel(self.MainButtons)
+        self.label_5.setGeometry(QtCore.QRect(60, 90, 71, 41))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(18)
+        self.label_5.setFont(font)
+        self.label_5.setText("")
+        self.label_5.setObjectName("label_5")
+        self.VerseRepeatBtn = QtWidgets.QPushButton(self.MainButtons)
+        self.VerseRepeatBtn.setGeometry(QtCore.QRect(10, 90, 131, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(15)
+        self.VerseRepeatBtn.setFont(font)
+        self.VerseRepeatBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.VerseRepeatBtn.setStyleSheet("#VerseRepeatBtn{\n"
+"    border: none;\n"
+"    color: white;\n"
+"    background-color: #2C2C2C;\n"
+"    border-radius: 20px;\n"
+"    padding: 10px;\n"
+"}\n"
+"\n"
+"#VerseRepeatBtn:hover {\n"
+"    border: 2px solid #c68463;\n"
+"    color: white;\n"
+"    background-color: #c68463; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"\n"
+"#VerseRepeatBtn:pressed {\n"
+"    border: 2px solid #824d32;\n"
+"    color: white;\n"
+"    background-color: #824d32; \n"
+"    border-radius: 20px;\n"
+"}")
+        self.VerseRepeatBtn.setObjectName("VerseRepeatBtn")
+        self.HymnRepeatBtn = QtWidgets.QPushButton(self.MainButtons)
+        self.HymnRepeatBtn.setGeometry(QtCore.QRect(155, 90, 131, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(15)
+        self.HymnRepeatBtn.setFont(font)
+        self.HymnRepeatBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.HymnRepeatBtn.setStyleSheet("#HymnRepeatBtn{\n"
+"    border: none;\n"
+"    color: white;\n"
+"    background-color: #2C2C2C;\n"
+"    border-radius: 20px;\n"
+"    padding: 10px;\n"
+"}\n"
+"\n"
+"#HymnRepeatBtn:hover {\n"
+"    border: 2px solid #c68463;\n"
+"    color: white;\n"
+"    background-color: #c68463; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"\n"
+"#HymnRepeatBtn:pressed {\n"
+"    border: 2px solid #824d32;\n"
+"    color: white;\n"
+"    background-color: #824d32; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"")
+        self.HymnRepeatBtn.setObjectName("HymnRepeatBtn")
+        self.LBCF = QtWidgets.QPushButton(self.MainButtons)
+        self.LBCF.setGeometry(QtCore.QRect(300, 90, 131, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(15)
+        self.LBCF.setFont(font)
+        self.LBCF.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.LBCF.setStyleSheet("#LBCF{\n"
+"    border: none;\n"
+"    color: white;\n"
+"    background-color: #2C2C2C;\n"
+"    border-radius: 20px;\n"
+"    padding: 10px;\n"
+"}\n"
+"\n"
+"#LBCF:hover {\n"
+"    border: 2px solid #c68463;\n"
+"    color: white;\n"
+"    background-color: #c68463; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"\n"
+"#LBCF:pressed {\n"
+"    border: 2px solid #824d32;\n"
+"    color: white;\n"
+"    background-color: #824d32; \n"
+"    border-radius: 20px;\n"
+"}")
+        self.LBCF.setObjectName("LBCF")
+        self.EditorFrame = QtWidgets.QFrame(self.centralwidget)
+        self.EditorFrame.setGeometry(QtCore.QRect(570, 30, 601, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.EditorFrame.setFont(font)
+        self.EditorFrame.setStyleSheet("#EditorFrame{\n"
+"    Background-color: #EFEFEF;\n"
+"}\n"
+"\n"
+"QPushButton{\n"
+"    Background-color: #EFEFEF;\n"
+"    border: 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QPushButton:hover{\n"
+"    Background-color: #FFFFFF;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: #BFBFBF;\n"
+"}\n"
+"")
+        self.EditorFrame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.EditorFrame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.EditorFrame.setObjectName("EditorFrame")
+        self.fontComboBox = QtWidgets.QFontComboBox(self.EditorFrame)
+        self.fontComboBox.setGeometry(QtCore.QRect(10, 10, 261, 31))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt,sans-serif")
+        font.setPointSize(10)
+        self.fontComboBox.setFont(font)
+        self.fontComboBox.setStyleSheet("QComboBox#fontComboBox {\n"
+"    font-family: \'Inter 18pt\', sans-serif;\n"
+"    font-size: 10pt; /* Change font size to points */\n"
+"    color: black;\n"
+"    background-color: white;\n"
+"    border: 1px solid #ccc;\n"
+"    padding: 5px;\n"
+"    border-radius: 8px;\n"
+"}\n"
+"\n"
+"QComboBox#fontComboBox::drop-down {\n"
+"    background-color: transparent; /* Change drop-down background */\n"
+"    width: 30px; /* Adjust drop-down width */\n"
+"}\n"
+"\n"
+"QComboBox#fontComboBox::drop-down:hover {\n"
+"   background-color: #EFEFEF;\n"
+"    border-radius: 8px;\n"
+"}\n"
+"\n"
+"QComboBox#fontComboBox::drop-down:pressed {\n"
+"   background-color: #BFBFBF;\n"
+"\n"
+"}\n"
+"\n"
+"QComboBox#fontComboBox::down-arrow {\n"
+"    image: url(C:/Users/markt/Scripture-Slides/Scripture-Slides/assets/arrowDown.png); /* Path to your custom arrow image */\n"
+"    width: 18px; /* Adjust width if needed */\n"
+"    height: 18px; /* Adjust height if needed */\n"
+"}\n"
+"\n"
+"QComboBox#fontComboBox QAbstractItemView {\n"
+"    font-family: \'Inter 18pt\', sans-serif;\n"
+"    font-size: 10pt; /* Set point size for list items */\n"
+"    color: black;\n"
+"    background-color: white;\n"
+"    border: none;\n"
+"}\n"
+"")
+        self.fontComboBox.setObjectName("fontComboBox")
+        self.IncreaseFontSize = QtWidgets.QPushButton(self.EditorFrame)
+        self.IncreaseFontSize.setGeometry(QtCore.QRect(340, 10, 31, 31))
+        self.IncreaseFontSize.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.IncreaseFontSize.setStyleSheet("#IncreaseFontSize{\n"
+"    Border: 0px\n"
+"}\n"
+"")
+        self.IncreaseFontSize.setText("")
+        self.IncreaseFontSize.setIcon(icon1)
+        self.IncreaseFontSize.setIconSize(QtCore.QSize(15, 15))
+        self.IncreaseFontSize.setObjectName("IncreaseFontSize")
+        self.DecreaseFontSize = QtWidgets.QPushButton(self.EditorFrame)
+        self.DecreaseFontSize.setGeometry(QtCore.QRect(280, 10, 31, 31))
+        self.DecreaseFontSize.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.DecreaseFontSize.setStyleSheet("#DecreaseFontSize{\n"
+"    Border: 0px;\n"
+"}\n"
+"")
+        self.DecreaseFontSize.setText("")
+        icon2 = QtGui.QIcon()
+        icon2.addPixmap(QtGui.QPixmap("assets:minus.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.DecreaseFontSize.setIcon(icon2)
+        self.DecreaseFontSize.setIconSize(QtCore.QSize(15, 15))
+        self.DecreaseFontSize.setObjectName("DecreaseFontSize")
+        self.BoldBtn = QtWidgets.QPushButton(self.EditorFrame)
+        self.BoldBtn.setGeometry(QtCore.QRect(408, 10, 31, 31))
+        self.BoldBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.BoldBtn.setStyleSheet("#BoldBtn{\n"
+"    Border: 0px;\n"
+"}\n"
+"")
+        self.BoldBtn.setText("")
+        icon3 = QtGui.QIcon()
+        icon3.addPixmap(QtGui.QPixmap("assets:b.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.BoldBtn.setIcon(icon3)
+        self.BoldBtn.setIconSize(QtCore.QSize(15, 15))
+        self.BoldBtn.setObjectName("BoldBtn")
+        self.AlignLeft = QtWidgets.QPushButton(self.EditorFrame)
+        self.AlignLeft.setGeometry(QtCore.QRect(442, 10, 31, 31))
+        self.AlignLeft.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.AlignLeft.setStyleSheet("#IncreaseFontSize{\n"
+"    Border: 0px\n"
+"}\n"
+"\n"
+"#IncreaseFontSize:hover{\n"
+"    background-color: #FFFFFF;\n"
+"}")
+        self.AlignLeft.setText("")
+        icon4 = QtGui.QIcon()
+        icon4.addPixmap(QtGui.QPixmap("assets:left-align.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.AlignLeft.setIcon(icon4)
+        self.AlignLeft.setIconSize(QtCore.QSize(15, 15))
+        self.AlignLeft.setObjectName("AlignLeft")
+        self.AlignCenter = QtWidgets.QPushButton(self.EditorFrame)
+        self.AlignCenter.setGeometry(QtCore.QRect(481, 10, 31, 31))
+        self.AlignCenter.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.AlignCenter.setStyleSheet("#IncreaseFontSize{\n"
+"    Border: 0px\n"
+"}\n"
+"\n"
+"#IncreaseFontSize:hover{\n"
+"    background-color: #FFFFFF;\n"
+"}")
+        self.AlignCenter.setText("")
+        icon5 = QtGui.QIcon()
+        icon5.addPixmap(QtGui.QPixmap("assets:center-align.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.AlignCenter.setIcon(icon5)
+        self.AlignCenter.setIconSize(QtCore.QSize(15, 15))
+        self.AlignCenter.setObjectName("AlignCenter")
+        self.AlignRight = QtWidgets.QPushButton(self.EditorFrame)
+        self.AlignRight.setGeometry(QtCore.QRect(521, 10, 31, 31))
+        self.AlignRight.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.AlignRight.setStyleSheet("#IncreaseFontSize{\n"
+"    Border: 0px\n"
+"}\n"
+"\n"
+"#IncreaseFontSize:hover{\n"
+"    background-color: #FFFFFF;\n"
+"}")
+        self.AlignRight.setText("")
+        icon6 = QtGui.QIcon()
+        icon6.addPixmap(QtGui.QPixmap("assets:right-align.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.AlignRight.setIcon(icon6)
+        self.AlignRight.setIconSize(QtCore.QSize(15, 15))
+        self.AlignRight.setObjectName("AlignRight")
+        self.AlignJustify = QtWidgets.QPushButton(self.EditorFrame)
+        self.AlignJustify.setGeometry(QtCore.QRect(560, 10, 31, 31))
+        self.AlignJustify.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.AlignJustify.setStyleSheet("#IncreaseFontSize{\n"
+"    Border: 0px\n"
+"}\n"
+"\n"
+"#IncreaseFontSize:hover{\n"
+"    background-color: #FFFFFF;\n"
+"}")
+        self.AlignJustify.setText("")
+        icon7 = QtGui.QIcon()
+        icon7.addPixmap(QtGui.QPixmap("assets:justify.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.AlignJustify.setIcon(icon7)
+        self.AlignJustify.setIconSize(QtCore.QSize(15, 15))
+        self.AlignJustify.setObjectName("AlignJustify")
+        self.colorWheel = QtWidgets.QPushButton(self.EditorFrame)
+        self.colorWheel.setGeometry(QtCore.QRect(376, 10, 31, 31))
+        self.colorWheel.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.colorWheel.setStyleSheet("#BoldBtn{\n"
+"    Border: 0px;\n"
+"    background-color: transparent;\n"
+"}\n"
+"\n"
+"#BoldBtn:hover{\n"
+"    background-color: #FFFFFF;\n"
+"}")
+        self.colorWheel.setText("")
+        icon8 = QtGui.QIcon()
+        icon8.addPixmap(QtGui.QPixmap("assets:color-wheel.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.colorWheel.setIcon(icon8)
+        self.colorWheel.setIconSize(QtCore.QSize(25, 25))
+        self.colorWheel.setObjectName("colorWheel")
+        self.fontBox = QtWidgets.QLineEdit(self.EditorFrame)
+        self.fontBox.setGeometry(QtCore.QRect(310, 9, 31, 31))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(12)
+        self.fontBox.setFont(font)
+        self.fontBox.setLayoutDirection(QtCore.Qt.LeftToRight)
+        self.fontBox.setStyleSheet("#fontBox{\n"
+"    background-color: transparent;\n"
+"    color: black;\n"
+"    border: 0px;\n"
+"}")
+        self.fontBox.setAlignment(QtCore.Qt.AlignCenter)
+        self.fontBox.setObjectName("fontBox")
+        self.label_3 = QtWidgets.QLabel(self.centralwidget)
+        self.label_3.setGeometry(QtCore.QRect(640, 490, 61, 41))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(18)
+        self.label_3.setFont(font)
+        self.label_3.setStyleSheet("")
+        self.label_3.setObjectName("label_3")
+        self.addTextBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.addTextBtn.setGeometry(QtCore.QRect(580, 490, 41, 41))
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        self.addTextBtn.setFont(font)
+        self.addTextBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.addTextBtn.setText("")
+        self.addTextBtn.setIcon(icon1)
+        self.addTextBtn.setObjectName("addTextBtn")
+        self.BackgroundFrame = QtWidgets.QFrame(self.centralwidget)
+        self.BackgroundFrame.setGeometry(QtCore.QRect(570, 90, 601, 381))
+        self.BackgroundFrame.setStyleSheet("#BackgroundFrame{\n"
+"Background-color: #D9D9D9;\n"
+"border-radius: 10px;\n"
+"}")
+        self.BackgroundFrame.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.BackgroundFrame.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.BackgroundFrame.setObjectName("BackgroundFrame")
+        self.graphicsView = QtWidgets.QGraphicsView(self.BackgroundFrame)
+        self.graphicsView.setGeometry(QtCore.QRect(10, 10, 581, 361))
+        self.graphicsView.setObjectName("graphicsView")
+        self.createPresentationBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.createPresentationBtn.setGeometry(QtCore.QRect(950, 590, 211, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(15)
+        self.createPresentationBtn.setFont(font)
+        self.createPresentationBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.createPresentationBtn.setStyleSheet("#createPresentationBtn{\n"
+"    border: none;\n"
+"    color: white;\n"
+"    background-color: #2C2C2C;\n"
+"    border-radius: 20px;\n"
+"    padding: 10px;\n"
+"}\n"
+"\n"
+"#createPresentationBtn:hover {\n"
+"    border: 2px solid #c68463;\n"
+"    color: white;\n"
+"    background-color: #c68463; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"\n"
+"#createPresentationBtn:pressed {\n"
+"    border: 2px solid #824d32;\n"
+"    color: white;\n"
+"    background-color: #824d32; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"")
+        self.createPresentationBtn.setObjectName("createPresentationBtn")
+        self.BackgroundFrame_2 = QtWidgets.QFrame(self.centralwidget)
+        self.BackgroundFrame_2.setGeometry(QtCore.QRect(80, 20, 371, 451))
+        self.BackgroundFrame_2.setStyleSheet("#BackgroundFrame_2{\n"
+"Background-color: #D9D9D9;\n"
+"border-radius: 10px;\n"
+"}")
+        self.BackgroundFrame_2.setFrameShape(QtWidgets.QFrame.StyledPanel)
+        self.BackgroundFrame_2.setFrameShadow(QtWidgets.QFrame.Raised)
+        self.BackgroundFrame_2.setObjectName("BackgroundFrame_2")
+        self.slideListWidget = QtWidgets.QListView(self.BackgroundFrame_2)
+        self.slideListWidget.setGeometry(QtCore.QRect(10, 10, 351, 431))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(20)
+        self.slideListWidget.setFont(font)
+        self.slideListWidget.setStyleSheet("#slideListWidget{\n"
+"    border-radius: 0px;\n"
+"}")
+        self.slideListWidget.setIconSize(QtCore.QSize(160, 90))
+        self.slideListWidget.setUniformItemSizes(True)
+        self.slideListWidget.setObjectName("slideListWidget")
+        self.addVerseBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.addVerseBtn.setGeometry(QtCore.QRect(710, 490, 41, 41))
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        self.addVerseBtn.setFont(font)
+        self.addVerseBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.addVerseBtn.setText("")
+        self.addVerseBtn.setIcon(icon1)
+        self.addVerseBtn.setObjectName("addVerseBtn")
+        self.label_4 = QtWidgets.QLabel(self.centralwidget)
+        self.label_4.setGeometry(QtCore.QRect(770, 490, 71, 41))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(18)
+        self.label_4.setFont(font)
+        self.label_4.setStyleSheet("")
+        self.label_4.setObjectName("label_4")
+        self.label_6 = QtWidgets.QLabel(self.centralwidget)
+        self.label_6.setGeometry(QtCore.QRect(910, 490, 81, 41))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(18)
+        self.label_6.setFont(font)
+        self.label_6.setStyleSheet("")
+        self.label_6.setObjectName("label_6")
+        self.addVerseBtn_2 = QtWidgets.QPushButton(self.centralwidget)
+        self.addVerseBtn_2.setGeometry(QtCore.QRect(850, 490, 41, 41))
+        font = QtGui.QFont()
+        font.setPointSize(15)
+        self.addVerseBtn_2.setFont(font)
+        self.addVerseBtn_2.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.addVerseBtn_2.setText("")
+        self.addVerseBtn_2.setIcon(icon1)
+        self.addVerseBtn_2.setObjectName("addVerseBtn_2")
+        self.AutoBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.AutoBtn.setGeometry(QtCore.QRect(750, 590, 131, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(15)
+        self.AutoBtn.setFont(font)
+        self.AutoBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.AutoBtn.setStyleSheet("#LBCF{\n"
+"    border: none;\n"
+"    color: white;\n"
+"    background-color: #2C2C2C;\n"
+"    border-radius: 20px;\n"
+"    padding: 10px;\n"
+"}\n"
+"\n"
+"#LBCF:hover {\n"
+"    border: 2px solid #3498db;\n"
+"    color: white;\n"
+"    background-color: #3498db; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"")
+        self.AutoBtn.setObjectName("AutoBtn")
+        self.SlideShowBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.SlideShowBtn.setGeometry(QtCore.QRect(890, 590, 51, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(15)
+        self.SlideShowBtn.setFont(font)
+        self.SlideShowBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.SlideShowBtn.setStyleSheet("#LBCF{\n"
+"    border: none;\n"
+"    color: white;\n"
+"    background-color: #2C2C2C;\n"
+"    border-radius: 20px;\n"
+"    padding: 10px;\n"
+"}\n"
+"\n"
+"#LBCF:hover {\n"
+"    border: 2px solid #3498db;\n"
+"    color: white;\n"
+"    background-color: #3498db; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"")
+        self.SlideShowBtn.setText("")
+        icon9 = QtGui.QIcon()
+        icon9.addPixmap(QtGui.QPixmap("assets:SlideShow.png"), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        self.SlideShowBtn.setIcon(icon9)
+        self.SlideShowBtn.setIconSize(QtCore.QSize(35, 35))
+        self.SlideShowBtn.setObjectName("SlideShowBtn")
+        self.BackgroundFrame_2.raise_()
+        self.BackgroundFrame.raise_()
+        self.MainButtons.raise_()
+        self.EditorFrame.raise_()
+        self.label_3.raise_()
+        self.addTextBtn.raise_()
+        self.createPresentationBtn.raise_()
+        self.addVerseBtn.raise_()
+        self.label_4.raise_()
+        self.label_6.raise_()
+        self.addVerseBtn_2.raise_()
+        self.AutoBtn.raise_()
+        self.SlideShowBtn.raise_()
+        MainWindow.setCentralWidget(self.centralwidget)
+        self.menubar = QtWidgets.QMenuBar(MainWindow)
+        self.menubar.setGeometry(QtCore.QRect(0, 0, 1200, 21))
+        self.menubar.setObjectName("menubar")
+        self.menuFile = QtWidgets.QMenu(self.menubar)
+        self.menuFile.setObjectName("menuFile")
+        self.menuPresets = QtWidgets.QMenu(self.menuFile)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(12)
+        self.menuPresets.setFont(font)
+        self.menuPresets.setObjectName("menuPresets")
+        self.menuHelp = QtWidgets.QMenu(self.menubar)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.menuHelp.setFont(font)
+        self.menuHelp.setObjectName("menuHelp")
+        self.menuEdit = QtWidgets.QMenu(self.menubar)
+        self.menuEdit.setObjectName("menuEdit")
+        MainWindow.setMenuBar(self.menubar)
+        self.actionPresets = QtWidgets.QAction(MainWindow)
+        self.actionPresets.setObjectName("actionPresets")
+        self.actionImport_Preset = QtWidgets.QAction(MainWindow)
+        self.actionImport_Preset.setObjectName("actionImport_Preset")
+        self.actionExport_Preset = QtWidgets.QAction(MainWindow)
+        self.actionExport_Preset.setObjectName("actionExport_Preset")
+        self.actionImport_Preset_2 = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.actionImport_Preset_2.setFont(font)
+        self.actionImport_Preset_2.setObjectName("actionImport_Preset_2")
+        self.actionExport_Preset_2 = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.actionExport_Preset_2.setFont(font)
+        self.actionExport_Preset_2.setObjectName("actionExport_Preset_2")
+        self.actionOpen = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.actionOpen.setFont(font)
+        self.actionOpen.setObjectName("actionOpen")
+        self.actionSave = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.actionSave.setFont(font)
+        self.actionSave.setObjectName("actionSave")
+        self.actionInformation = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.actionInformation.setFont(font)
+        self.actionInformation.setObjectName("actionInformation")
+        self.actionVersion = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.actionVersion.setFont(font)
+        self.actionVersion.setObjectName("actionVersion")
+        self.actionDiagnostics = QtWidgets.QAction(MainWindow)
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        self.actionDiagnostics.setFont(font)
+        self.actionDiagnostics.setObjectName("actionDiagnostics")
+        self.actionUndo = QtWidgets.QAction(MainWindow)
+        self.actionUndo.setObjectName("actionUndo")
+        self.actionRedo = QtWidgets.QAction(MainWindow)
+        self.actionRedo.setObjectName("actionRedo")
+        self.menuPresets.addAction(self.actionImport_Preset_2)
+        self.menuPresets.addAction(self.actionExport_Preset_2)
+        self.menuFile.addAction(self.actionOpen)
+        self.menuFile.addAction(self.menuPresets.menuAction())
+        self.menuFile.addAction(self.actionSave)
+        self.menuHelp.addAction(self.actionInformation)
+        self.menuHelp.addAction(self.actionVersion)
+        self.menuHelp.addAction(self.actionDiagnostics)
+        self.menuEdit.addAction(self.actionUndo)
+        self.menuEdit.addAction(self.actionRedo)
+        self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuEdit.menuAction())
+        self.menubar.addAction(self.menuHelp.menuAction())
+
+        self.retranslateUi(MainWindow)
+        QtCore.QMetaObject.connectSlotsByName(MainWindow)
+
+    def retranslateUi(self, MainWindow):
+        _translate = QtCore.QCoreApplication.translate
+        MainWindow.setWindowTitle(_translate("MainWindow", "Scripture Slides"))
+        self.label.setText(_translate("MainWindow", "Slides"))
+        self.label_2.setText(_translate("MainWindow", "Background Image"))
+        self.VerseRepeatBtn.setText(_translate("MainWindow", "Verse"))
+        self.HymnRepeatBtn.setText(_translate("MainWindow", "Hymn"))
+        self.LBCF.setText(_translate("MainWindow", "1689"))
+        self.fontComboBox.setCurrentText(_translate("MainWindow", "ITC Avant Garde Gothic Pro Book"))
+        self.fontBox.setText(_translate("MainWindow", "50"))
+        self.label_3.setText(_translate("MainWindow", "Text"))
+        self.createPresentationBtn.setText(_translate("MainWindow", "Create Presentation"))
+        self.label_4.setText(_translate("MainWindow", "Verse"))
+        self.label_6.setText(_translate("MainWindow", "Hymn"))
+        self.AutoBtn.setText(_translate("MainWindow", "Auto"))
+        self.menuFile.setTitle(_translate("MainWindow", "File"))
+        self.menuPresets.setTitle(_translate("MainWindow", "Presets"))
+        self.menuHelp.setTitle(_translate("MainWindow", "Help"))
+        self.menuEdit.setTitle(_translate("MainWindow", "Edit"))
+        self.actionPresets.setText(_translate("MainWindow", "Presets"))
+        self.actionImport_Preset.setText(_translate("MainWindow", "Import Preset"))
+        self.actionExport_Preset.setText(_translate("MainWindow", "Export Preset"))
+        self.actionImport_Preset_2.setText(_translate("MainWindow", "Import Preset"))
+        self.actionExport_Preset_2.setText(_translate("MainWindow", "Export Preset"))
+        self.actionOpen.setText(_translate("MainWindow", "Open..."))
+        self.actionSave.setText(_translate("MainWindow", "Save as..."))
+        self.actionInformation.setText(_translate("MainWindow", "Information"))
+        self.actionVersion.setText(_translate("MainWindow", "Version"))
+        self.actionDiagnostics.setText(_translate("MainWindow", "Diagnostics..."))
+        self.actionUndo.setText(_translate("MainWindow", "Undo"))
+        self.actionRedo.setText(_translate("MainWindow", "Redo"))
+
+
+UI_SHA1 = "0a2925d1312c6ffba4065262789903603406cfc3"
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'SlideShowWindow.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.11
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt5 import QtCore, QtGui, QtWidgets
+
+
+class Ui_SlideShowWindow(object):
+    def setupUi(self, SlideShowWindow):
+        SlideShowWindow.setObjectName("SlideShowWindow")
+        SlideShowWindow.resize(800, 600)
+        SlideShowWindow.setMinimumSize(QtCore.QSize(800, 600))
+        SlideShowWindow.setMaximumSize(QtCore.QSize(800, 600))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        SlideShowWindow.setFont(font)
+        self.centralwidget = QtWidgets.QWidget(SlideShowWindow)
+        self.centralwidget.setStyleSheet("#centralwidget{\n"
+"    border: 0px;\n"
+"}\n"
+"\n"
+"\n"
+"QWidget {\n"
+"    background-color: white;\n"
+"    border: 1px solid #dcdcdc;\n"
+"    border-radius: 10px;\n"
+"}\n"
+"\n"
+"QLabel{\n"
+"    border: 0px;\n"
+"}\n"
+"\n"
+"QPushButton:hover{\n"
+"    background-color: #EFEFEF;\n"
+"}\n"
+"\n"
+"QPushButton:pressed {\n"
+"    background-color: #BFBFBF;\n"
+"}\n"
+"")
+        self.centralwidget.setObjectName("centralwidget")
+        self.backButton = QtWidgets.QPushButton(self.centralwidget)
+        self.backButton.setGeometry(QtCore.QRect(20, 20, 81, 31))
+        self.backButton.setObjectName("backButton")
+        self.graphicsView = QtWidgets.QGraphicsView(self.centralwidget)
+        self.graphicsView.setGeometry(QtCore.QRect(360, 120, 401, 291))
+        self.graphicsView.setObjectName("graphicsView")
+        self.LiveEditBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.LiveEditBtn.setGeometry(QtCore.QRect(60, 490, 131, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(15)
+        self.LiveEditBtn.setFont(font)
+        self.LiveEditBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.LiveEditBtn.setStyleSheet("#LBCF{\n"
+"    border: none;\n"
+"    color: white;\n"
+"    background-color: #2C2C2C;\n"
+"    border-radius: 20px;\n"
+"    padding: 10px;\n"
+"}\n"
+"\n"
+"#LBCF:hover {\n"
+"    border: 2px solid #c68463;\n"
+"    color: white;\n"
+"    background-color: #c68463; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"\n"
+"#LBCF:pressed {\n"
+"    border: 2px solid #824d32;\n"
+"    color: white;\n"
+"    background-color: #824d32; \n"
+"    border-radius: 20px;\n"
+"}")
+        self.LiveEditBtn.setObjectName("LiveEditBtn")
+        self.LiveBtn = QtWidgets.QPushButton(self.centralwidget)
+        self.LiveBtn.setGeometry(QtCore.QRect(620, 500, 131, 51))
+        font = QtGui.QFont()
+        font.setFamily("Inter 18pt")
+        font.setPointSize(15)
+        self.LiveBtn.setFont(font)
+        self.LiveBtn.setCursor(QtGui.QCursor(QtCore.Qt.PointingHandCursor))
+        self.LiveBtn.setStyleSheet("#LBCF{\n"
+"    border: none;\n"
+"    color: white;\n"
+"    background-color: #2C2C2C;\n"
+"    border-radius: 20px;\n"
+"    padding: 10px;\n"
+"}\n"
+"\n"
+"#LBCF:hover {\n"
+"    border: 2px solid #c68463;\n"
+"    color: white;\n"
+"    background-color: #c68463; \n"
+"    border-radius: 20px;\n"
+"}\n"
+"\n"
+"#LBCF:pressed {\n"
+"    border: 2px solid #824d32;\n"
+"    color: white;\n"
+"    background-color: #824d32; \n"
+"    border-radius: 20px;\n"
+"}")
+        self.LiveBtn.setObjectName("LiveBtn")
+        self.slideListWidget = QtWidgets.QListView(self.centralwidget)
+        self.slideListWidget.setGeometry(QtCore.QRect(50, 80, 256, 371))
+        self.slideListWidget.setIconSize(QtCore.QSize(160, 90))
+        self.slideListWidget.setUniformItemSizes(True)
+        self.slideListWidget.setObjectName("slideListWidget")
+        self.screenComboBox = QtWidgets.QComboBox(self.centralwidget)
+        self.screenComboBox.setGeometry(QtCore.QRect(620, 450, 131, 31))
+        self.screenComboBox.setObjectName("screenComboBox")
+        self.latencyLabel = QtWidgets.QLabel(self.centralwidget)
+        self.latencyLabel.setGeometry(QtCore.QRect(360, 420, 401, 21))
+        self.latencyLabel.setText("")
+        self.latencyLabel.setObjectName("latencyLabel")
+        SlideShowWindow.setCentralWidget(self.centralwidget)
+
+        self.retranslateUi(SlideShowWindow)
+        QtCore.QMetaObject.connectSlotsByName(SlideShowWindow)
+
+    def retranslateUi(self, SlideShowWindow):
+        _translate = QtCore.QCoreApplication.translate
+        SlideShowWindow.setWindowTitle(_translate("SlideShowWindow", "Scripture Slides"))
+        self.backButton.setText(_translate("SlideShowWindow", "Back"))
+        self.LiveEditBtn.setText(_translate("SlideShowWindow", "Live Edit"))
+        self.LiveBtn.setText(_translate("SlideShowWindow", "Go Live"))
+        self.screenComboBox.setToolTip(_translate("SlideShowWindow", "Screen to show the live output on"))
+
+
+UI_SHA1 = "7df8b4cb8c31148403144a10439800dddd7ec518"
@@ -0,0 +1,196 @@
+import argparse
+import csv
+import json
+import os
+import sqlite3
+import time
+
+from instrumentation import span
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "verses.db")
+
+# Canonical Protestant book order; a book is stored as its 1-based position
+BOOKS = (
+    "Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy", "Joshua", "Judges",
+    "Ruth", "1 Samuel", "2 Samuel", "1 Kings", "2 Kings", "1 Chronicles",
+    "2 Chronicles", "Ezra", "Nehemiah", "Esther", "Job", "Psalms", "Proverbs",
+    "Ecclesiastes", "Song of Solomon", "Isaiah", "Jeremiah", "Lamentations",
+    "Ezekiel", "Daniel", "Hosea", "Joel", "Amos", "Obadiah", "Jonah", "Micah",
+    "Nahum", "Habakkuk", "Zephaniah", "Haggai", "Zechariah", "Malachi",
+    "Matthew", "Mark", "Luke", "John", "Acts", "Romans", "1 Corinthians",
+    "2 Corinthians", "Galatians", "Ephesians", "Philippians", "Colossians",
+    "1 Thessalonians", "2 Thessalonians", "1 Timothy", "2 Timothy", "Titus",
+    "Philemon", "Hebrews", "James", "1 Peter", "2 Peter", "1 John", "2 John",
+    "3 John", "Jude", "Revelation",
+)
+_BOOK_NUMBERS = {name.lower(): number for number, name in enumerate(BOOKS, start=1)}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS verses (
+    id INTEGER PRIMARY KEY,
+    translation TEXT NOT NULL,
+    book INTEGER NOT NULL,
+    chapter INTEGER NOT NULL,
+    verse INTEGER NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS verses_reference
+    ON verses (translation, book, chapter, verse);
+CREATE VIRTUAL TABLE IF NOT EXISTS verses_fts USING fts5 (
+    text, content='verses', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+"""
+
+
+def book_number(book):
+    """Return the 1-based canonical number of `book` (a name or a number)."""
+    if isinstance(book, int):
+        return book
+    try:
+        return _BOOK_NUMBERS[" ".join(book.split()).lower()]
+    except KeyError:
+        raise ValueError(f"Unknown book: {book}") from None
+
+
+def book_name(number):
+    """Return the canonical name of book `number`."""
+    return BOOKS[number - 1]
+
+
+class VerseStore:
+    """Local, offline Bible verse store backed by a single SQLite file.
+
+    Verses are looked up through a unique index on
+    (translation, book, chapter, verse) and searched by phrase through an FTS5
+    index kept alongside the table.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def translations(self):
+        """Return the translations present in the store."""
+        rows = self.connection.execute("SELECT DISTINCT translation FROM verses ORDER BY translation")
+        return [row[0] for row in rows]
+
+    def verse(self, translation, book, chapter, verse):
+        """Return the text of one verse, or None if it is not in the store."""
+        with span("verse.lookup"):
+            row = self.connection.execute(
+                "SELECT text FROM verses WHERE translation = ? AND book = ? AND chapter = ? AND verse = ?",
+                (translation, book_number(book), chapter, verse)).fetchone()
+        return row[0] if row else None
+
+    def passage(self, translation, book, chapter, first_verse=1, last_verse=None):
+        """Return `[(verse, text), ...]` for a verse range within one chapter."""
+        last_verse = last_verse if last_verse is not None else 2 ** 31
+        with span("verse.lookup"):
+            rows = self.connection.execute(
+                "SELECT verse, text FROM verses WHERE translation = ? AND book = ? AND chapter = ?"
+                " AND verse BETWEEN ? AND ? ORDER BY verse",
+                (translation, book_number(book), chapter, first_verse, last_verse))
+            return rows.fetchall()
+
+    def passages(self, translation, ranges):
+        """Return the verses of many ranges at once, as one list per range.
+
+        `ranges` holds `(book, start_chapter, start_verse, end_chapter,
+        end_verse)` tuples, where an `end_verse` of None runs to the end of the
+        chapter. All ranges are resolved in a single query; each verse comes
+        back as `(book, chapter, verse, text)`.
+        """
+        results = [[] for _ in ranges]
+        if not ranges:
+            return results
+        selects = []
+        params = []
+        for index, (book, start_chapter, start_verse, end_chapter, end_verse) in enumerate(ranges):
+            selects.append(
+                "SELECT ? AS part, book, chapter, verse, text FROM verses"
+                " WHERE translation = ? AND book = ? AND (chapter, verse) BETWEEN (?, ?) AND (?, ?)")
+            params += [index, translation, book_number(book), start_chapter, start_verse,
+                       end_chapter, end_verse if end_verse is not None else 2 ** 31]
+        query = " UNION ALL ".join(selects) + " ORDER BY part, chapter, verse"
+        with span("verse.lookup", {"ranges": len(ranges)}):
+            for part, book, chapter, verse, text in self.connection.execute(query, params):
+                results[part].append((book, chapter, verse, text))
+        return results
+
+    def search(self, translation, phrase, limit=50):
+        """Return `[(book, chapter, verse, text), ...]` containing `phrase`, best matches first."""
+        words = phrase.replace('"', " ").split()
+        if not words:
+            return []
+        query = '"' + " ".join(words) + '"'
+        with span("verse.search"):
+            rows = self.connection.execute(
+                "SELECT v.book, v.chapter, v.verse, v.text FROM verses_fts"
+                " JOIN verses AS v ON v.id = verses_fts.rowid"
+                " WHERE verses_fts MATCH ? AND v.translation = ?"
+                " ORDER BY verses_fts.rank LIMIT ?",
+                (query, translation, limit))
+            return rows.fetchall()
+
+    def import_verses(self, translation, verses):
+        """Bulk-load `(book, chapter, verse, text)` rows for `translation`.
+
+        Existing verses of the translation are replaced. Everything runs in a
+        single transaction and the FTS index is rebuilt once at the end rather
+        than row by row. Returns the number of verses loaded.
+        """
+        rows = ((translation, book_number(book), int(chapter), int(verse), text.strip())
+                for book, chapter, verse, text in verses)
+        with self.connection:
+            self.connection.execute("DELETE FROM verses WHERE translation = ?", (translation,))
+            cursor = self.connection.executemany(
+                "INSERT INTO verses (translation, book, chapter, verse, text) VALUES (?, ?, ?, ?, ?)",
+                rows)
+            count = cursor.rowcount
+            self.connection.execute("INSERT INTO verses_fts (verses_fts) VALUES ('rebuild')")
+        self.connection.execute("PRAGMA optimize")
+        return count
+
+    def import_file(self, path, translation=None):
+        """Import a translation file and return the number of verses loaded.
+
+        Supported formats are JSON nested as `{book: {chapter: {verse: text}}}`
+        and CSV/TSV files with `book, chapter, verse, text` columns. The
+        translation defaults to the file name without its extension.
+        """
+        translation = translation or os.path.splitext(os.path.basename(path))[0].upper()
+        if path.lower().endswith(".json"):
+            with open(path, encoding="utf-8") as verse_file:
+                return self.import_verses(translation, _iter_json_verses(json.load(verse_file)))
+        delimiter = "\t" if path.lower().endswith(".tsv") else ","
+        with open(path, encoding="utf-8", newline="") as verse_file:
+            rows = csv.reader(verse_file, delimiter=delimiter)
+            # Headers, blank lines and rows short of the four columns are skipped
+            return self.import_verses(translation, (row[:4] for row in rows
+                                                    if len(row) >= 4 and row[1].strip().isdigit()))
+
+
+def _iter_json_verses(books):
+    for book, chapters in books.items():
+        for chapter, verses in chapters.items():
+            for verse, text in verses.items():
+                yield book, chapter, verse, text
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import Bible translations into the local verse store.")
+    parser.add_argument("files", nargs="+", help="translation files (.json, .csv or .tsv)")
+    parser.add_argument("--translation", help="translation code, defaults to the file name")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="verse store path")
+    args = parser.parse_args()
+
+    store = VerseStore(args.db)
+    for path in args.files:
+        start = time.perf_counter()
+        count = store.import_file(path, args.translation)
+        print(f"Imported {count} verses from {path} in {time.perf_counter() - start:.2f}s")
+    store.close()
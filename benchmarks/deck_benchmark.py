@@ -0,0 +1,406 @@
+"""Time the deck-building operations of Scripture Slides as decks grow.
+
+Each case is one operation (`add_slide`, `add_background_image`,
+`save_slide_preview`, `delete_slide` or `create_presentation`) on a deck of a
+given size. It runs in its own process, headless under offscreen Qt: the
+process builds a deck of that size from synthetic pictures and verses,
+drives the main window the way the buttons do, with the file dialogs
+answered, and reports the time per call and its peak memory. Every process
+works in a scratch directory, so the real recovery journal and previews are
+never touched.
+
+Results are appended to a JSON history file, which is not tracked by git.
+The run fails if a case got slower by more than `--max-regression` than
+the last time it was run the same way on the same platform, Python and Qt
+version, or if the
+time of an operation grows nearly as fast as the deck from the smallest to
+the largest size, fitted over every size measured, which is how quadratic
+paths show up: a delete that
+rebuilt the whole list takes ~100x longer on 1000 slides than on 10. Saving
+is expected to take time in proportion to the deck, so its time per slide is
+checked instead.
+
+    python benchmarks/deck_benchmark.py
+    python benchmarks/deck_benchmark.py --sizes 10 100 --ops add_slide delete_slide
+    python benchmarks/deck_benchmark.py --image-sizes 1920x1080 6000x4000 --max-growth 0.1
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_DIR = os.path.join(REPO_DIR, "Scripture-Slides")
+DEFAULT_HISTORY = os.path.join(REPO_DIR, "benchmarks", "deck_history.json")
+OPERATIONS = ("add_slide", "add_background_image", "save_slide_preview", "delete_slide",
+              "create_presentation")
+DEFAULT_SIZES = (10, 100, 1000)
+DEFAULT_IMAGE_SIZES = ("1920x1080", "4000x3000")
+BACKGROUND_EVERY = 4  # every fourth slide of the synthetic deck has a picture
+WHOLE_DECK_OPERATIONS = ("create_presentation",)  # linear in the deck by nature
+NOISE_FLOOR_S = 0.002  # differences below this are timer noise, never regressions
+MIN_SIZE_RANGE = 10  # the largest size must be this many times the smallest to judge growth
+
+_WORDS = ("the", "lord", "said", "unto", "him", "and", "they", "shall", "be", "my", "people",
+          "light", "in", "all", "earth", "which", "was", "given", "for", "you", "grace", "peace")
+
+
+# -- Running one case, in a child process ------------------------------------
+
+def synthetic_verse(index):
+    """A verse-like passage of 20-60 words, different for every index."""
+    count = 20 + (index * 7) % 41
+    words = [_WORDS[(index * 31 + i * 17) % len(_WORDS)] for i in range(count)]
+    return f"{index // 30 + 1}:{index % 30 + 1} " + " ".join(words).capitalize() + "."
+
+
+def synthetic_images(folder, count, size):
+    """Write `count` distinct noisy JPEGs of `size` to `folder` and return their paths.
+
+    Noise keeps the files about as hard to decode as photographs.
+    """
+    from PIL import Image
+
+    width, height = size
+    gradient = Image.linear_gradient("L").resize((width, height))
+    paths = []
+    for index in range(count):
+        noise = Image.effect_noise((width, height), 40 + index % 20)
+        image = Image.merge("RGB", (noise, gradient, noise.transpose(Image.FLIP_LEFT_RIGHT)))
+        path = os.path.join(folder, f"background_{width}x{height}_{index}.jpg")
+        image.save(path, quality=90)
+        paths.append(path)
+    return paths
+
+
+def parse_size(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+
+def peak_memory_mb():
+    """Peak resident memory of this process, or None where it is not available."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def settle(app, window):
+    """Process events until no preview is queued or being rendered."""
+    while True:
+        app.processEvents()
+        if not window.preview_flush_timer.isActive() and window.preview_renderer.pending() == 0:
+            app.processEvents()  # deliver the last results
+            return
+        time.sleep(0.001)
+
+
+def build_deck(window, size, background):
+    """Fill the window's deck with `size` slides of synthetic verses."""
+    journal = window.journal
+    for index in range(size):
+        slide = journal.add_slide()
+        if index % BACKGROUND_EVERY == 0:
+            journal.set_background(slide.slide_id, background)
+        journal.add_text(slide.slide_id, synthetic_verse(index))
+    # Building the deck is not measured; neither is rendering its previews
+    window.preview_flush_timer.stop()
+    window.document.take_dirty()
+
+
+def select_row(window, row):
+    window.slideListWidget.setCurrentIndex(window.slide_model.index(row))
+
+
+def bench_add_slide(app, window, repeat, images):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        window.add_slide()
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+        settle(app, window)
+    return samples
+
+
+def bench_add_background_image(app, window, repeat, images):
+    from PyQt5.QtWidgets import QFileDialog
+
+    samples = []
+    for index in range(repeat):
+        select_row(window, (index * 7) % len(window.document))
+        settle(app, window)
+        # A picture not used before, so it is decoded cold
+        QFileDialog.getOpenFileName = staticmethod(lambda *args, **kwargs: (images[index + 1], ""))
+        start = time.perf_counter()
+        window.add_background_image()
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+        settle(app, window)
+    return samples
+
+
+def bench_save_slide_preview(app, window, repeat, images):
+    """Time from asking for a preview to its arrival on the GUI thread."""
+    samples = []
+    for index in range(repeat):
+        slide_id = window.document.slide_ids()[(index * 5) % len(window.document)]
+        before = window.preview_path(slide_id)
+        start = time.perf_counter()
+        window.save_slide_preview(slide_id)
+        while window.preview_path(slide_id) == before:
+            app.processEvents()
+            time.sleep(0.0005)
+        samples.append(time.perf_counter() - start)
+        settle(app, window)
+    return samples
+
+
+def bench_delete_slide(app, window, repeat, images):
+    samples = []
+    for _ in range(repeat):
+        select_row(window, len(window.document) // 2)
+        settle(app, window)
+        start = time.perf_counter()
+        window.delete_slide()
+        app.processEvents()
+        samples.append(time.perf_counter() - start)
+        settle(app, window)
+    return samples
+
+
+def bench_create_presentation(app, window, repeat, images):
+    """Time whole saves; the first writes every part, later ones follow one edit."""
+    from PyQt5.QtWidgets import QFileDialog
+
+    save_path = os.path.join(os.getcwd(), "benchmark.pptx")
+    QFileDialog.getSaveFileName = staticmethod(lambda *args, **kwargs: (save_path, ""))
+    samples = []
+    for index in range(repeat):
+        if index:
+            window.journal.add_text(window.document.slide_ids()[index], synthetic_verse(index))
+            settle(app, window)
+        start = time.perf_counter()
+        window.create_presentation()
+        window.deck_saver.wait()
+        app.processEvents()  # deliver the finished signal
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+BENCHMARKS = {
+    "add_slide": bench_add_slide,
+    "add_background_image": bench_add_background_image,
+    "save_slide_preview": bench_save_slide_preview,
+    "delete_slide": bench_delete_slide,
+    "create_presentation": bench_create_presentation,
+}
+
+
+def run_case(operation, size, image_size, repeat, workdir):
+    """Run one case in this process, working in `workdir`, and return its result."""
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    os.chdir(workdir)
+    sys.path.insert(0, APP_DIR)
+    from PyQt5.QtWidgets import QApplication
+
+    app = QApplication([sys.argv[0]])
+    import journal
+    import main
+
+    journal.DEFAULT_JOURNAL_PATH = os.path.join(workdir, "recovery.journal")
+
+    images = synthetic_images(os.getcwd(), repeat + 1, parse_size(image_size))
+    window = main.ScriptureSlides()
+    window.show()
+    build_deck(window, size, images[0])
+    select_row(window, 0)
+    settle(app, window)
+    samples = BENCHMARKS[operation](app, window, repeat, images)
+    memory = peak_memory_mb()
+    window.close()  # stop the worker pools as a normal exit would
+    app.processEvents()
+    os.chdir(REPO_DIR)
+    return {
+        "operation": operation,
+        "size": size,
+        "image_size": image_size,
+        "repeat": repeat,
+        "first_s": round(samples[0], 5),
+        "median_s": round(statistics.median(samples), 5),
+        "peak_memory_mb": memory,
+    }
+
+
+# -- Driving the cases and checking the results ------------------------------
+
+def measure_case(operation, size, image_size, repeat, timeout=1800):
+    """Run one case in a fresh process and return its result dict."""
+    command = [sys.executable, os.path.abspath(__file__), "--case", operation, str(size),
+               image_size, "--repeat", str(repeat)]
+    output = subprocess.run(command, cwd=REPO_DIR, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, text=True, timeout=timeout)
+    for line in output.stdout.splitlines():
+        if line.startswith("result "):
+            return json.loads(line[len("result "):])
+    raise RuntimeError(f"{operation} at {size} slides failed:\n{output.stderr}")
+
+
+def case_key(case):
+    return case["operation"], case["size"], case["image_size"]
+
+
+def environment():
+    """What a run's timings depend on besides the code; only equal ones are compared."""
+    from PyQt5.QtCore import PYQT_VERSION_STR, QT_VERSION_STR
+
+    return {"platform": platform.platform(), "python": platform.python_version(),
+            "qt": QT_VERSION_STR, "pyqt": PYQT_VERSION_STR}
+
+
+def baseline_cases(history, env, repeat):
+    """Return the latest earlier result of each case run in `env` with `repeat` calls."""
+    baseline = {}
+    for run in history:
+        if run.get("environment") == env and run.get("repeat") == repeat:
+            baseline.update((case_key(case), case) for case in run["cases"])
+    return list(baseline.values())
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as history_file:
+        return json.load(history_file)
+
+
+def find_regressions(cases, previous, max_regression):
+    """Compare `cases` with their `previous` results; return a message per regression."""
+    baseline = {case_key(case): case for case in previous}
+    failures = []
+    for case in cases:
+        before = baseline.get(case_key(case))
+        if before is None:
+            continue
+        limit = before["median_s"] * (1 + max_regression)
+        if case["median_s"] > limit and case["median_s"] - before["median_s"] > NOISE_FLOOR_S:
+            failures.append(f"{case['operation']} at {case['size']} slides took "
+                            f"{case['median_s'] * 1000:.1f} ms, up from "
+                            f"{before['median_s'] * 1000:.1f} ms")
+    return failures
+
+
+def find_growth(cases, max_growth):
+    """Return a message per operation whose time grows too fast with the deck.
+
+    The median times of all sizes are fitted to a fixed cost plus a cost per
+    slide, and an operation fails if the fitted time grows by more than
+    `max_growth` times the growth of the deck; whole-deck operations are
+    measured per slide. Growth of less than `NOISE_FLOOR_S` in all is noise.
+    """
+    by_operation = {}
+    for case in cases:
+        by_operation.setdefault((case["operation"], case["image_size"]), []).append(case)
+    failures = []
+    for (operation, _), runs in by_operation.items():
+        sizes = [case["size"] for case in runs]
+        if len(set(sizes)) < 2:
+            continue
+        per_slide, fixed = statistics.linear_regression(sizes, [case["median_s"] for case in runs])
+        smallest, largest = min(sizes), max(sizes)
+        at_smallest = max(fixed + per_slide * smallest, NOISE_FLOOR_S)
+        at_largest = fixed + per_slide * largest
+        if at_largest - at_smallest < NOISE_FLOOR_S:
+            continue
+        deck_growth = largest / smallest
+        growth = at_largest / at_smallest
+        if operation in WHOLE_DECK_OPERATIONS:
+            growth /= deck_growth
+        if growth > max_growth * deck_growth:
+            failures.append(f"{operation} grows {growth:.1f}x from {smallest} to "
+                            f"{largest} slides (limit {max_growth * deck_growth:g}x)")
+    return failures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark deck operations at several deck sizes.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES),
+                        help="deck sizes in slides")
+    parser.add_argument("--ops", nargs="+", choices=OPERATIONS, default=list(OPERATIONS),
+                        help="operations to measure")
+    parser.add_argument("--image-sizes", nargs="+", default=list(DEFAULT_IMAGE_SIZES),
+                        help="picture sizes (WxH) for add_background_image; other "
+                             "operations use the first")
+    parser.add_argument("--repeat", type=int, default=5, help="calls timed per case")
+    parser.add_argument("--max-regression", type=float, default=0.5,
+                        help="fail if a case is slower than its last run in the same "
+                             "environment by this fraction (0.5 = 50%%)")
+    parser.add_argument("--max-growth", type=float, default=0.25,
+                        help="fail if an operation's time grows by more than this fraction "
+                             "of the deck's growth from the smallest to the largest size")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--label", default="", help="free-form label stored with the result")
+    parser.add_argument("--case", nargs=3, metavar=("OPERATION", "SIZE", "IMAGE_SIZE"),
+                        help=argparse.SUPPRESS)  # run one case in this process
+    args = parser.parse_args(argv)
+    if len(set(args.sizes)) > 1 and max(args.sizes) < MIN_SIZE_RANGE * min(args.sizes):
+        parser.error(f"--sizes must span at least {MIN_SIZE_RANGE}x to tell how time grows "
+                     f"with the deck, e.g. 10 100")
+
+    if args.case:
+        operation, size, image_size = args.case
+        stdout = sys.stdout
+        sys.stdout = sys.stderr  # keep the app's own messages out of the result
+        with tempfile.TemporaryDirectory(prefix="scripture-slides-benchmark-") as workdir:
+            result = run_case(operation, int(size), image_size, args.repeat, workdir)
+        print("result " + json.dumps(result), file=stdout)
+        return 0
+
+    cases = []
+    for operation in args.ops:
+        image_sizes = args.image_sizes if operation == "add_background_image" else args.image_sizes[:1]
+        for image_size in image_sizes:
+            for size in sorted(args.sizes):
+                case = measure_case(operation, size, image_size, args.repeat)
+                cases.append(case)
+                memory = case["peak_memory_mb"]
+                print(f"{operation:<22} {size:>5} slides {image_size:>10}: "
+                      f"{case['median_s'] * 1000:8.1f} ms median, "
+                      f"{case['first_s'] * 1000:8.1f} ms first, "
+                      f"peak {'-' if memory is None else f'{memory:.0f} MB'}")
+
+    history = load_history(args.history)
+    env = environment()
+    previous = baseline_cases(history, env, args.repeat)
+    result = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "label": args.label,
+        "platform": platform.platform(),
+        "environment": env,
+        "repeat": args.repeat,
+        "max_regression": args.max_regression,
+        "max_growth": args.max_growth,
+        "cases": cases,
+    }
+    history.append(result)
+    with open(args.history, "w", encoding="utf-8") as history_file:
+        json.dump(history, history_file, indent=2)
+
+    failures = find_regressions(cases, previous, args.max_regression)
+    failures += find_growth(cases, args.max_growth)
+    for failure in failures:
+        print(f"FAIL: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
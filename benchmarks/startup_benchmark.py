@@ -0,0 +1,96 @@
+"""Measure Scripture Slides time-to-first-paint and hold it under a budget.
+
+Launches the app repeatedly with SCRIPTURE_SLIDES_STARTUP_PROBE set, which
+makes it print the time of its first paint and quit. Results are appended to
+a JSON history file and the run fails if the median exceeds the budget.
+
+    python benchmarks/startup_benchmark.py --runs 5 --budget 1.5
+    python benchmarks/startup_benchmark.py --command dist/main --budget 2.0
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_COMMAND = [sys.executable, os.path.join("Scripture-Slides", "main.py")]
+DEFAULT_HISTORY = os.path.join(REPO_DIR, "benchmarks", "startup_history.json")
+
+
+def measure_once(command, timeout=60):
+    """Launch the app once and return `(wall_seconds, in_process_seconds)`.
+
+    Wall time runs from process launch to the first-paint line on stdout, so
+    it includes interpreter and import time; in-process time is what the app
+    reports since main.py started executing.
+    """
+    env = dict(os.environ, SCRIPTURE_SLIDES_STARTUP_PROBE="1")
+    start = time.perf_counter()
+    process = subprocess.Popen(command, cwd=REPO_DIR, env=env, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, text=True)
+    try:
+        for line in process.stdout:
+            if line.startswith("first-paint "):
+                wall = time.perf_counter() - start
+                return wall, float(line.split()[1])
+        raise RuntimeError(f"{' '.join(command)} exited without painting")
+    finally:
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as history_file:
+        return json.load(history_file)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark time to first paint.")
+    parser.add_argument("--runs", type=int, default=5, help="number of launches")
+    parser.add_argument("--budget", type=float, help="fail if the median wall time (s) exceeds this")
+    parser.add_argument("--command", nargs="+", help="command to launch, e.g. a PyInstaller build")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="JSON history file")
+    parser.add_argument("--label", default="", help="free-form label stored with the result")
+    args = parser.parse_args(argv)
+
+    command = args.command or DEFAULT_COMMAND
+    walls, in_process = [], []
+    for run in range(args.runs):
+        wall, reported = measure_once(command)
+        walls.append(wall)
+        in_process.append(reported)
+        print(f"run {run + 1}: first paint after {wall:.3f}s ({reported:.3f}s in process)")
+
+    result = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "label": args.label,
+        "command": " ".join(command),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "median_wall_s": round(statistics.median(walls), 4),
+        "min_wall_s": round(min(walls), 4),
+        "median_in_process_s": round(statistics.median(in_process), 4),
+        "budget_s": args.budget,
+    }
+    history = load_history(args.history)
+    history.append(result)
+    with open(args.history, "w", encoding="utf-8") as history_file:
+        json.dump(history, history_file, indent=2)
+
+    print(f"median first paint {result['median_wall_s']:.3f}s over {args.runs} runs")
+    if args.budget is not None and result["median_wall_s"] > args.budget:
+        print(f"FAIL: over the {args.budget:.3f}s budget", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,43 @@
+import os
+import sys
+
+import pytest
+
+# The app's modules import each other as top-level names
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                "Scripture-Slides"))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Run in an empty folder, so files the app writes next to itself land there."""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def picture(workdir):
+    """Return a function writing a small solid PNG and returning its path."""
+    from PIL import Image
+
+    def make(color=(200, 30, 30), name=None):
+        path = workdir / (name or "picture_{:02x}{:02x}{:02x}.png".format(*color))
+        Image.new("RGB", (32, 18), color).save(path)
+        return str(path)
+
+    return make
+
+
+@pytest.fixture
+def verse_store(tmp_path):
+    """A verse store holding John 3:14-18 and Romans 8:28-31 as "TEST"."""
+    from verse_store import VerseStore
+
+    store = VerseStore(str(tmp_path / "verses.db"))
+    store.import_verses("TEST", [
+        ("John", 3, verse, f"John three {verse} " + "word " * 8) for verse in range(14, 19)
+    ] + [
+        ("Romans", 8, verse, f"Romans eight {verse}") for verse in range(28, 32)
+    ])
+    yield store
+    store.close()
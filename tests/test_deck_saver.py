@@ -0,0 +1,75 @@
+import os
+import threading
+
+import pytest
+from pptx import Presentation
+from pptx.opc.package import XmlPart
+
+from deck import Deck
+from deck_saver import PackageSnapshot, SaveCancelled, write_package
+
+
+def _deck(count):
+    deck = Deck()
+    for number in range(count):
+        deck.add_text(deck.add_slide(), f"Slide {number}")
+    deck.dirty_parts.clear()
+    return deck
+
+
+def _texts(path):
+    return [slide.shapes[0].text_frame.text for slide in Presentation(path).slides]
+
+
+def test_snapshot_reuses_unchanged_parts(tmp_path):
+    deck = _deck(5)
+    snapshot = PackageSnapshot()
+    first = dict((name, blob) for name, blob, _ in snapshot.take(deck.prs))
+    assert snapshot.reused == 0
+
+    second = dict((name, blob) for name, blob, _ in snapshot.take(deck.prs))
+    # Only the presentation part, which holds the slide list, is redone
+    assert snapshot.serialized == 1
+    xml_parts = [part for part in deck.prs.part.package.iter_parts() if isinstance(part, XmlPart)]
+    assert snapshot.reused == len(xml_parts) - 1
+    assert second == first
+
+    slide = deck.prs.slides[2]
+    slide.shapes[0].text_frame.text = "Changed"
+    third = snapshot.take(deck.prs, [slide.part])
+    assert snapshot.serialized == 2
+    path = write_package(third, str(tmp_path / "deck.pptx"))
+    assert _texts(path) == ["Slide 0", "Slide 1", "Changed", "Slide 3", "Slide 4"]
+
+
+def test_snapshot_drops_deleted_slides(tmp_path):
+    deck = _deck(3)
+    snapshot = PackageSnapshot()
+    snapshot.take(deck.prs)
+    deck.slides.delete(deck.slides.slide_ids()[0])
+    entries = snapshot.take(deck.prs, deck.dirty_parts)
+    path = write_package(entries, str(tmp_path / "deck.pptx"))
+    assert _texts(path) == ["Slide 1", "Slide 2"]
+    assert len([name for name, _, _ in entries if name.startswith("ppt/slides/slide")]) == 2
+
+
+def test_cancelled_write_leaves_the_old_file(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    _deck(1).save(path)
+    before = open(path, "rb").read()
+    cancel = threading.Event()
+    cancel.set()
+    with pytest.raises(SaveCancelled):
+        write_package(PackageSnapshot().take(_deck(2).prs), path, cancel)
+    assert open(path, "rb").read() == before
+    assert os.listdir(tmp_path) == ["deck.pptx"]
+
+
+def test_saving_an_opened_deck_over_its_file(tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    _deck(3).save(path)
+    deck = Deck.open(path)
+    deck.add_text(deck.add_slide(), "Slide 3")
+    entries = PackageSnapshot().take(deck.prs, deck.dirty_parts)
+    write_package(entries, path, before_replace=deck.source.close)
+    assert _texts(path) == ["Slide 0", "Slide 1", "Slide 2", "Slide 3"]
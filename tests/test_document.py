@@ -0,0 +1,62 @@
+from document import SLIDE_ADDED, SLIDE_CHANGED, SLIDE_REMOVED, Document, TextRun
+
+
+def _recorder(document):
+    events = []
+    document.subscribe(events.append)
+    return events
+
+
+def test_batch_merges_consecutive_additions():
+    document = Document()
+    document.insert_slide(1)
+    events = _recorder(document)
+    with document.batch():
+        for slide_id in (2, 3, 4):
+            document.insert_slide(slide_id)
+            document.add_text(slide_id, TextRun("text"))
+
+    assert [(event.kind, event.index, event.count) for event in events] == [(SLIDE_ADDED, 1, 3)]
+    assert document.slide_ids(events[0].index, events[0].index + events[0].count) == [2, 3, 4]
+    assert document.get(3).text == "text"
+
+
+def test_batch_keeps_other_changes_in_order():
+    document = Document()
+    document.insert_slide(1)
+    events = _recorder(document)
+    with document.batch():
+        document.insert_slide(2)
+        document.add_text(1, TextRun("old slide"))
+        document.insert_slide(3)
+        document.remove_slide(2)
+
+    assert [(event.kind, event.slide_id, event.count) for event in events] == [
+        (SLIDE_ADDED, 2, 1), (SLIDE_CHANGED, 1, 1), (SLIDE_ADDED, 3, 1), (SLIDE_REMOVED, 2, 1)]
+
+
+def test_events_outside_a_batch_are_sent_at_once():
+    document = Document()
+    events = _recorder(document)
+    document.insert_slide(1)
+    document.insert_slide(2)
+    assert [(event.slide_id, event.count) for event in events] == [(1, 1), (2, 1)]
+
+
+def test_positions_follow_inserts_removals_and_moves():
+    document = Document()
+    for slide_id in (1, 2, 3, 4):
+        document.insert_slide(slide_id)
+    document.insert_slide(5, 1)
+    document.remove_slide(3)
+    document.move_slide(4, 0)
+    record = document.remove_slide(2)
+    document.restore_slide(record, 2)
+
+    assert document.slide_ids() == [4, 1, 2, 5]
+    events = _recorder(document)
+    for slide_id in (1, 2, 4, 5):
+        document.add_text(slide_id, TextRun("text"))
+    assert [event.index for event in events] == [1, 2, 0, 3]
+    document.reset([6, 5])
+    assert [document.index_of(slide_id) for slide_id in (5, 6)] == [1, 0]
@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+APP_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "Scripture-Slides")
+
+
+def _run(code, cwd):
+    return subprocess.run([sys.executable, "-c", textwrap.dedent(code)], cwd=cwd,
+                          env={**os.environ, "PYTHONPATH": APP_DIR},
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+
+
+def test_exporting_does_not_load_qt(workdir):
+    """The command-line build exports without the GUI toolkit."""
+    result = _run("""
+        import sys
+
+        from deck import Deck
+        from exporter import export_pages, pages_from, render_page
+
+        assert "PyQt5" not in sys.modules, "importing the exporter loaded Qt"
+        deck = Deck()
+        deck.add_text(deck.add_slide(), "In the beginning")
+        pages = pages_from(deck.document)
+        assert render_page(pages[0], "first.png", pdf=True)[:2] == b"\\xff\\xd8"
+        assert export_pages(pages, "pngs", "deck.pdf", size=(320, 180), workers=1) == 1
+        assert "PyQt5" not in sys.modules, "exporting loaded Qt"
+    """, workdir)
+    assert result.returncode == 0, result.stderr
+    assert sorted(os.listdir(workdir)) == ["deck.pdf", "first.png", "pngs"]
+    assert os.listdir(workdir / "pngs") == ["slide_001.png"]
+    assert (workdir / "deck.pdf").read_bytes().startswith(b"%PDF")
@@ -0,0 +1,145 @@
+import os
+
+from deck import Deck
+from journal import Journal
+
+
+def _texts(deck):
+    return [record.text for record in deck.document]
+
+
+def _replay(journal_path):
+    deck = Deck()
+    Journal.replay(str(journal_path), deck).close()
+    return deck
+
+
+def test_replay_rebuilds_edits(workdir):
+    journal_path = workdir / "recovery.journal"
+    journal = Journal(Deck(), str(journal_path))
+    first = journal.add_slide()
+    journal.add_text(first.slide_id, "In the beginning")
+    second = journal.add_slide()
+    journal.add_text(second.slide_id, "was the Word")
+    journal.move_slide(second.slide_id, 0)
+    journal.duplicate_slide(first.slide_id)
+    journal.undo()
+    journal.close()
+
+    deck = _replay(journal_path)
+    assert _texts(deck) == ["was the Word", "In the beginning"]
+    assert deck.document.slide_ids() == journal.deck.document.slide_ids()
+
+
+def test_replay_drops_a_torn_last_line(workdir):
+    journal_path = workdir / "recovery.journal"
+    journal = Journal(Deck(), str(journal_path))
+    journal.add_slide()
+    journal.close()
+    with open(journal_path, "a", encoding="utf-8") as log_file:
+        log_file.write('{"op": "add_sl')
+
+    assert len(_replay(journal_path).document) == 1
+    assert journal_path.read_text(encoding="utf-8").endswith("\n")
+
+
+def test_open_starts_the_log_over(workdir):
+    saved = Deck()
+    saved.add_slide()
+    saved.save(str(workdir / "a.pptx"))
+    journal_path = workdir / "recovery.journal"
+    journal = Journal(Deck(), str(journal_path))
+    journal.add_slide()
+    journal.add_slide()
+    journal.open_deck(str(workdir / "a.pptx"))
+    journal.close()
+
+    assert journal_path.read_text(encoding="utf-8").count("\n") == 1
+    assert len(_replay(journal_path).document) == 1
+
+
+def test_replay_after_save_matches_the_saved_file(workdir):
+    pptx_path = str(workdir / "a.pptx")
+    saved = Deck()
+    for _ in range(2):
+        saved.add_slide()
+    saved.save(pptx_path)
+
+    journal_path = workdir / "recovery.journal"
+    journal = Journal(Deck(), str(journal_path))
+    journal.open_deck(pptx_path)
+    journal.add_slide()
+    mark = journal.mark()
+    journal.deck.save(pptx_path)
+    journal.checkpoint(pptx_path, mark)
+    journal.close()
+
+    assert len(Deck.open(pptx_path).document) == 3
+    assert len(_replay(journal_path).document) == 3
+
+
+def test_checkpoint_keeps_edits_made_during_the_save(workdir):
+    pptx_path = str(workdir / "a.pptx")
+    journal_path = workdir / "recovery.journal"
+    journal = Journal(Deck(), str(journal_path))
+    journal.add_slide()
+    mark = journal.mark()
+    journal.deck.save(pptx_path)
+    slide = journal.add_slide()  # made while the save ran
+    journal.add_text(slide.slide_id, "Amen")
+    journal.checkpoint(pptx_path, mark)
+    journal.close()
+
+    assert _texts(_replay(journal_path)) == [None, "Amen"]
+
+
+def test_undo_before_the_save_stops_the_log(workdir):
+    pptx_path = str(workdir / "a.pptx")
+    journal_path = workdir / "recovery.journal"
+    journal = Journal(Deck(), str(journal_path))
+    journal.add_slide()
+    journal.add_slide()
+    journal.deck.save(pptx_path)
+    journal.checkpoint(pptx_path)
+
+    assert journal.undo()  # still possible in the app
+    assert journal_path.read_text(encoding="utf-8") == ""
+    journal.add_slide()
+    journal.deck.save(pptx_path)
+    journal.checkpoint(pptx_path)
+    journal.add_slide()
+    journal.close()
+
+    assert len(_replay(journal_path).document) == 3
+
+
+def test_checkpoint_prunes_pictures_the_log_no_longer_needs(workdir, picture):
+    pptx_path = str(workdir / "a.pptx")
+    journal = Journal(Deck(), str(workdir / "recovery.journal"))
+    slide = journal.add_slide()
+    journal.set_background(slide.slide_id, picture((10, 20, 30)))
+    mark = journal.mark()
+    journal.deck.save(pptx_path)
+    journal.set_background(slide.slide_id, picture((40, 50, 60)))  # made while the save ran
+    assert len(os.listdir(journal.blob_dir)) == 2
+
+    journal.checkpoint(pptx_path, mark)
+    (kept,) = os.listdir(journal.blob_dir)
+    assert kept == journal.deck.record(slide.slide_id).background.digest
+    journal.close(remove=True)
+    assert not os.path.exists(journal.blob_dir)
+
+
+def test_checkpoint_keeps_pictures_a_replayed_deck_shows(workdir, picture):
+    journal_path = str(workdir / "recovery.journal")
+    journal = Journal(Deck(), journal_path)
+    slide = journal.add_slide()
+    journal.set_background(slide.slide_id, picture())
+    journal.close()
+
+    replayed = Journal.replay(journal_path, Deck())
+    background = replayed.deck.record(slide.slide_id).background
+    replayed.deck.save(str(workdir / "a.pptx"))
+    replayed.checkpoint(str(workdir / "a.pptx"))
+    assert os.path.exists(background.path)
+    replayed.close()
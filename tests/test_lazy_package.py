@@ -0,0 +1,77 @@
+import zipfile
+
+import pytest
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from deck import Deck
+from deck_saver import PackageSnapshot, write_package
+from lazy_package import is_lazy_blob, open_presentation
+
+
+@pytest.fixture
+def saved_deck(tmp_path, picture):
+    """A saved deck of three slides with text, one picture each and notes."""
+    deck = Deck()
+    for number in range(3):
+        slide = deck.add_slide()
+        deck.set_background(slide, picture((number * 60, 40, 90)))
+        deck.add_text(slide, f"Slide {number}")
+        slide.notes_slide.notes_text_frame.text = f"Notes {number}"
+    path = str(tmp_path / "original.pptx")
+    deck.save(path)
+    return path
+
+
+def _members(path):
+    with zipfile.ZipFile(path) as zip_file:
+        return {name: zip_file.read(name) for name in zip_file.namelist()}
+
+
+def _content(path):
+    """Slide ID, texts, picture bytes and notes of every slide."""
+    return [(slide.slide_id,
+             [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame],
+             [shape.image.blob for shape in slide.shapes
+              if shape.shape_type == MSO_SHAPE_TYPE.PICTURE],
+             slide.notes_slide.notes_text_frame.text)
+            for slide in Presentation(path).slides]
+
+
+def test_open_reads_slides_and_pictures_on_demand(saved_deck):
+    prs, source = open_presentation(saved_deck)
+    slide_parts = [prs.part.related_part(sldId.rId) for sldId in prs.slides._sldIdLst]
+    assert not any(part.is_parsed for part in slide_parts)
+    pictures = [part for part in prs.part.package.iter_parts()
+                if part.content_type.startswith("image/")]
+    assert pictures and all(is_lazy_blob(part) for part in pictures)
+
+    assert prs.slides[1].shapes[1].text_frame.text == "Slide 1"
+    assert slide_parts[1].is_parsed and not slide_parts[0].is_parsed
+    source.close()
+    assert pictures[0].blob == _members(saved_deck)[pictures[0].partname.membername]  # reopened
+
+
+def test_unchanged_round_trip_keeps_every_member(saved_deck, tmp_path):
+    prs, source = open_presentation(saved_deck)
+    copy = str(tmp_path / "copy.pptx")
+    write_package(PackageSnapshot().take(prs), copy)
+    source.close()
+
+    original, copied = _members(saved_deck), _members(copy)
+    assert copied.keys() == original.keys()
+    # Unparsed slides and unread pictures are written back byte for byte
+    for name, data in original.items():
+        if name.startswith(("ppt/slides/slide", "ppt/notesSlides/", "ppt/media/")):
+            assert copied[name] == data, name
+    assert _content(copy) == _content(saved_deck)
+
+
+def test_edited_deck_saved_over_its_own_file(saved_deck):
+    before = _content(saved_deck)
+    deck = Deck.open(saved_deck)
+    deck.add_text(deck.add_slide(), "Added")
+    deck.save(saved_deck)
+    after = _content(saved_deck)
+    assert after[:3] == before
+    assert after[3][1] == ["Added"]
@@ -0,0 +1,84 @@
+import pytest
+
+from deck import Deck
+from references import (ReferenceParseError, VerseRange, format_reference, format_verses,
+                        paginate, parse_references, resolve_book, verse_text)
+
+JOHN, ROMANS, PSALMS, JUDE = 43, 45, 19, 65
+
+
+@pytest.mark.parametrize("name, number", [
+    ("John", JOHN), ("jn", JOHN), ("Rom.", ROMANS), ("Ps", PSALMS), ("psalm", PSALMS),
+    ("1 Cor", 46), ("I Corinthians", 46), ("second kings", 12), ("2Ki", 12),
+])
+def test_resolve_book(name, number):
+    assert resolve_book(name) == number
+
+
+@pytest.mark.parametrize("name", ["", "Hezekiah", "J"])
+def test_resolve_book_rejects(name):
+    with pytest.raises(ReferenceParseError):
+        resolve_book(name)
+
+
+@pytest.mark.parametrize("text, ranges", [
+    ("John 3:16", [(JOHN, 3, 16, 3, 16)]),
+    ("John 3:16-18", [(JOHN, 3, 16, 3, 18)]),
+    ("John 3:16-4:2", [(JOHN, 3, 16, 4, 2)]),
+    ("Ps 23", [(PSALMS, 23, 1, 23, None)]),
+    ("Gen 1-2", [(1, 1, 1, 2, None)]),
+    ("Jude 3", [(JUDE, 1, 3, 1, 3)]),
+    # Later items inherit the book and chapter of the one before them
+    ("Rom 8:28, 31-39", [(ROMANS, 8, 28, 8, 28), (ROMANS, 8, 31, 8, 39)]),
+    ("Ps 23, 24", [(PSALMS, 23, 1, 23, None), (PSALMS, 24, 1, 24, None)]),
+    ("John 3:16; 4:1", [(JOHN, 3, 16, 3, 16), (JOHN, 4, 1, 4, 1)]),
+    ("John 3:16; Rom 8:28", [(JOHN, 3, 16, 3, 16), (ROMANS, 8, 28, 8, 28)]),
+])
+def test_parse_references(text, ranges):
+    assert parse_references(text) == [VerseRange(*values) for values in ranges]
+
+
+@pytest.mark.parametrize("text", ["3:16", "John", "John 3:18-16", "John 3:16 x"])
+def test_parse_references_rejects(text):
+    with pytest.raises(ReferenceParseError):
+        parse_references(text)
+
+
+@pytest.mark.parametrize("text", ["John 3:16", "John 3:16-18", "John 3:16-4:2", "Psalms 23",
+                                  "Genesis 1-2"])
+def test_format_reference_round_trips(text):
+    (verse_range,) = parse_references(text)
+    assert format_reference(verse_range) == text
+
+
+def _verses(count):
+    return [(JOHN, 3, verse, "x" * 10) for verse in range(1, count + 1)]
+
+
+def test_paginate_packs_whole_verses():
+    pages = paginate(_verses(5), lambda text: len(text) <= 30)
+    assert [[verse for _, _, verse, _ in page] for page in pages] == [[1, 2], [3, 4], [5]]
+
+
+def test_paginate_gives_a_long_verse_its_own_page():
+    verses = [(JOHN, 3, 1, "x" * 50)] + _verses(3)[1:]
+    pages = paginate(verses, lambda text: len(text) <= 30)
+    assert [len(page) for page in pages] == [1, 2]
+
+
+def test_paginate_measures_the_page_text():
+    def page_text(page):
+        return f"{verse_text(page)}\n{format_verses(page)}"
+
+    measured = []
+    pages = paginate(_verses(5), lambda text: measured.append(text) or len(text) <= 40, page_text)
+    assert all("\nJohn 3:" in text for text in measured)
+    assert all(len(page_text(page)) <= 40 for page in pages)
+
+
+def test_paginate_passages_fits_the_reference_line(verse_store):
+    # Two verses fit in 120 characters, but not with the reference below them
+    texts = Deck().paginate_passages(verse_store, "John 3:14-18", "TEST",
+                                     fits=lambda text: len(text) <= 120)
+    assert len(texts) == 5
+    assert texts[0].endswith("\nJohn 3:14")
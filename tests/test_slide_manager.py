@@ -0,0 +1,104 @@
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from deck import Deck
+
+
+def _deck(count):
+    deck = Deck()
+    slides = [deck.add_slide() for _ in range(count)]
+    return deck, [slide.slide_id for slide in slides]
+
+
+def _reopened_ids(deck, tmp_path):
+    path = str(tmp_path / "deck.pptx")
+    deck.save(path)
+    return [slide.slide_id for slide in Presentation(path).slides]
+
+
+def test_move(tmp_path):
+    deck, (a, b, c) = _deck(3)
+    deck.slides.move(c, 0)
+    assert deck.slides.slide_ids() == [c, a, b]
+    deck.slides.move(c, 99)  # clamped to the end
+    assert deck.slides.slide_ids() == [a, b, c]
+    assert deck.document.slide_ids() == [a, b, c]
+    assert _reopened_ids(deck, tmp_path) == [a, b, c]
+
+
+def test_delete_keeps_part_names_unique(tmp_path):
+    deck, (a, b, c) = _deck(3)
+    deck.slides.delete(a)
+    d = deck.add_slide().slide_id
+    assert deck.slides.slide_ids() == [b, c, d]
+    assert deck.document.slide_ids() == [b, c, d]
+    partnames = [deck.slides.slide(slide_id).part.partname for slide_id in (b, c, d)]
+    assert len(set(partnames)) == 3
+    assert _reopened_ids(deck, tmp_path) == [b, c, d]
+
+
+def test_detach_and_attach_restore_the_same_slide():
+    deck, (a, b, c) = _deck(3)
+    deck.add_text(deck.slides.slide(b), "kept")
+    detached = deck.slides.detach(b)
+    assert deck.slides.slide_ids() == [a, c]
+    deck.slides.attach(detached)
+    assert deck.slides.slide_ids() == [a, b, c]
+    assert deck.document.get(b).text == "kept"
+
+
+def test_duplicate_shares_pictures_and_remaps_relationships(picture, tmp_path):
+    deck, (a, b) = _deck(2)
+    source = deck.slides.slide(a)
+    deck.set_background(source, picture())
+    deck.add_text(source, "copied")
+
+    duplicate = deck.slides.duplicate(a)
+    assert deck.slides.slide_ids() == [a, duplicate.slide_id, b]
+    assert deck.document.get(duplicate.slide_id).text == "copied"
+
+    def image_parts(slide):
+        return {rId: rel.target_part for rId, rel in slide.part.rels.items()
+                if rel.reltype == RT.IMAGE}
+
+    (source_image,) = image_parts(source).values()
+    (rId, image), = image_parts(duplicate).items()
+    assert image is source_image  # not embedded a second time
+    # Every relationship the copied XML refers to exists on the duplicate
+    embeds = duplicate._element.xpath(".//@r:embed")
+    assert embeds == [rId]
+    assert duplicate.part.rels[rId].target_part is image
+
+    assert _reopened_ids(deck, tmp_path) == [a, duplicate.slide_id, b]
+    copy = Presentation(str(tmp_path / "deck.pptx")).slides[1]
+    assert copy.shapes[0].image.blob == source_image.blob
+
+
+def test_delete_leaves_the_other_slide_parts_alone(tmp_path):
+    deck = Deck()
+    for number in range(3):
+        slide = deck.add_slide()
+        deck.add_text(slide, f"Slide {number}")
+        slide.notes_slide.notes_text_frame.text = f"Notes {number}"
+    path = str(tmp_path / "deck.pptx")
+    deck.save(path)
+    a, b, c = deck.slides.slide_ids()
+    partnames = [deck.slides.slide(slide_id).part.partname for slide_id in (b, c)]
+
+    deck.slides.delete(a)
+    assert [deck.slides.slide(slide_id).part.partname for slide_id in (b, c)] == partnames
+    deck.save(path)
+    slides = Presentation(path).slides
+    assert [slide.shapes[0].text_frame.text for slide in slides] == ["Slide 1", "Slide 2"]
+    assert [slide.notes_slide.notes_text_frame.text for slide in slides] == ["Notes 1", "Notes 2"]
+
+
+def test_new_slides_never_take_the_part_name_of_a_detached_slide(tmp_path):
+    deck, (a, b, c) = _deck(3)
+    deleted = deck.slides.detach(a)
+    d = deck.slides.duplicate(c).slide_id
+    deck.slides.attach(deleted)  # as undoing the delete does
+    assert deck.slides.slide_ids() == [a, b, c, d]
+    partnames = [deck.slides.slide(slide_id).part.partname for slide_id in (a, b, c, d)]
+    assert len(set(partnames)) == 4
+    assert _reopened_ids(deck, tmp_path) == [a, b, c, d]
@@ -0,0 +1,19 @@
+from text_layout import TextLayout, TextStyle, break_positions, layout_text
+
+
+def test_break_positions_are_the_spaces_the_layout_breaks_at():
+    style = TextStyle("Arial", 60)
+    text = " ".join(["For God so loved the world"] * 8) + "\nJohn 3:16"
+    layout = layout_text(text, style)
+    positions = break_positions(text, layout)
+
+    assert len(positions) == len(layout.lines) - 2  # one per paragraph starts afresh
+    assert all(text[position] == " " for position in positions)
+    broken = "".join("\n" if index in positions else char for index, char in enumerate(text))
+    assert broken == layout.text()
+
+
+def test_break_positions_skip_lines_ending_inside_a_word():
+    text = "a bcdefgh ij"
+    layout = TextLayout(10, [["a bcd", "efgh", "ij"]], True)
+    assert break_positions(text, layout) == [9]
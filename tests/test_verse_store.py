@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from verse_store import VerseStore, book_name, book_number
+
+JOHN, ROMANS = 43, 45
+
+
+def test_book_numbers():
+    assert book_number("John") == JOHN
+    assert book_number(" 1  corinthians ") == 46
+    assert book_number(JOHN) == JOHN
+    assert book_name(JOHN) == "John"
+    with pytest.raises(ValueError):
+        book_number("Hezekiah")
+
+
+def test_verse_and_passage(verse_store):
+    assert verse_store.translations() == ["TEST"]
+    assert verse_store.verse("TEST", "Romans", 8, 28) == "Romans eight 28"
+    assert verse_store.verse("TEST", "Romans", 8, 40) is None
+    assert verse_store.passage("TEST", "Romans", 8, 29, 30) == [
+        (29, "Romans eight 29"), (30, "Romans eight 30")]
+    assert [verse for verse, _ in verse_store.passage("TEST", ROMANS, 8, 30)] == [30, 31]
+
+
+def test_passages_resolves_every_range_at_once(verse_store):
+    results = verse_store.passages("TEST", [
+        ("Romans", 8, 30, 8, None),  # to the end of the chapter
+        (JOHN, 3, 16, 3, 16),
+        (JOHN, 4, 1, 4, 2),  # not in the store
+        (ROMANS, 8, 28, 8, 29),
+    ])
+    assert [[(book, chapter, verse) for book, chapter, verse, _ in verses]
+            for verses in results] == [
+        [(ROMANS, 8, 30), (ROMANS, 8, 31)],
+        [(JOHN, 3, 16)],
+        [],
+        [(ROMANS, 8, 28), (ROMANS, 8, 29)],
+    ]
+    assert verse_store.passages("TEST", []) == []
+
+
+def test_passages_span_chapters(tmp_path):
+    store = VerseStore(str(tmp_path / "verses.db"))
+    store.import_verses("TEST", [("John", chapter, verse, f"{chapter}:{verse}")
+                                 for chapter in (3, 4, 5) for verse in (1, 2, 3)])
+    (verses,) = store.passages("TEST", [(JOHN, 3, 3, 5, 1)])
+    assert [text for _, _, _, text in verses] == ["3:3", "4:1", "4:2", "4:3", "5:1"]
+    store.close()
+
+
+def test_search(verse_store):
+    assert [verse for _, _, verse, _ in verse_store.search("TEST", "romans eight")] == \
+        [28, 29, 30, 31]
+    assert [verse for _, _, verse, _ in verse_store.search("TEST", 'eight 30"')] == [30]
+    assert verse_store.search("TEST", "  ") == []
+    assert verse_store.search("OTHER", "romans") == []
+
+
+def test_import_replaces_a_translation(verse_store):
+    assert verse_store.import_verses("TEST", [("Jude", 1, 3, "Beloved")]) == 1
+    assert verse_store.verse("TEST", "Romans", 8, 28) is None
+    assert [text for *_, text in verse_store.search("TEST", "beloved")] == ["Beloved"]
+
+
+def test_import_file(tmp_path, verse_store):
+    json_path = tmp_path / "kjv.json"
+    json_path.write_text(json.dumps({"John": {"1": {"1": "In the beginning", "2": "The same"}}}),
+                         encoding="utf-8")
+    tsv_path = tmp_path / "web.tsv"
+    tsv_path.write_text("book\tchapter\tverse\ttext\nJohn\t1\t1\tIn the beginning\n",
+                        encoding="utf-8")
+
+    assert verse_store.import_file(str(json_path)) == 2
+    assert verse_store.import_file(str(tsv_path), "WEB") == 1
+    assert verse_store.translations() == ["KJV", "TEST", "WEB"]
+    assert verse_store.verse("KJV", "John", 1, 2) == "The same"
+
+
+def test_import_file_skips_malformed_rows(tmp_path, verse_store):
+    csv_path = tmp_path / "asv.csv"
+    csv_path.write_text("book,chapter,verse,text\n"
+                        "John,1,1,In the beginning\n"
+                        "stray note\n"
+                        "\n"
+                        "John,1\n"
+                        "John,1,2,The same\n", encoding="utf-8")
+
+    assert verse_store.import_file(str(csv_path)) == 2
+    assert verse_store.passage("ASV", "John", 1, 1, 2) == [(1, "In the beginning"), (2, "The same")]